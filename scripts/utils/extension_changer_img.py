@@ -24,7 +24,13 @@ Example:
 
 from PIL import Image
 import os
-from typing import Optional, Dict
+import shutil
+from typing import Optional, Dict, Literal
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
 
 
 # Supported format mappings
@@ -37,6 +43,9 @@ SUPPORTED_FORMATS = {
     "GIF": [".gif"]
 }
 
+# Formats written by the libvips backend (others fall back to Pillow)
+VIPS_FORMATS = {"JPEG", "PNG", "WEBP", "TIFF"}
+
 # Common API format requirements
 API_PREFERRED_FORMATS = {
     "runware": ["JPEG", "PNG", "WEBP"],
@@ -52,7 +61,8 @@ def convert_image_format(
     output_path: Optional[str] = None,
     quality: int = 95,
     optimize: bool = True,
-    preserve_transparency: bool = True
+    preserve_transparency: bool = True,
+    backend: Literal["pillow", "vips"] = "pillow"
 ) -> str:
     """
     Convert an image to a different format with professional quality settings.
@@ -71,6 +81,10 @@ def convert_image_format(
         optimize: Enable optimization for smaller file sizes (JPEG, PNG, WEBP)
         preserve_transparency: If True and source has alpha channel, converts
                               to PNG if target format doesn't support transparency
+        backend: "pillow" (default) or "vips". The libvips backend streams the
+                image instead of decoding it fully into memory, which is much
+                lighter on large images. Requires pyvips; falls back to Pillow
+                if it isn't installed or the format isn't supported by it.
     
     Returns:
         str: Path to the converted image file
@@ -105,6 +119,15 @@ def convert_image_format(
     if not 1 <= quality <= 100:
         raise ValueError(f"Quality must be between 1-100, got: {quality}")
     
+    if backend == "vips":
+        if pyvips is None:
+            print("⚠️  pyvips not installed. Falling back to Pillow backend.")
+        elif target_format in VIPS_FORMATS:
+            return _convert_with_vips(
+                image_path, target_format, output_path,
+                quality, optimize, preserve_transparency
+            )
+    
     try:
         # Open image
         img = Image.open(image_path)
@@ -119,20 +142,13 @@ def convert_image_format(
         
         # Convert RGBA to RGB for formats that don't support alpha
         if target_format in ["JPEG", "BMP"] and img.mode in ("RGBA", "LA", "P"):
-            # Create white background
-            rgb_img = Image.new("RGB", img.size, (255, 255, 255))
-            if img.mode == "P":
-                img = img.convert("RGBA")
-            rgb_img.paste(img, mask=img.split()[3] if img.mode == "RGBA" else None)
-            img = rgb_img
+            # Composite onto a white background in a single pass
+            background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+            img = Image.alpha_composite(background, img.convert("RGBA")).convert("RGB")
         
         # Determine output path
         if output_path is None:
-            directory = os.path.dirname(image_path)
-            filename = os.path.basename(image_path)
-            name, _ = os.path.splitext(filename)
-            ext = SUPPORTED_FORMATS[target_format][0]
-            output_path = os.path.join(directory, f"{name}{ext}")
+            output_path = _default_output_path(image_path, target_format)
         
         # Prepare save parameters
         save_kwargs = {"format": target_format}
@@ -159,6 +175,96 @@ def convert_image_format(
         raise IOError(f"Failed to convert image: {str(e)}")
 
 
+def _default_output_path(image_path: str, target_format: str) -> str:
+    """Build '<original_name>.<new_ext>' next to the source image."""
+    directory = os.path.dirname(image_path)
+    filename = os.path.basename(image_path)
+    name, _ = os.path.splitext(filename)
+    ext = SUPPORTED_FORMATS[target_format][0]
+    return os.path.join(directory, f"{name}{ext}")
+
+
+def _convert_with_vips(
+    image_path: str,
+    target_format: str,
+    output_path: Optional[str],
+    quality: int,
+    optimize: bool,
+    preserve_transparency: bool
+) -> str:
+    """
+    Convert an image with libvips using sequential (streaming) access.
+    
+    Mirrors convert_image_format() behaviour: transparency is preserved by
+    switching to PNG when requested, otherwise flattened onto white.
+    """
+    try:
+        img = pyvips.Image.new_from_file(image_path, access="sequential")
+        original_format = os.path.splitext(image_path)[1].lstrip(".").upper()
+        
+        if img.hasalpha():
+            if preserve_transparency and target_format not in ["PNG", "WEBP", "GIF"]:
+                print(f"⚠️  Target format {target_format} doesn't support transparency. Converting to PNG instead.")
+                target_format = "PNG"
+            elif target_format in ["JPEG", "BMP"]:
+                img = img.flatten(background=[255, 255, 255])
+        
+        if output_path is None:
+            output_path = _default_output_path(image_path, target_format)
+        
+        # Prepare save parameters
+        save_kwargs = {"strip": True}
+        
+        if target_format == "JPEG":
+            save_kwargs["Q"] = quality
+            save_kwargs["optimize_coding"] = optimize
+        elif target_format == "PNG":
+            save_kwargs["compression"] = 9 if optimize else 6
+        elif target_format == "WEBP":
+            save_kwargs["Q"] = quality
+            save_kwargs["effort"] = 6 if optimize else 4
+        
+        # Pick the saver from target_format rather than the output suffix, so
+        # format-specific options never reach a different saver
+        savers = {
+            "JPEG": img.jpegsave,
+            "PNG": img.pngsave,
+            "WEBP": img.webpsave,
+            "TIFF": img.tiffsave,
+        }
+        savers[target_format](output_path, **save_kwargs)
+        
+        print(f"✅ Converted {original_format} → {target_format}: {output_path}")
+        return output_path
+        
+    except Exception as e:
+        raise IOError(f"Failed to convert image: {str(e)}")
+
+
+def _fast_copy(src_path: str, dst_path: str) -> None:
+    """
+    Copy a file without going through user-space buffers when possible.
+    
+    Uses os.copy_file_range on Linux (reflink on CoW filesystems), and
+    shutil.copyfile elsewhere (which itself uses sendfile/fcopyfile).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    
+    shutil.copyfile(src_path, dst_path)
+
+
 def get_image_format(image_path: str) -> str:
     """
     Get the format of an image file.
@@ -219,7 +325,8 @@ def convert_for_api(
     
     This is a convenience function that uses predefined format requirements
     for common APIs. If the image is already in a supported format, it returns
-    the original path without conversion.
+    the original path without conversion, or copies it to output_path when one
+    is given (using a kernel-side copy where the OS supports it).
     
     Args:
         image_path: Path to the source image file
@@ -253,6 +360,9 @@ def convert_for_api(
     # Check if already in supported format
     if is_format_supported(image_path, supported_formats):
         print(f"✅ Image format already supported by {api_name} API")
+        if output_path and os.path.abspath(output_path) != os.path.abspath(image_path):
+            _fast_copy(image_path, output_path)
+            return output_path
         return image_path
     
     # Determine target format
@@ -272,7 +382,8 @@ def batch_convert(
     image_paths: list,
     target_format: str,
     output_dir: Optional[str] = None,
-    quality: int = 95
+    quality: int = 95,
+    backend: Literal["pillow", "vips"] = "pillow"
 ) -> Dict[str, str]:
     """
     Convert multiple images to the same format.
@@ -283,24 +394,35 @@ def batch_convert(
         output_dir: Optional directory for converted images. If None, saves
                    in same directory as source
         quality: Compression quality (1-100)
+        backend: "pillow" or "vips" (see convert_image_format)
     
     Returns:
         Dict[str, str]: Mapping of original paths to converted paths
     
+    Raises:
+        ValueError: If target format is not supported
+    
     Example:
         >>> images = ["photo1.png", "photo2.bmp", "photo3.tiff"]
         >>> converted = batch_convert(images, "JPEG", output_dir="converted/")
         >>> print(f"Converted {len(converted)} images")
     """
+    # Resolve loop invariants once
+    target_format = target_format.upper()
+    if target_format not in SUPPORTED_FORMATS:
+        supported = ", ".join(SUPPORTED_FORMATS.keys())
+        raise ValueError(f"Unsupported format: {target_format}. Supported: {supported}")
+    
+    target_ext = SUPPORTED_FORMATS[target_format][0]
+    output_dir = os.path.abspath(output_dir) if output_dir else None
+    
     results = {}
     
     for image_path in image_paths:
         try:
             if output_dir:
-                filename = os.path.basename(image_path)
-                name, _ = os.path.splitext(filename)
-                ext = SUPPORTED_FORMATS[target_format.upper()][0]
-                output_path = os.path.join(output_dir, f"{name}{ext}")
+                name, _ = os.path.splitext(os.path.basename(image_path))
+                output_path = os.path.join(output_dir, f"{name}{target_ext}")
             else:
                 output_path = None
             
@@ -308,7 +430,8 @@ def batch_convert(
                 image_path,
                 target_format,
                 output_path=output_path,
-                quality=quality
+                quality=quality,
+                backend=backend
             )
             results[image_path] = converted_path
             
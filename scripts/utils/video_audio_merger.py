@@ -19,9 +19,483 @@ Example:
     )
 """
 
+import asyncio
 import subprocess
 import os
-from typing import Optional, Dict, List
+import json
+import re
+import functools
+import shutil
+import tempfile
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from itertools import accumulate
+from typing import Collection, Optional, Dict, List, Literal, Tuple
+
+
+# Merge strategies accepted by merge_video_audio
+MERGE_MODES = ("remux", "reencode_audio", "full")
+
+# Containers that support front-loading the moov atom
+FASTSTART_CONTAINERS = {".mp4", ".m4v", ".mov"}
+
+# Containers that can carry an AAC stream without re-encoding
+AAC_CONTAINERS = {".mp4", ".m4a", ".m4v", ".mov", ".mkv"}
+
+# Filter graph fragments for crossfade renders. Each fill is a complete
+# ";"-separated chain, so a graph is just ";".join() of the fills.
+NORMALIZE_FILTER_TEMPLATE = (
+    "[{i}:v]setpts=PTS-STARTPTS,{scale},"
+    "pad=1920:1080:(ow-iw)/2:(oh-ih)/2,format=yuv420p[v{i}];"
+    "[{i}:a]asetpts=PTS-STARTPTS[a{i}]"
+)
+CROSSFADE_FILTER_TEMPLATE = (
+    "[{prev_video}][v{i}]xfade=transition=fade:duration={duration}:offset={offset}[vx{i}];"
+    "[{prev_audio}][a{i}]acrossfade=d={duration}[ax{i}]"
+)
+
+# Transition renders with at least this many clips are split into
+# independently encoded pieces (see _concatenate_with_transitions_segmented)
+SEGMENTED_TRANSITION_MIN_VIDEOS = 4
+
+# Audio codecs replace_audio() stream-copies into AAC_CONTAINERS
+REMUXABLE_AUDIO_CODECS = {"aac", "alac"}
+
+# AAC encoders in order of preference (fastest first)
+AAC_ENCODER_PRIORITY = ("libfdk_aac", "aac_at", "aac_mf", "aac")
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_bin() -> str:
+    """Absolute path to FFmpeg, resolved once (falls back to PATH lookup)."""
+    return shutil.which("ffmpeg") or "ffmpeg"
+
+
+@functools.lru_cache(maxsize=1)
+def _ffprobe_bin() -> str:
+    """Absolute path to FFprobe, resolved once (falls back to PATH lookup)."""
+    return shutil.which("ffprobe") or "ffprobe"
+
+
+class HWEncoder(str, Enum):
+    """Video encoders used when a filter graph forces a re-encode."""
+    NVENC = "nvenc"
+    VAAPI = "vaapi"
+    AMF = "amf"
+    NONE = "none"
+
+
+# VAAPI render node used for hardware encoding on Linux
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+# Per-encoder FFmpeg settings:
+#   global: options placed before the inputs
+#   upload: filter appended to the final video label before encoding
+#   encode: codec options (quality roughly matched to libx264 -crf 23)
+HW_ENCODER_SETTINGS = {
+    HWEncoder.NVENC: {
+        "global": [],
+        "upload": None,
+        "encode": ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23"]
+    },
+    HWEncoder.VAAPI: {
+        "global": ["-vaapi_device", VAAPI_DEVICE],
+        "upload": "format=nv12,hwupload",
+        "encode": ["-c:v", "h264_vaapi", "-qp", "23"]
+    },
+    HWEncoder.AMF: {
+        "global": [],
+        "upload": None,
+        "encode": ["-c:v", "h264_amf", "-usage", "transcoding", "-quality", "balanced"]
+    },
+    HWEncoder.NONE: {
+        "global": [],
+        "upload": None,
+        "encode": ["-c:v", "libx264", "-preset", "medium", "-crf", "23"]
+    }
+}
+
+# Hardware encoders in order of preference, with the FFmpeg encoder they need
+HW_ENCODER_PRIORITY = (
+    (HWEncoder.NVENC, "h264_nvenc"),
+    (HWEncoder.VAAPI, "h264_vaapi"),
+    (HWEncoder.AMF, "h264_amf")
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_major_version() -> Optional[int]:
+    """
+    Return the major version of the local FFmpeg, or None if it can't be
+    parsed (e.g. git snapshot builds, which are always recent).
+    """
+    try:
+        result = subprocess.run(
+            [_ffmpeg_bin(), "-version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    
+    match = re.search(r"ffmpeg version n?(\d+)\.", result.stdout)
+    return int(match.group(1)) if match else None
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_list(flag: str) -> frozenset:
+    """
+    Return the names the local FFmpeg lists for a flag, probed once per flag.
+    
+    Args:
+        flag: "-encoders" or "-filters" (name in the second column), or
+              "-hwaccels" (one name per line)
+    
+    Returns:
+        frozenset: Listed names (empty if FFmpeg is missing)
+    """
+    try:
+        result = subprocess.run(
+            [_ffmpeg_bin(), "-hide_banner", flag],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return frozenset()
+    
+    column = 0 if flag == "-hwaccels" else 1
+    available = set()
+    # First line is a header ("Encoders:", "Hardware acceleration methods:", ...)
+    for line in result.stdout.splitlines()[1:]:
+        parts = line.split()
+        if len(parts) > column:
+            available.add(parts[column])
+    return frozenset(available)
+
+
+@functools.lru_cache(maxsize=1)
+def get_best_aac_encoder() -> str:
+    """
+    Pick the fastest AAC encoder available in the local FFmpeg build.
+    
+    Prefers libfdk_aac, then platform hardware encoders (aac_at on macOS,
+    aac_mf on Windows), then FFmpeg's built-in aac. The probe runs once per
+    process.
+    
+    Returns:
+        str: Encoder name to pass to -c:a
+    """
+    available = _ffmpeg_list("-encoders")
+    for encoder in AAC_ENCODER_PRIORITY:
+        if encoder in available:
+            return encoder
+    return "aac"
+
+
+def _hw_encoder_works(hw_encoder: HWEncoder) -> bool:
+    """Encode a single tiny frame to confirm the hardware is really usable."""
+    settings = HW_ENCODER_SETTINGS[hw_encoder]
+    cmd = [
+        _ffmpeg_bin(), "-hide_banner", "-loglevel", "error",
+        *settings["global"],
+        "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+        "-frames:v", "1"
+    ]
+    if settings["upload"]:
+        cmd.extend(["-vf", settings["upload"]])
+    cmd.extend([*settings["encode"], "-f", "null", "-"])
+    
+    try:
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=15,
+            check=True
+        )
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def get_hw_encoder() -> HWEncoder:
+    """
+    Detect the best usable hardware video encoder.
+    
+    Checks NVENC, then VAAPI, then AMF. An encoder is only selected if it is
+    compiled into FFmpeg and a one-frame test encode succeeds (many builds
+    ship the encoders without the matching GPU). The result is cached for the
+    lifetime of the process.
+    
+    Returns:
+        HWEncoder: Detected encoder, or HWEncoder.NONE for libx264
+    """
+    available = _ffmpeg_list("-encoders")
+    for hw_encoder, encoder_name in HW_ENCODER_PRIORITY:
+        if encoder_name in available and _hw_encoder_works(hw_encoder):
+            return hw_encoder
+    return HWEncoder.NONE
+
+
+def _hw_decode_options(hw_encoder: HWEncoder, keep_on_gpu: bool) -> List[str]:
+    """
+    Per-input options that decode on the GPU matching the encoder.
+    
+    With keep_on_gpu the decoded frames stay in video memory for GPU filters;
+    otherwise FFmpeg downloads them for CPU filters automatically.
+    """
+    hwaccels = _ffmpeg_list("-hwaccels")
+    
+    if hw_encoder == HWEncoder.NVENC and "cuda" in hwaccels:
+        options = ["-hwaccel", "cuda"]
+        if keep_on_gpu:
+            options.extend(["-hwaccel_output_format", "cuda"])
+        return options
+    
+    if hw_encoder == HWEncoder.VAAPI and "vaapi" in hwaccels:
+        options = ["-hwaccel", "vaapi", "-hwaccel_device", VAAPI_DEVICE]
+        if keep_on_gpu:
+            options.extend(["-hwaccel_output_format", "vaapi"])
+        return options
+    
+    return []
+
+
+def _gpu_scale(hw_encoder: HWEncoder, width: int, height: int) -> Optional[str]:
+    """
+    Build a GPU scaling chain for the transitions filter graph.
+    
+    The chain scales on the GPU and downloads the result as nv12, because
+    xfade only runs on the CPU. Returns None when no GPU scaler is available
+    for the encoder, or when FFmpeg lacks the matching hwaccel: the scalers
+    need frames already in video memory, which only GPU decoding provides
+    (see _hw_decode_options).
+    """
+    available = _ffmpeg_list("-filters")
+    hwaccels = _ffmpeg_list("-hwaccels")
+    
+    if hw_encoder == HWEncoder.NVENC and "cuda" in hwaccels:
+        for scaler in ("scale_npp", "scale_cuda"):
+            if scaler in available:
+                return (
+                    f"{scaler}={width}:{height}:force_original_aspect_ratio=decrease,"
+                    f"hwdownload,format=nv12"
+                )
+    
+    if hw_encoder == HWEncoder.VAAPI and "vaapi" in hwaccels and "scale_vaapi" in available:
+        # hwupload passes frames through unchanged if they were decoded on the GPU
+        return (
+            f"format=nv12|vaapi,hwupload,"
+            f"scale_vaapi=w={width}:h={height}:force_original_aspect_ratio=decrease,"
+            f"hwdownload,format=nv12"
+        )
+    
+    return None
+
+
+def _resolve_hw_encoder(hw_encoder: Optional[HWEncoder]) -> HWEncoder:
+    """Auto-detect when hw_encoder is None; accept plain strings too."""
+    if hw_encoder is None:
+        return get_hw_encoder()
+    return HWEncoder(hw_encoder)
+
+
+def get_audio_codec(media_path: str) -> Optional[str]:
+    """
+    Get the codec name of the first audio stream using FFprobe.
+    
+    Args:
+        media_path: Path to audio or video file
+        
+    Returns:
+        Codec name (e.g., "aac", "mp3") or None if unavailable
+    """
+    try:
+        # Single-field CSV query: no JSON dump of every stream property
+        cmd = [
+            _ffprobe_bin(),
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name",
+            "-of", "csv=p=0",
+            media_path
+        ]
+        
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip() or None
+        
+    except Exception:
+        return None
+
+
+def _resolve_audio_codec(
+    audio_path: str,
+    output_path: str,
+    audio_codec: str,
+    copy_codecs: Collection[str] = ("aac",)
+) -> str:
+    """
+    Return "copy" instead of "aac" when the input audio is already AAC
+    (or another of copy_codecs), probing the input at most once.
+    """
+    # Skip the lossy AAC round-trip when the audio can be copied as-is
+    if audio_codec == "aac":
+        output_ext = os.path.splitext(output_path)[1].lower()
+        if output_ext in AAC_CONTAINERS and get_audio_codec(audio_path) in copy_codecs:
+            return "copy"
+    return audio_codec
+
+
+def _run_ffmpeg(cmd: List[str], verbose: bool = False) -> subprocess.CompletedProcess:
+    """
+    Run an FFmpeg command without buffering its log in Python.
+    
+    Quiet runs use -loglevel error, so stderr only holds the failure message
+    (read from CalledProcessError.stderr). Verbose runs stream FFmpeg's log
+    straight to the terminal.
+    """
+    return subprocess.run(
+        [cmd[0], "-loglevel", "info" if verbose else "error", *cmd[1:]],
+        stdout=subprocess.DEVNULL,
+        stderr=None if verbose else subprocess.PIPE,
+        check=True
+    )
+
+
+def _threads_args(threads: Optional[int]) -> List[str]:
+    """FFmpeg -threads option, or nothing to let FFmpeg decide."""
+    return ["-threads", str(threads)] if threads else []
+
+
+def _movflags_args(output_path: str) -> List[str]:
+    """
+    FFmpeg -movflags option that puts the moov atom at the front of MP4/MOV
+    outputs so players can start before the whole file is downloaded.
+    """
+    if os.path.splitext(output_path)[1].lower() in FASTSTART_CONTAINERS:
+        return ["-movflags", "+faststart"]
+    return []
+
+
+def _ffmpeg_error(error: subprocess.CalledProcessError) -> str:
+    """Decode the stderr captured by _run_ffmpeg for an error message."""
+    if not error.stderr:
+        return f"exit code {error.returncode} (see FFmpeg output above)"
+    return error.stderr.decode("utf-8", errors="replace").strip()
+
+
+def _build_merge_command(
+    video_path: str,
+    audio_path: str,
+    output_path: str,
+    video_codec: str,
+    audio_codec: str,
+    audio_bitrate: str,
+    overwrite: bool,
+    merge_mode: str,
+    audio_encoder: Optional[str],
+    hw_encoder: Optional[HWEncoder],
+    threads: Optional[int],
+    copy_audio_codecs: Collection[str] = ("aac",)
+) -> List[str]:
+    """
+    Validate merge_video_audio() arguments and build its FFmpeg command.
+    
+    With audio_codec "aac", input audio in copy_audio_codecs is stream-copied.
+    
+    Raises:
+        FileNotFoundError: If video or audio file doesn't exist
+        ValueError: If merge_mode is not recognized
+    """
+    # Validation
+    if not os.path.exists(video_path):
+        raise FileNotFoundError(f"Video not found: {video_path}")
+    
+    if not os.path.exists(audio_path):
+        raise FileNotFoundError(f"Audio not found: {audio_path}")
+    
+    if merge_mode not in MERGE_MODES:
+        raise ValueError(f"Unknown merge_mode: {merge_mode}. Available: {', '.join(MERGE_MODES)}")
+    
+    remux = merge_mode == "remux"
+    
+    if remux:
+        video_codec = "copy"
+        audio_codec = "copy"
+    
+    # Hardware/software encoder settings for a full re-encode
+    encoder_settings = None
+    if merge_mode == "full" and video_codec == "copy":
+        encoder_settings = HW_ENCODER_SETTINGS[_resolve_hw_encoder(hw_encoder)]
+    
+    audio_codec = _resolve_audio_codec(audio_path, output_path, audio_codec, copy_audio_codecs)
+    
+    # Build FFmpeg command
+    cmd = [_ffmpeg_bin()]
+    
+    # Regenerate missing timestamps so packets can be muxed as-is
+    if remux:
+        cmd.extend(["-fflags", "+genpts"])
+    
+    if encoder_settings:
+        cmd.extend(encoder_settings["global"])
+    
+    # Input files
+    cmd.extend(["-i", video_path])  # Video input
+    cmd.extend(["-i", audio_path])  # Audio input
+    
+    # Video codec
+    if encoder_settings:
+        if encoder_settings["upload"]:
+            cmd.extend(["-vf", encoder_settings["upload"]])
+        cmd.extend(encoder_settings["encode"])
+    else:
+        cmd.extend(["-c:v", video_codec])
+    
+    cmd.extend(_threads_args(threads))
+    
+    # Audio codec and bitrate
+    if audio_codec == "aac":
+        audio_codec = audio_encoder or get_best_aac_encoder()
+    cmd.extend(["-c:a", audio_codec])
+    # The native AAC encoder was experimental before FFmpeg 4.0
+    if audio_codec == "aac" and (_ffmpeg_major_version() or 4) < 4:
+        cmd.extend(["-strict", "-2"])
+    if audio_codec != "copy":
+        cmd.extend(["-b:a", audio_bitrate])
+    
+    # Map streams (video from first input, audio from second)
+    cmd.extend(["-map", "0:v:0"])  # Video from input 0
+    cmd.extend(["-map", "1:a:0"])  # Audio from input 1
+    
+    # End when shortest stream ends (in case of duration mismatch)
+    cmd.extend(["-shortest"])
+    
+    if remux:
+        cmd.extend(["-avoid_negative_ts", "make_zero"])
+    
+    cmd.extend(_movflags_args(output_path))
+    
+    # Overwrite output
+    if overwrite:
+        cmd.append("-y")
+    
+    # Output file
+    cmd.append(output_path)
+    
+    return cmd
 
 
 def merge_video_audio(
@@ -32,14 +506,19 @@ def merge_video_audio(
     audio_codec: str = "aac",
     audio_bitrate: str = "192k",
     overwrite: bool = True,
-    verbose: bool = False
+    verbose: bool = False,
+    merge_mode: Literal["remux", "reencode_audio", "full"] = "reencode_audio",
+    audio_encoder: Optional[str] = None,
+    hw_encoder: Optional[HWEncoder] = None,
+    threads: Optional[int] = None
 ) -> bool:
     """
     Merge video and audio files using FFmpeg.
     
     This function combines a video file with an audio file, creating a new
     video with the audio track. The video is not re-encoded by default (copy),
-    which makes the process fast and lossless.
+    which makes the process fast and lossless. When AAC output is requested
+    and the input audio is already AAC, the audio stream is copied as well.
     
     Args:
         video_path: Path to input video file
@@ -50,17 +529,32 @@ def merge_video_audio(
         audio_bitrate: Audio bitrate (e.g., "192k", "256k")
         overwrite: Overwrite output file if exists
         verbose: Print FFmpeg output
+        merge_mode: "reencode_audio" (default) uses the codecs above,
+                   "remux" copies both streams without decoding,
+                   "full" also re-encodes video (hardware encoder or libx264
+                   if video_codec is "copy")
+        audio_encoder: Encoder used when audio_codec is "aac" (default: fastest
+                      available, see get_best_aac_encoder())
+        hw_encoder: Video encoder for "full" mode when video_codec is "copy"
+                   (default: auto-detect, see get_hw_encoder())
+        threads: FFmpeg thread count (default: FFmpeg decides). Use
+                os.cpu_count() for a single job, or os.cpu_count() // K when
+                running K jobs concurrently
         
     Returns:
         bool: True if successful, False otherwise
         
     Raises:
         FileNotFoundError: If video or audio file doesn't exist
+        ValueError: If merge_mode is not recognized
         
     Example:
         >>> # Basic merge (fast, no re-encoding)
         >>> merge_video_audio("video.mp4", "audio.mp3", "output.mp4")
         
+        >>> # Pure container join (no decode at all)
+        >>> merge_video_audio("video.mp4", "audio.m4a", "output.mp4", merge_mode="remux")
+        
         >>> # With custom audio quality
         >>> merge_video_audio(
         ...     "video.mp4",
@@ -77,60 +571,23 @@ def merge_video_audio(
         ...     video_codec="libx264"
         ... )
     """
-    # Validation
-    if not os.path.exists(video_path):
-        raise FileNotFoundError(f"Video not found: {video_path}")
-    
-    if not os.path.exists(audio_path):
-        raise FileNotFoundError(f"Audio not found: {audio_path}")
-    
+    cmd = _build_merge_command(
+        video_path, audio_path, output_path, video_codec, audio_codec,
+        audio_bitrate, overwrite, merge_mode, audio_encoder, hw_encoder, threads
+    )
+    return _run_merge(cmd, verbose)
+
+
+def _run_merge(cmd: List[str], verbose: bool) -> bool:
+    """Run a command from _build_merge_command(), reporting failures as False."""
     try:
-        # Build FFmpeg command
-        cmd = ["ffmpeg"]
-        
-        # Input files
-        cmd.extend(["-i", video_path])  # Video input
-        cmd.extend(["-i", audio_path])  # Audio input
-        
-        # Video codec
-        cmd.extend(["-c:v", video_codec])
-        
-        # Audio codec and bitrate
-        cmd.extend(["-c:a", audio_codec])
-        if audio_codec == "aac":
-            cmd.extend(["-strict", "-2"])  # For older FFmpeg versions
-        if audio_codec != "copy":
-            cmd.extend(["-b:a", audio_bitrate])
-        
-        # Map streams (video from first input, audio from second)
-        cmd.extend(["-map", "0:v:0"])  # Video from input 0
-        cmd.extend(["-map", "1:a:0"])  # Audio from input 1
-        
-        # End when shortest stream ends (in case of duration mismatch)
-        cmd.extend(["-shortest"])
-        
-        # Overwrite output
-        if overwrite:
-            cmd.append("-y")
-        
-        # Output file
-        cmd.append(output_path)
-        
         # Run FFmpeg
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        if verbose:
-            print(f"FFmpeg output: {result.stdout}")
+        _run_ffmpeg(cmd, verbose)
         
         return True
         
     except subprocess.CalledProcessError as e:
-        print(f"FFmpeg error: {e.stderr}")
+        print(f"FFmpeg error: {_ffmpeg_error(e)}")
         return False
         
     except FileNotFoundError:
@@ -164,15 +621,19 @@ def replace_audio(
         
     Returns:
         bool: True if successful, False otherwise
+    
+    Note:
+        AAC and ALAC audio is copied as-is when the output container can
+        carry it, so the replacement is a pure remux with no audio re-encode.
     """
-    return merge_video_audio(
-        video_path,
-        audio_path,
-        output_path,
-        video_codec="copy",
-        audio_codec="aac",
-        overwrite=overwrite
+    # Same defaults as merge_video_audio(), but ALAC is copied as well; the
+    # copy decision probes the audio once, inside the command builder
+    cmd = _build_merge_command(
+        video_path, audio_path, output_path, "copy", "aac", "192k", overwrite,
+        "reencode_audio", None, None, None,
+        copy_audio_codecs=REMUXABLE_AUDIO_CODECS
     )
+    return _run_merge(cmd, False)
 
 
 def add_background_music(
@@ -180,7 +641,8 @@ def add_background_music(
     music_path: str,
     output_path: str,
     music_volume: float = 0.3,
-    overwrite: bool = True
+    overwrite: bool = True,
+    threads: Optional[int] = None
 ) -> bool:
     """
     Add background music to a video while preserving original audio.
@@ -193,6 +655,9 @@ def add_background_music(
         output_path: Path for output video file
         music_volume: Volume of background music (0.0 to 1.0)
         overwrite: Overwrite output file if exists
+        threads: FFmpeg thread count (default: FFmpeg decides). Use
+                os.cpu_count() for a single job, or os.cpu_count() // K when
+                running K jobs concurrently
         
     Returns:
         bool: True if successful, False otherwise
@@ -210,7 +675,7 @@ def add_background_music(
     try:
         # FFmpeg command to mix audio
         cmd = [
-            "ffmpeg",
+            _ffmpeg_bin(),
             "-i", video_path,
             "-i", music_path,
             "-filter_complex",
@@ -218,6 +683,7 @@ def add_background_music(
             "-map", "0:v",
             "-map", "[aout]",
             "-c:v", "copy",
+            *_threads_args(threads),
             "-c:a", "aac",
             "-shortest"
         ]
@@ -227,11 +693,11 @@ def add_background_music(
         
         cmd.append(output_path)
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        _run_ffmpeg(cmd)
         return True
         
     except subprocess.CalledProcessError as e:
-        print(f"FFmpeg error: {e.stderr}")
+        print(f"FFmpeg error: {_ffmpeg_error(e)}")
         return False
     except Exception as e:
         print(f"Failed to add background music: {str(e)}")
@@ -253,7 +719,7 @@ def get_video_info(video_path: str) -> Optional[Dict]:
     
     try:
         cmd = [
-            "ffprobe",
+            _ffprobe_bin(),
             "-v", "quiet",
             "-print_format", "json",
             "-show_format",
@@ -261,9 +727,14 @@ def get_video_info(video_path: str) -> Optional[Dict]:
             video_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
         
-        import json
         return json.loads(result.stdout)
         
     except Exception as e:
@@ -271,11 +742,57 @@ def get_video_info(video_path: str) -> Optional[Dict]:
         return None
 
 
+def get_video_duration(video_path: str) -> Optional[float]:
+    """
+    Get video duration in seconds using a single-field FFprobe query.
+    
+    Much lighter than get_video_info() when only the duration is needed:
+    FFprobe prints one CSV value instead of the full JSON metadata.
+    
+    Args:
+        video_path: Path to video file
+        
+    Returns:
+        float: Duration in seconds, or None if it can't be read
+    """
+    if not os.path.exists(video_path):
+        raise FileNotFoundError(f"Video not found: {video_path}")
+    
+    try:
+        result = subprocess.run(
+            [
+                _ffprobe_bin(),
+                "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "csv=p=0",
+                video_path
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
+        return float(result.stdout.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return None
+
+
+def _probe_duration(video_path: str, default: float = 10.0, verbose: bool = False) -> float:
+    """Get a video's duration, falling back to `default` if it can't be read."""
+    duration = get_video_duration(video_path)
+    if duration is None:
+        if verbose:
+            print(f"⚠️  Could not get duration for {os.path.basename(video_path)}, assuming {default:g}s")
+        return default
+    return duration
+
+
 def extract_audio(
     video_path: str,
     output_path: str,
     audio_format: str = "mp3",
-    audio_bitrate: str = "192k"
+    audio_bitrate: str = "192k",
+    threads: Optional[int] = None
 ) -> bool:
     """
     Extract audio from a video file.
@@ -285,6 +802,9 @@ def extract_audio(
         output_path: Path for output audio file
         audio_format: Audio format (mp3, wav, aac, etc.)
         audio_bitrate: Audio bitrate (e.g., "192k", "256k")
+        threads: FFmpeg thread count (default: FFmpeg decides). Use
+                os.cpu_count() for a single job, or os.cpu_count() // K when
+                running K jobs concurrently
         
     Returns:
         bool: True if successful, False otherwise
@@ -294,37 +814,52 @@ def extract_audio(
     
     try:
         cmd = [
-            "ffmpeg",
+            _ffmpeg_bin(),
             "-i", video_path,
             "-vn",  # No video
             "-acodec", audio_format if audio_format != "mp3" else "libmp3lame",
+            *_threads_args(threads),
             "-b:a", audio_bitrate,
             "-y",
             output_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        _run_ffmpeg(cmd)
         return True
         
     except subprocess.CalledProcessError as e:
-        print(f"FFmpeg error: {e.stderr}")
+        print(f"FFmpeg error: {_ffmpeg_error(e)}")
         return False
     except Exception as e:
         print(f"Failed to extract audio: {str(e)}")
         return False
 
 
-def check_ffmpeg_installed() -> bool:
+@functools.lru_cache(maxsize=None)
+def check_ffmpeg_installed(path: str = "ffmpeg") -> bool:
     """
     Check if FFmpeg is installed and accessible.
     
+    The result is cached per binary path, so only the first call spawns
+    a process, and none is spawned if the binary isn't on PATH.
+    
+    Args:
+        path: FFmpeg binary to probe
+    
     Returns:
         bool: True if FFmpeg is available, False otherwise
     """
+    # which() also accepts explicit (possibly relative) paths such as
+    # "./ffmpeg", and returns None for _ffmpeg_bin()'s bare-name fallback
+    binary = shutil.which(_ffmpeg_bin() if path == "ffmpeg" else path)
+    if binary is None:
+        return False
+    
     try:
         subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
+            [os.path.abspath(binary), "-version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True
         )
         return True
@@ -335,7 +870,10 @@ def check_ffmpeg_installed() -> bool:
 # Convenience function for quick merging
 def quick_merge(video_path: str, audio_path: str, output_path: str) -> bool:
     """
-    Quick merge with default settings (no re-encoding, AAC audio).
+    Quick merge with default settings (no re-encoding).
+    
+    Tries a pure remux first; if the audio codec can't be stored in the
+    output container, falls back to re-encoding the audio to AAC.
     
     Args:
         video_path: Path to video file
@@ -345,79 +883,285 @@ def quick_merge(video_path: str, audio_path: str, output_path: str) -> bool:
     Returns:
         bool: True if successful
     """
-    return merge_video_audio(video_path, audio_path, output_path)
+    if merge_video_audio(video_path, audio_path, output_path, merge_mode="remux"):
+        return True
+    return merge_video_audio(video_path, audio_path, output_path, merge_mode="reencode_audio")
 
 
-def concatenate_videos(
-    video_paths: List[str],
-    output_path: str,
-    temp_dir: Optional[str] = None,
+def batch_merge(
+    pairs: List[Tuple[str, str, str]],
+    audio_codec: str = "aac",
+    audio_bitrate: str = "192k",
+    max_outputs_per_process: int = 16,
     overwrite: bool = True,
     verbose: bool = False
-) -> bool:
+) -> Dict[str, bool]:
     """
-    Concatenate multiple videos into a single video using FFmpeg concat demuxer.
+    Merge many video/audio pairs using as few FFmpeg processes as possible.
     
-    This is a lossless operation that preserves quality without re-encoding.
+    Each FFmpeg invocation takes several pairs as inputs and writes one output
+    per pair, so process startup and codec initialization are paid once per
+    group instead of once per pair. Video is always stream-copied. If a group
+    fails, its pairs are retried individually with merge_video_audio().
     
     Args:
-        video_paths: List of video file paths in order
-        output_path: Path for final concatenated video
-        temp_dir: Directory for temporary concat file (default: same as output)
-        overwrite: Overwrite output file if exists
-        verbose: Print FFmpeg output
+        pairs: List of (video_path, audio_path, output_path) tuples
+        audio_codec: Audio codec ("aac", "copy", etc.)
+        audio_bitrate: Audio bitrate (e.g., "192k", "256k")
+        max_outputs_per_process: Maximum pairs handled by a single FFmpeg run
+        overwrite: Overwrite output files if they exist
+        verbose: Print progress messages
         
     Returns:
-        bool: True if successful, False otherwise
+        Dict[str, bool]: Mapping of output paths to success status
+        
+    Example:
+        >>> results = batch_merge([
+        ...     ("scene_1.mp4", "audio_1.mp3", "scene_1_with_audio.mp4"),
+        ...     ("scene_2.mp4", "audio_2.mp3", "scene_2_with_audio.mp4"),
+        ... ])
     """
-    if not video_paths:
-        raise ValueError("video_paths cannot be empty")
-    
-    for video_path in video_paths:
+    for video_path, audio_path, _ in pairs:
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video not found: {video_path}")
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio not found: {audio_path}")
+    
+    results = {}
+    group_size = max(1, max_outputs_per_process)
+    
+    for start in range(0, len(pairs), group_size):
+        group = pairs[start:start + group_size]
+        
+        cmd = [_ffmpeg_bin(), "-y" if overwrite else "-n"]
+        for video_path, audio_path, _ in group:
+            cmd.extend(["-i", video_path, "-i", audio_path])
+        
+        # One output per pair, each mapping its own two inputs
+        for index, (_, audio_path, output_path) in enumerate(group):
+            pair_codec = _resolve_audio_codec(audio_path, output_path, audio_codec)
+            if pair_codec == "aac":
+                pair_codec = get_best_aac_encoder()
+            cmd.extend([
+                "-map", f"{2 * index}:v:0",
+                "-map", f"{2 * index + 1}:a:0",
+                "-c:v", "copy",
+                "-c:a", pair_codec
+            ])
+            if pair_codec != "copy":
+                cmd.extend(["-b:a", audio_bitrate])
+            cmd.extend(["-shortest", *_movflags_args(output_path), output_path])
+        
+        if verbose:
+            print(f"Merging {len(group)} video/audio pairs in one FFmpeg run...")
+        
+        try:
+            _run_ffmpeg(cmd, verbose)
+            for _, _, output_path in group:
+                results[output_path] = True
+                
+        except FileNotFoundError:
+            print("FFmpeg not found. Please install FFmpeg:")
+            print("  Windows: choco install ffmpeg")
+            print("  Mac: brew install ffmpeg")
+            print("  Linux: apt-get install ffmpeg")
+            for _, _, output_path in group:
+                results[output_path] = False
+                
+        except subprocess.CalledProcessError:
+            if verbose:
+                print("⚠️  Batch merge failed, merging pairs individually...")
+            for video_path, audio_path, output_path in group:
+                results[output_path] = merge_video_audio(
+                    video_path,
+                    audio_path,
+                    output_path,
+                    audio_codec=audio_codec,
+                    audio_bitrate=audio_bitrate,
+                    overwrite=overwrite,
+                    verbose=verbose
+                )
+    
+    return results
+
+
+def merge_video_audio_batch(
+    jobs: List[Tuple[str, str, str]],
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> List[bool]:
+    """
+    Run merge_video_audio() for many jobs in parallel FFmpeg processes.
+    
+    Each worker's FFmpeg gets an equal share of the CPU cores via -threads,
+    so concurrent processes don't oversubscribe the machine.
+    
+    Args:
+        jobs: List of (video_path, audio_path, output_path) tuples
+        max_workers: Concurrent FFmpeg processes (default: half the CPU cores)
+        **kwargs: Extra options passed to merge_video_audio()
+        
+    Returns:
+        List[bool]: Success status per job, in the same order as jobs
+        
+    Example:
+        >>> results = merge_video_audio_batch([
+        ...     ("scene_1.mp4", "audio_1.mp3", "scene_1_with_audio.mp4"),
+        ...     ("scene_2.mp4", "audio_2.mp3", "scene_2_with_audio.mp4"),
+        ... ])
+    """
+    if not jobs:
+        return []
+    
+    cpu_count = os.cpu_count() or 1
+    max_workers = max_workers or max(1, cpu_count // 2)
+    kwargs.setdefault("threads", max(1, cpu_count // max_workers))
+    
+    def run_job(job: Tuple[str, str, str]) -> bool:
+        try:
+            return merge_video_audio(*job, **kwargs)
+        except FileNotFoundError as e:
+            print(f"Merge failed: {str(e)}")
+            return False
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        return list(executor.map(run_job, jobs))
+
+
+def concatenate_videos_batch(
+    jobs: List[Tuple[List[str], str]],
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> List[bool]:
+    """
+    Run concatenate_videos() for many jobs in parallel FFmpeg processes.
+    
+    Each worker's FFmpeg gets an equal share of the CPU cores via -threads.
+    
+    Args:
+        jobs: List of (video_paths, output_path) tuples
+        max_workers: Concurrent FFmpeg processes (default: half the CPU cores)
+        **kwargs: Extra options passed to concatenate_videos()
+        
+    Returns:
+        List[bool]: Success status per job, in the same order as jobs
+    """
+    if not jobs:
+        return []
+    
+    cpu_count = os.cpu_count() or 1
+    max_workers = max_workers or max(1, cpu_count // 2)
+    kwargs.setdefault("threads", max(1, cpu_count // max_workers))
+    
+    def run_job(job: Tuple[List[str], str]) -> bool:
+        try:
+            return concatenate_videos(*job, **kwargs)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Concatenation failed: {str(e)}")
+            return False
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        return list(executor.map(run_job, jobs))
+
+
+def _write_concat_list(video_paths: List[str], temp_dir: str) -> str:
+    """
+    Write an FFmpeg concat demuxer list with absolute, quoted paths.
+    
+    The list is a uniquely named temporary file in temp_dir; the caller is
+    responsible for removing it.
+    
+    Returns:
+        str: Path to the list file
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        suffix=".txt",
+        prefix="concat_list_",
+        dir=temp_dir,
+        newline="",
+        delete=False
+    ) as f:
+        for video_path in video_paths:
+            abs_path = os.path.abspath(video_path)
+            escaped_path = abs_path.replace("'", "'\\''")
+            f.write(f"file '{escaped_path}'\n")
+        return f.name
+
+
+def _build_concat_command(
+    concat_file: str,
+    output_path: str,
+    overwrite: bool,
+    threads: Optional[int]
+) -> List[str]:
+    """Build the lossless concat-demuxer command used by concatenate_videos()."""
+    return [
+        _ffmpeg_bin(),
+        "-f", "concat",
+        "-safe", "0",
+        "-i", concat_file,
+        "-c", "copy",  # No re-encoding (lossless)
+        *_threads_args(threads),
+        *_movflags_args(output_path),
+        "-y" if overwrite else "-n",
+        output_path
+    ]
+
+
+def concatenate_videos(
+    video_paths: List[str],
+    output_path: str,
+    temp_dir: Optional[str] = None,
+    overwrite: bool = True,
+    verbose: bool = False,
+    threads: Optional[int] = None
+) -> bool:
+    """
+    Concatenate multiple videos into a single video using FFmpeg concat demuxer.
+    
+    This is a lossless operation that preserves quality without re-encoding.
+    
+    Args:
+        video_paths: List of video file paths in order
+        output_path: Path for final concatenated video
+        temp_dir: Directory for temporary concat file (default: same as output)
+        overwrite: Overwrite output file if exists
+        verbose: Print FFmpeg output
+        threads: FFmpeg thread count (default: FFmpeg decides). Use
+                os.cpu_count() for a single job, or os.cpu_count() // K when
+                running K jobs concurrently
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not video_paths:
+        raise ValueError("video_paths cannot be empty")
+    
+    for video_path in video_paths:
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video not found: {video_path}")
     
     if temp_dir is None:
         temp_dir = os.path.dirname(output_path) or "."
     
-    # Create concat file
-    import uuid
-    concat_file = os.path.join(temp_dir, f"concat_list_{uuid.uuid4().hex[:8]}.txt")
+    concat_file = None
     
     try:
-        with open(concat_file, "w") as f:
-            for video_path in video_paths:
-                abs_path = os.path.abspath(video_path)
-                escaped_path = abs_path.replace("'", "'\\''")
-                f.write(f"file '{escaped_path}'\n")
+        # Create concat file
+        concat_file = _write_concat_list(video_paths, temp_dir)
         
-        cmd = [
-            "ffmpeg",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", concat_file,
-            "-c", "copy",  # No re-encoding (lossless)
-            "-y" if overwrite else "-n",
-            output_path
-        ]
+        cmd = _build_concat_command(concat_file, output_path, overwrite, threads)
         
         if verbose:
             print(f"Concatenating {len(video_paths)} videos...")
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        if verbose and result.stdout:
-            print(f"FFmpeg output: {result.stdout}")
+        _run_ffmpeg(cmd, verbose)
         
         return True
         
     except subprocess.CalledProcessError as e:
-        print(f"FFmpeg concatenation error: {e.stderr}")
+        print(f"FFmpeg concatenation error: {_ffmpeg_error(e)}")
         return False
     except FileNotFoundError:
         print("FFmpeg not found. Please install FFmpeg:")
@@ -429,11 +1173,262 @@ def concatenate_videos(
         print(f"Concatenation failed: {str(e)}")
         return False
     finally:
-        if os.path.exists(concat_file):
-            try:
+        if concat_file:
+            with contextlib.suppress(OSError):
+                os.unlink(concat_file)
+
+
+def merge_and_concat(
+    pairs: List[Tuple[str, str]],
+    output_path: str,
+    audio_bitrate: str = "192k",
+    temp_dir: Optional[str] = None,
+    overwrite: bool = True,
+    verbose: bool = False
+) -> bool:
+    """
+    Merge each video with its audio and concatenate the results in one FFmpeg run.
+    
+    Equivalent to calling merge_video_audio() per clip followed by
+    concatenate_videos(), but without writing and re-reading intermediate
+    files. Video is joined with the concat demuxer and stream-copied, so all
+    clips must share codec, resolution and timebase (true for clips from the
+    same generation model). Each audio track is trimmed or padded with silence
+    to its clip's length so it stays in sync, then the tracks are joined and
+    encoded to AAC once.
+    
+    Args:
+        pairs: List of (video_path, audio_path) tuples in order
+        output_path: Path for final video
+        audio_bitrate: Audio bitrate (e.g., "192k", "256k")
+        temp_dir: Directory for temporary concat file (default: same as output)
+        overwrite: Overwrite output file if exists
+        verbose: Print progress messages
+        
+    Returns:
+        bool: True if successful, False otherwise
+        
+    Raises:
+        FileNotFoundError: If a video or audio file doesn't exist
+        ValueError: If pairs is empty or a clip's duration can't be read
+        
+    Example:
+        >>> merge_and_concat(
+        ...     [("scene_1.mp4", "audio_1.mp3"), ("scene_2.mp4", "audio_2.mp3")],
+        ...     "final_video.mp4"
+        ... )
+    """
+    if not pairs:
+        raise ValueError("pairs cannot be empty")
+    
+    for video_path, audio_path in pairs:
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video not found: {video_path}")
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio not found: {audio_path}")
+    
+    if temp_dir is None:
+        temp_dir = os.path.dirname(output_path) or "."
+    
+    video_paths = [video_path for video_path, _ in pairs]
+    
+    # Clip durations decide where each audio track starts, so a guessed
+    # duration would silently shift every later track out of sync
+    max_workers = min(len(video_paths), os.cpu_count() or 1, 8)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        video_durations = list(executor.map(get_video_duration, video_paths))
+    
+    unreadable = [path for path, duration in zip(video_paths, video_durations) if duration is None]
+    if unreadable:
+        raise ValueError(f"Could not get duration for: {', '.join(unreadable)}")
+    
+    concat_file = None
+    
+    try:
+        concat_file = _write_concat_list(video_paths, temp_dir)
+        
+        cmd = [_ffmpeg_bin(), "-f", "concat", "-safe", "0", "-i", concat_file]
+        for _, audio_path in pairs:
+            cmd.extend(["-i", audio_path])
+        
+        # Fit every audio track to its clip, then join them
+        filter_parts = []
+        for i, duration in enumerate(video_durations):
+            filter_parts.append(
+                f"[{i + 1}:a]apad,atrim=0:{duration},asetpts=PTS-STARTPTS[a{i}]"
+            )
+        audio_labels = "".join(f"[a{i}]" for i in range(len(pairs)))
+        filter_parts.append(f"{audio_labels}concat=n={len(pairs)}:v=0:a=1[aout]")
+        
+        cmd.extend([
+            "-filter_complex", ";".join(filter_parts),
+            "-map", "0:v:0",
+            "-map", "[aout]",
+            "-c:v", "copy",
+            "-c:a", get_best_aac_encoder(),
+            "-b:a", audio_bitrate,
+            "-shortest",
+            *_movflags_args(output_path),
+            "-y" if overwrite else "-n",
+            output_path
+        ])
+        
+        if verbose:
+            print(f"Merging and concatenating {len(pairs)} clips in one pass...")
+        
+        _run_ffmpeg(cmd)
+        return True
+        
+    except subprocess.CalledProcessError as e:
+        print(f"FFmpeg merge+concat error: {_ffmpeg_error(e)}")
+        return False
+    except FileNotFoundError:
+        print("FFmpeg not found. Please install FFmpeg:")
+        print("  Windows: choco install ffmpeg")
+        print("  Mac: brew install ffmpeg")
+        print("  Linux: apt-get install ffmpeg")
+        return False
+    except Exception as e:
+        print(f"Merge+concat failed: {str(e)}")
+        return False
+    finally:
+        if concat_file:
+            with contextlib.suppress(OSError):
                 os.unlink(concat_file)
-            except:
-                pass
+
+
+def _encode_transition_segment(
+    video_paths: List[str],
+    spans: List[Tuple[float, float]],
+    segment_path: str,
+    transition_duration: float,
+    scale_filter: str,
+    input_options: List[str],
+    encoder_settings: Dict[str, List[str]],
+    threads: Optional[int],
+    verbose: bool
+) -> None:
+    """
+    Encode one piece of a segmented transition render.
+    
+    video_paths must already be absolute.
+    
+    With one input the span is re-encoded as-is (a clip body); with two inputs
+    the spans are crossfaded into a single transition_duration segment.
+    Every piece uses the same normalization and encoder settings so the
+    results can be joined with the concat demuxer.
+    """
+    inputs = []
+    filter_parts = []
+    for i, (video_path, (start, duration)) in enumerate(zip(video_paths, spans)):
+        inputs.extend([
+            *input_options,
+            "-ss", f"{start:.3f}",
+            "-t", f"{duration:.3f}",
+            "-i", video_path
+        ])
+        filter_parts.append(NORMALIZE_FILTER_TEMPLATE.format(i=i, scale=scale_filter))
+    
+    final_video, final_audio = "[v0]", "[a0]"
+    if len(video_paths) == 2:
+        filter_parts.append(CROSSFADE_FILTER_TEMPLATE.format(
+            prev_video="v0", prev_audio="a0", i=1,
+            duration=transition_duration, offset=0
+        ))
+        final_video, final_audio = "[vx1]", "[ax1]"
+    
+    if encoder_settings["upload"]:
+        filter_parts.append(f"{final_video}{encoder_settings['upload']}[vout]")
+        final_video = "[vout]"
+    
+    cmd = [
+        _ffmpeg_bin(),
+        *encoder_settings["global"],
+        *inputs,
+        "-filter_complex", ";".join(filter_parts),
+        "-map", final_video,
+        "-map", final_audio,
+        *encoder_settings["encode"],
+        *_threads_args(threads),
+        # Identical audio parameters keep the pieces concat-compatible
+        "-c:a", "aac",
+        "-ar", "48000",
+        "-ac", "2",
+        "-y",
+        segment_path
+    ]
+    _run_ffmpeg(cmd, verbose)
+
+
+def _concatenate_with_transitions_segmented(
+    video_paths: List[str],
+    video_durations: List[float],
+    output_path: str,
+    transition_duration: float,
+    temp_dir: str,
+    overwrite: bool,
+    verbose: bool,
+    scale_filter: str,
+    input_options: List[str],
+    encoder_settings: Dict[str, List[str]],
+    threads: Optional[int]
+) -> bool:
+    """
+    Render a crossfade chain as independent pieces in parallel, then join them.
+    
+    The timeline is split into clip bodies and pairwise transitions:
+    body 0, fade 0->1, body 1, fade 1->2, ..., body N-1. Each piece is its
+    own FFmpeg process, so wall time is roughly the slowest piece instead of
+    the whole chain. The pieces are joined losslessly by concatenate_videos().
+    
+    Raises:
+        subprocess.CalledProcessError: If any piece fails to encode
+    """
+    num_videos = len(video_paths)
+    last = num_videos - 1
+    
+    # (inputs, spans) per piece, in timeline order
+    pieces = []
+    for i, (video_path, duration) in enumerate(zip(video_paths, video_durations)):
+        if i > 0:
+            pieces.append((
+                [video_paths[i - 1], video_path],
+                [(video_durations[i - 1] - transition_duration, transition_duration),
+                 (0.0, transition_duration)]
+            ))
+        start = transition_duration if i > 0 else 0.0
+        end = duration - transition_duration if i < last else duration
+        pieces.append(([video_path], [(start, end - start)]))
+    
+    max_workers = max(1, min(len(pieces), (os.cpu_count() or 1) // 2))
+    threads = threads or max(1, (os.cpu_count() or 1) // max_workers)
+    segment_dir = tempfile.mkdtemp(prefix="transition_segments_", dir=temp_dir)
+    
+    try:
+        segment_paths = [
+            os.path.join(segment_dir, f"segment_{i:03d}.mp4")
+            for i in range(len(pieces))
+        ]
+        
+        if verbose:
+            print(f"Encoding {len(pieces)} segments with {max_workers} parallel workers...")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _encode_transition_segment,
+                    piece_paths, spans, segment_path, transition_duration,
+                    scale_filter, input_options, encoder_settings, threads, verbose
+                )
+                for (piece_paths, spans), segment_path in zip(pieces, segment_paths)
+            ]
+            for future in futures:
+                future.result()
+        
+        return concatenate_videos(segment_paths, output_path, temp_dir, overwrite, verbose)
+    
+    finally:
+        shutil.rmtree(segment_dir, ignore_errors=True)
 
 
 def concatenate_videos_with_transitions(
@@ -442,7 +1437,9 @@ def concatenate_videos_with_transitions(
     transition_duration: float = 0.3,
     temp_dir: Optional[str] = None,
     overwrite: bool = True,
-    verbose: bool = False
+    verbose: bool = False,
+    hw_encoder: Optional[HWEncoder] = None,
+    threads: Optional[int] = None
 ) -> bool:
     """
     Concatenate multiple videos with crossfade transitions between them.
@@ -453,10 +1450,17 @@ def concatenate_videos_with_transitions(
     Args:
         video_paths: List of video file paths in order
         output_path: Path for final concatenated video
-        transition_duration: Duration of crossfade transition in seconds (default: 0.3)
+        transition_duration: Duration of crossfade transition in seconds (default: 0.3).
+                            0 joins the clips losslessly via concatenate_videos()
         temp_dir: Directory for temporary files (default: same as output)
         overwrite: Overwrite output file if exists
         verbose: Print FFmpeg output
+        hw_encoder: Video encoder (default: auto-detect, see get_hw_encoder()).
+                   Pass HWEncoder.NONE to force libx264. If a hardware encode
+                   fails, the render is retried with libx264.
+        threads: FFmpeg thread count (default: FFmpeg decides). Use
+                os.cpu_count() for a single job, or os.cpu_count() // K when
+                running K jobs concurrently
         
     Returns:
         bool: True if successful, False otherwise
@@ -468,95 +1472,131 @@ def concatenate_videos_with_transitions(
         if verbose:
             print("Only one video provided, copying without transitions")
         try:
-            import shutil
-            shutil.copy2(video_paths[0], output_path)
+            # copyfile skips metadata and uses sendfile/fcopyfile where available
+            shutil.copyfile(video_paths[0], output_path)
             return True
         except Exception as e:
             print(f"Failed to copy video: {str(e)}")
             return False
     
-    for video_path in video_paths:
-        if not os.path.exists(video_path):
-            raise FileNotFoundError(f"Video not found: {video_path}")
+    # Resolve every path once; FFmpeg and the workers reuse these
+    abs_paths = [os.path.abspath(video_path) for video_path in video_paths]
+    missing = [path for path in abs_paths if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"Video not found: {missing[0]}")
     
     if temp_dir is None:
         temp_dir = os.path.dirname(output_path) or "."
     
+    # No crossfade requested: a lossless stream-copy join is enough
+    if transition_duration <= 0:
+        if verbose:
+            print("Transition duration is 0, using lossless concatenation (no re-encoding)")
+        return concatenate_videos(video_paths, output_path, temp_dir, overwrite, verbose, threads)
+    
+    script_file = None
+    filter_complex = None
+    
     try:
         num_videos = len(video_paths)
+        hw_encoder = _resolve_hw_encoder(hw_encoder)
+        encoder_settings = HW_ENCODER_SETTINGS[hw_encoder]
+        
+        # Get video durations (probes run concurrently, one ffprobe each)
+        max_workers = min(num_videos, os.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            video_durations = list(executor.map(
+                lambda path: _probe_duration(path, verbose=verbose),
+                abs_paths
+            ))
         
-        # Get video durations
-        video_durations = []
-        for i, video_path in enumerate(video_paths):
-            info = get_video_info(video_path)
-            if info and "format" in info and "duration" in info["format"]:
-                duration = float(info["format"]["duration"])
-                video_durations.append(duration)
-            else:
-                if verbose:
-                    print(f"⚠️  Could not get duration for {os.path.basename(video_path)}, assuming 10s")
-                video_durations.append(10.0)
+        # Decode and scale on the GPU when the encoder has matching support
+        scale_filter = _gpu_scale(hw_encoder, 1920, 1080)
+        input_options = _hw_decode_options(hw_encoder, keep_on_gpu=scale_filter is not None)
+        if scale_filter is None:
+            scale_filter = "scale=1920:1080:force_original_aspect_ratio=decrease"
+        
+        # Long chains render faster as parallel pieces when every clip has a
+        # body left between its two transitions
+        if (num_videos >= SEGMENTED_TRANSITION_MIN_VIDEOS
+                and min(video_durations) > 2 * transition_duration):
+            if verbose:
+                print(f"Applying crossfade transitions (duration: {transition_duration}s)...")
+                print(f"Video encoder: {encoder_settings['encode'][1]}")
+            return _concatenate_with_transitions_segmented(
+                abs_paths, video_durations, output_path, transition_duration,
+                temp_dir, overwrite, verbose, scale_filter, input_options,
+                encoder_settings, threads
+            )
         
         # Build input list
         inputs = []
-        for video_path in video_paths:
-            abs_path = os.path.abspath(video_path)
-            inputs.extend(["-i", abs_path])
+        for abs_path in abs_paths:
+            inputs.extend([*input_options, "-i", abs_path])
         
-        # Build filter complex for crossfades
-        filter_parts = []
-        
-        # Prepare each video stream (normalize, scale, format)
-        for i in range(num_videos):
-            filter_parts.append(
-                f"[{i}:v]setpts=PTS-STARTPTS,scale=1920:1080:force_original_aspect_ratio=decrease,"
-                f"pad=1920:1080:(ow-iw)/2:(oh-ih)/2,format=yuv420p[v{i}]"
-            )
-            filter_parts.append(
-                f"[{i}:a]asetpts=PTS-STARTPTS[a{i}]"
-            )
+        # Build filter complex for crossfades: normalize every input
+        # (scale, pad, format, timestamps), one template fill per clip
+        filter_parts = [
+            NORMALIZE_FILTER_TEMPLATE.format(i=i, scale=scale_filter)
+            for i in range(num_videos)
+        ]
         
         # Chain crossfades for video and audio
         if num_videos == 1:
             final_video = "[v0]"
             final_audio = "[a0]"
         else:
-            # First transition
-            offset = video_durations[0] - transition_duration
-            filter_parts.append(
-                f"[v0][v1]xfade=transition=fade:duration={transition_duration}:offset={offset}[vx1]"
-            )
-            filter_parts.append(
-                f"[a0][a1]acrossfade=d={transition_duration}[ax1]"
-            )
+            # Transition i starts one transition before the end of the chain
+            # built so far: sum(durations[:i]) - i * transition_duration
+            offsets = [
+                total - i * transition_duration
+                for i, total in enumerate(accumulate(video_durations[:-1]), start=1)
+            ]
             
-            # Chain remaining transitions
-            cumulative = video_durations[0] + video_durations[1] - 2 * transition_duration
-            for i in range(2, num_videos):
-                offset = cumulative - transition_duration
-                filter_parts.append(
-                    f"[vx{i-1}][v{i}]xfade=transition=fade:duration={transition_duration}:offset={offset}[vx{i}]"
+            # Chain transitions
+            filter_parts.extend(
+                CROSSFADE_FILTER_TEMPLATE.format(
+                    prev_video="v0" if i == 1 else f"vx{i-1}",
+                    prev_audio="a0" if i == 1 else f"ax{i-1}",
+                    i=i,
+                    duration=transition_duration,
+                    offset=offset
                 )
-                filter_parts.append(
-                    f"[ax{i-1}][a{i}]acrossfade=d={transition_duration}[ax{i}]"
-                )
-                cumulative += video_durations[i] - transition_duration
+                for i, offset in enumerate(offsets, start=1)
+            )
             
             final_video = f"[vx{num_videos-1}]"
             final_audio = f"[ax{num_videos-1}]"
         
+        # Hand frames to the GPU when the encoder needs hardware surfaces
+        if encoder_settings["upload"]:
+            filter_parts.append(f"{final_video}{encoder_settings['upload']}[vout]")
+            final_video = "[vout]"
+        
         filter_complex = ";".join(filter_parts)
         
+        # Pass the graph as a file: with many clips it can exceed argv limits
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            suffix=".txt",
+            prefix="filter_complex_",
+            dir=temp_dir,
+            delete=False
+        ) as f:
+            f.write(filter_complex)
+            script_file = f.name
+        
         cmd = [
-            "ffmpeg",
+            _ffmpeg_bin(),
+            *encoder_settings["global"],
             *inputs,
-            "-filter_complex", filter_complex,
+            "-filter_complex_script", script_file,
             "-map", final_video,
             "-map", final_audio,
-            "-c:v", "libx264",
+            *encoder_settings["encode"],
+            *_threads_args(threads),
             "-c:a", "aac",
-            "-preset", "medium",
-            "-crf", "23",
+            *_movflags_args(output_path),
             "-y" if overwrite else "-n",
             output_path
         ]
@@ -564,27 +1604,28 @@ def concatenate_videos_with_transitions(
         if verbose:
             print(f"Applying crossfade transitions (duration: {transition_duration}s)...")
             print(f"Processing {num_videos} videos with frame blending...")
+            print(f"Video encoder: {encoder_settings['encode'][1]}")
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        if verbose:
-            if result.stdout:
-                print(f"FFmpeg output: {result.stdout}")
+        _run_ffmpeg(cmd, verbose)
         
         return True
         
     except subprocess.CalledProcessError as e:
-        print(f"FFmpeg transition error: {e.stderr}")
+        if hw_encoder != HWEncoder.NONE:
+            if verbose:
+                print(f"⚠️  Hardware encode ({hw_encoder.value}) failed, retrying with libx264...")
+            return concatenate_videos_with_transitions(
+                video_paths, output_path, transition_duration, temp_dir,
+                overwrite, verbose, hw_encoder=HWEncoder.NONE, threads=threads
+            )
+        print(f"FFmpeg transition error: {_ffmpeg_error(e)}")
         if verbose:
-            print(f"Command: {' '.join(cmd)}")
+            print(f"Command: {' '.join(e.cmd)}")
+            if filter_complex:
+                print(f"Filter graph: {filter_complex}")
         if verbose:
             print("⚠️  Crossfade failed, trying simple concatenation...")
-        return concatenate_videos(video_paths, output_path, temp_dir, overwrite, verbose)
+        return concatenate_videos(video_paths, output_path, temp_dir, overwrite, verbose, threads)
     
     except FileNotFoundError:
         print("FFmpeg not found. Please install FFmpeg:")
@@ -600,4 +1641,154 @@ def concatenate_videos_with_transitions(
             traceback.print_exc()
         if verbose:
             print("⚠️  Falling back to simple concatenation...")
-        return concatenate_videos(video_paths, output_path, temp_dir, overwrite, verbose)
+        return concatenate_videos(video_paths, output_path, temp_dir, overwrite, verbose, threads)
+    
+    finally:
+        if script_file:
+            with contextlib.suppress(OSError):
+                os.unlink(script_file)
+
+
+async def _arun_ffmpeg(
+    cmd: List[str],
+    verbose: bool = False,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> None:
+    """
+    Async counterpart of _run_ffmpeg() built on asyncio.create_subprocess_exec.
+    
+    Holds semaphore (if given) while FFmpeg runs, so callers can cap how many
+    processes are alive at once. Raises CalledProcessError like the sync path.
+    """
+    async with semaphore or contextlib.nullcontext():
+        process = await asyncio.create_subprocess_exec(
+            cmd[0], "-loglevel", "info" if verbose else "error", *cmd[1:],
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=None if verbose else asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+    
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr)
+
+
+async def amerge_video_audio(
+    video_path: str,
+    audio_path: str,
+    output_path: str,
+    video_codec: str = "copy",
+    audio_codec: str = "aac",
+    audio_bitrate: str = "192k",
+    overwrite: bool = True,
+    verbose: bool = False,
+    merge_mode: Literal["remux", "reencode_audio", "full"] = "reencode_audio",
+    audio_encoder: Optional[str] = None,
+    hw_encoder: Optional[HWEncoder] = None,
+    threads: Optional[int] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> bool:
+    """
+    Async version of merge_video_audio() for use inside an event loop.
+    
+    FFmpeg runs as an asyncio subprocess, so many merges can overlap from a
+    single coroutine runner without blocking the loop.
+    
+    Args:
+        (same as merge_video_audio)
+        semaphore: Optional asyncio.Semaphore limiting concurrent FFmpeg
+                  processes (e.g. asyncio.Semaphore(2) per GPU)
+        
+    Returns:
+        bool: True if successful, False otherwise
+        
+    Example:
+        >>> limit = asyncio.Semaphore(4)
+        >>> results = await asyncio.gather(*(
+        ...     amerge_video_audio(video, audio, output, semaphore=limit)
+        ...     for video, audio, output in jobs
+        ... ))
+    """
+    # Building the command may probe the inputs; keep that off the loop
+    cmd = await asyncio.to_thread(
+        _build_merge_command,
+        video_path, audio_path, output_path, video_codec, audio_codec,
+        audio_bitrate, overwrite, merge_mode, audio_encoder, hw_encoder, threads
+    )
+    
+    try:
+        await _arun_ffmpeg(cmd, verbose, semaphore)
+        return True
+        
+    except subprocess.CalledProcessError as e:
+        print(f"FFmpeg error: {_ffmpeg_error(e)}")
+        return False
+        
+    except FileNotFoundError:
+        print("FFmpeg not found. Please install FFmpeg:")
+        print("  Windows: choco install ffmpeg")
+        print("  Mac: brew install ffmpeg")
+        print("  Linux: apt-get install ffmpeg")
+        return False
+        
+    except Exception as e:
+        print(f"Merge failed: {str(e)}")
+        return False
+
+
+async def aconcatenate_videos(
+    video_paths: List[str],
+    output_path: str,
+    temp_dir: Optional[str] = None,
+    overwrite: bool = True,
+    verbose: bool = False,
+    threads: Optional[int] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> bool:
+    """
+    Async version of concatenate_videos() for use inside an event loop.
+    
+    Args:
+        (same as concatenate_videos)
+        semaphore: Optional asyncio.Semaphore limiting concurrent FFmpeg processes
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not video_paths:
+        raise ValueError("video_paths cannot be empty")
+    
+    for video_path in video_paths:
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video not found: {video_path}")
+    
+    if temp_dir is None:
+        temp_dir = os.path.dirname(output_path) or "."
+    
+    concat_file = None
+    
+    try:
+        concat_file = _write_concat_list(video_paths, temp_dir)
+        cmd = _build_concat_command(concat_file, output_path, overwrite, threads)
+        
+        if verbose:
+            print(f"Concatenating {len(video_paths)} videos...")
+        
+        await _arun_ffmpeg(cmd, verbose, semaphore)
+        return True
+        
+    except subprocess.CalledProcessError as e:
+        print(f"FFmpeg concatenation error: {_ffmpeg_error(e)}")
+        return False
+    except FileNotFoundError:
+        print("FFmpeg not found. Please install FFmpeg:")
+        print("  Windows: choco install ffmpeg")
+        print("  Mac: brew install ffmpeg")
+        print("  Linux: apt-get install ffmpeg")
+        return False
+    except Exception as e:
+        print(f"Concatenation failed: {str(e)}")
+        return False
+    finally:
+        if concat_file:
+            with contextlib.suppress(OSError):
+                os.unlink(concat_file)
@@ -1,11 +1,13 @@
 # Generators Module - Runware & Mirelo Integration
 
-from .runware_client import RunwareClient
-from .mirelo_client import MireloClient
+from .runware_client import RunwareClient, AsyncRunwareClient
+from .mirelo_client import MireloClient, AsyncMireloClient
 from .generator import AssetGenerator
 
 __all__ = [
     "RunwareClient",
+    "AsyncRunwareClient",
     "MireloClient",
+    "AsyncMireloClient",
     "AssetGenerator",
 ]
@@ -3,27 +3,167 @@ Main generator module that combines Runware and Mirelo for complete asset genera
 """
 
 import os
+import asyncio
+import functools
+import shutil
+import tempfile
+import traceback
 import subprocess
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import Dict, List, Optional, Any, Sequence
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from .runware_client import RunwareClient
 from .mirelo_client import MireloClient
 
 
+# stderr lines kept from an FFmpeg run for error diagnostics
+_STDERR_TAIL_LINES = 64
+_STDERR_READ_SIZE = 64 * 1024
+
+# Static parts of the FFmpeg argument lists; only the file paths vary per call
+# Last frame: seek 0.1 s before the end, fit into 1920x1080, write one image
+_LAST_FRAME_INPUT_ARGS = ("-sseof", "-0.1")
+_LAST_FRAME_OUTPUT_ARGS = (
+    "-vf", "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2",
+    "-vframes", "1",
+)
+_IMAGE_FILE_ARGS = ("-f", "image2", "-y")  # Force image format, overwrite output
+
+# Merge: copy video, AAC audio, video from input 0 and audio from input 1,
+# end with the shortest stream, overwrite output
+_MERGE_OUTPUT_ARGS = (
+    "-c:v", "copy",
+    "-c:a", "aac",
+    "-map", "0:v:0",
+    "-map", "1:a:0",
+    "-shortest",
+    "-y",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_bin() -> str:
+    """Absolute path to FFmpeg, resolved once so spawns skip the PATH search."""
+    return shutil.which("ffmpeg") or "ffmpeg"
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Check once whether FFmpeg can be executed (result is cached)."""
+    try:
+        return subprocess.run(
+            [_ffmpeg_bin(), "-version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        ).returncode == 0
+    except OSError:
+        return False
+
+
+def _print_ffmpeg_install_hint() -> None:
+    """Print how to install FFmpeg."""
+    print(f"   ❌ FFmpeg not found. Please install FFmpeg:")
+    print(f"      Windows: choco install ffmpeg")
+    print(f"      Mac: brew install ffmpeg")
+    print(f"      Linux: apt-get install ffmpeg")
+
+
+async def _run_subprocess(cmd: Sequence[str]) -> None:
+    """
+    Run a command (FFmpeg/FFprobe) without blocking the event loop.
+    
+    stdout is discarded and only the last _STDERR_TAIL_LINES lines of stderr
+    are kept for error reporting, so chatty FFmpeg progress output is never
+    buffered in full. stderr is read in fixed-size chunks and split on both
+    '\r' and '\n': FFmpeg rewrites its progress line with '\r' only, which
+    can exceed StreamReader.readline()'s 64 KiB limit.
+    
+    Args:
+        cmd: Command and arguments
+        
+    Raises:
+        subprocess.CalledProcessError: If the process exits with a non-zero code
+        FileNotFoundError: If the executable is not installed
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+    pending = b""
+    try:
+        while True:
+            chunk = await process.stderr.read(_STDERR_READ_SIZE)
+            if not chunk:
+                break
+            lines = (pending + chunk).replace(b"\r", b"\n").split(b"\n")
+            # The last piece has no terminator yet; cap it so a line that
+            # never ends cannot grow without bound
+            pending = lines.pop()[-_STDERR_READ_SIZE:]
+            stderr_tail.extend(
+                line.decode("utf-8", errors="replace") + "\n"
+                for line in lines if line.strip()
+            )
+        if pending.strip():
+            stderr_tail.append(pending.decode("utf-8", errors="replace"))
+    except BaseException:
+        # Cancelled or failed while reading: don't leave the process running
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        raise
+    finally:
+        await process.wait()
+    
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode,
+            cmd,
+            stderr="".join(stderr_tail)
+        )
+
+
 class AssetGenerator:
     """
     Main class for generating images, videos, and audio using Runware and Mirelo.
     """
     
+    # Waits (seconds) between attempts to use a just-uploaded last frame that
+    # Runware has not finished processing yet
+    FRAME_READY_BACKOFF = (0.5, 1.0, 2.0, 4.0)
+    
+    # Scene fields included in the video prompt, in order, with their labels
+    VIDEO_PROMPT_FIELDS = (
+        ("visual_description", "Visual"),
+        ("camera_movement", "Camera"),
+        ("lighting_mood", "Lighting"),  # Lighting & mood
+        ("image_integration", "Image"),
+    )
+    
+    # Encoder options per last-frame format. JPEG at -q:v 3 is roughly a tenth
+    # of the size of a 1080p PNG, so the frame uploads much faster.
+    FRAME_FORMAT_ARGS = {
+        "jpg": ("-q:v", "3"),
+        "png": (),
+    }
+    
     def __init__(
         self,
         runware_api_key: str,
         mirelo_api_key: str,
         runware_image_model: str = "bfl:2@1",  # Default: Flux 1.1 Pro (user can override)
         runware_video_model: str = "klingai:6@1",  # Default for videos (user can override)
-        output_dir: str = "output"
+        output_dir: str = "output",
+        api_concurrency: int = 16,
+        frame_format: str = "jpg"
     ):
         """
         Initialize asset generator.
@@ -34,17 +174,41 @@ class AssetGenerator:
             runware_image_model: Default Runware image model (default: "bfl:2@1" for Flux 1.1 Pro, user can override)
             runware_video_model: Default Runware video model (default: "klingai:6@1", user can override)
             output_dir: Directory to save generated files
+            api_concurrency: Maximum number of concurrent Runware/Mirelo jobs (default: 16)
+            frame_format: Image format for the last frame uploaded to Runware,
+                          "jpg" (default, smaller upload) or "png" (lossless)
         """
+        if frame_format not in self.FRAME_FORMAT_ARGS:
+            raise ValueError(
+                f"Unsupported frame_format: {frame_format}. "
+                f"Available: {', '.join(self.FRAME_FORMAT_ARGS)}"
+            )
+        
         self.runware = RunwareClient(runware_api_key)
         self.mirelo = MireloClient(mirelo_api_key)
         self.runware_image_model = runware_image_model
         self.runware_video_model = runware_video_model
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.api_concurrency = api_concurrency
+        self.frame_format = frame_format
+        
+        # Probe FFmpeg once up front instead of failing on every merge
+        if not _ffmpeg_available():
+            print("⚠️  FFmpeg not available: last-frame extraction and video/audio merging are disabled")
+            _print_ffmpeg_install_hint()
+        
+        # Shared HTTP session: downloads reuse pooled keep-alive connections
+        # instead of opening a new TCP/TLS connection per file
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def _extract_last_frame(self, video_path: str) -> Optional[str]:
         """
         Extract the last frame from a video using FFmpeg.
+        Blocking wrapper around _extract_last_frame_async().
         
         Args:
             video_path: Path to video file
@@ -52,54 +216,54 @@ class AssetGenerator:
         Returns:
             Path to extracted frame image, or None if failed
         """
-        try:
-            # Create temporary file for frame - always use PNG format for Runware compatibility
-            frame_path = str(self.output_dir / f"last_frame_{os.path.basename(video_path).replace('.mp4', '')}.png")
-            
-            # Use FFmpeg to extract last frame
-            # -ss -0.1 means go to 0.1 seconds before the end
-            # -vframes 1 means extract 1 frame
-            cmd = [
-                "ffmpeg",
-                "-i", video_path,
-                "-vf", "select=eq(n\\,$(ffprobe -v error -select_streams v:0 -count_packets -show_entries stream=nb_read_packets -of csv=p=0 " + video_path + ")-1)",
-                "-vframes", "1",
-                "-y",  # Overwrite output file
-                frame_path
-            ]
+        return asyncio.run(self._extract_last_frame_async(video_path))
+    
+    async def _extract_last_frame_async(self, video_path: str) -> Optional[str]:
+        """
+        Extract the last frame from a video using FFmpeg without blocking the event loop.
+        
+        Args:
+            video_path: Path to video file
             
-            # Simpler approach: get video duration and extract frame near the end
-            # First, get duration
-            probe_cmd = [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                video_path
-            ]
+        Returns:
+            Path to extracted frame image, or None if failed
+        """
+        if not _ffmpeg_available():
+            print(f"   ⚠️  FFmpeg not available, cannot extract last frame")
+            return None
+        
+        try:
+            # Create temporary file for frame in the configured format (JPG or PNG)
+            # The frame only lives until it is uploaded, so keep it in the system temp
+            # dir (often RAM-backed tmpfs) rather than on the output volume
+            with tempfile.NamedTemporaryFile(
+                prefix=f"last_frame_{Path(video_path).stem}_",
+                suffix=f".{self.frame_format}",
+                delete=False
+            ) as frame_file:
+                frame_path = frame_file.name
             
-            result = subprocess.run(probe_cmd, capture_output=True, text=True, check=True)
-            duration = float(result.stdout.strip())
+            # A seek from the end that lands past the last frame writes nothing,
+            # so the empty placeholder must not pass as the result
+            if os.path.exists(frame_path):
+                os.unlink(frame_path)
             
+            # Seek relative to the end of the input (-sseof), so no separate
+            # FFprobe run is needed to find the duration first.
             # Extract frame 0.1 seconds before the end and scale to 1920x1080
             # This ensures the frame matches video dimensions for Runware
-            # Force PNG format for better compatibility with Runware
-            extract_cmd = [
-                "ffmpeg",
+            # The image encoder (mjpeg or png) follows the file extension
+            extract_cmd = (
+                _ffmpeg_bin(),
+                *_LAST_FRAME_INPUT_ARGS,
                 "-i", video_path,
-                "-ss", str(max(0, duration - 0.1)),
-                "-vf", "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2",
-                "-vframes", "1",
-                "-f", "image2",  # Force image format
-                "-y",
+                *_LAST_FRAME_OUTPUT_ARGS,
+                *self.FRAME_FORMAT_ARGS[self.frame_format],
+                *_IMAGE_FILE_ARGS,
                 frame_path
-            ]
-            
-            # Ensure output is PNG format
-            if not frame_path.endswith('.png'):
-                frame_path = frame_path.replace('.jpg', '.png').replace('.jpeg', '.png')
+            )
             
-            subprocess.run(extract_cmd, capture_output=True, check=True)
+            await _run_subprocess(extract_cmd)
             
             if os.path.exists(frame_path):
                 return frame_path
@@ -122,7 +286,8 @@ class AssetGenerator:
         model: str,
         width: int,
         height: int,
-        reference_images: Optional[List[str]]
+        reference_images: Optional[List[str]],
+        upload: bool = True
     ) -> Dict[str, Any]:
         """
         Generate a single image (helper for parallel generation).
@@ -135,6 +300,8 @@ class AssetGenerator:
             width: Image width
             height: Image height
             reference_images: Optional list of reference image UUIDs
+            upload: Upload the saved image to Runware for video generation
+                (False when the caller batch-uploads afterwards)
             
         Returns:
             Dictionary with generated image information
@@ -170,7 +337,7 @@ class AssetGenerator:
         if image_url:
             filename = f"image_{index}_{use_case.replace(' ', '_').lower()}.png"
             save_path = self.output_dir / filename
-            self.runware.download_file(image_url, str(save_path))
+            self.runware.download_file(image_url, str(save_path), session=self.session)
             result["local_path"] = str(save_path)
             print(f"   ✅ Image saved: {save_path}")
         else:
@@ -178,7 +345,7 @@ class AssetGenerator:
         
         # Upload image to Runware to get UUID for video generation
         image_uuid = None
-        if result.get("local_path"):
+        if upload and result.get("local_path"):
             try:
                 print(f"   📤 Uploading image to Runware for video generation...")
                 image_uuid = self.runware.upload_image(result["local_path"])
@@ -195,6 +362,151 @@ class AssetGenerator:
             "index": index  # Preserve original order
         }
     
+    def _start_api_pool(self) -> asyncio.Semaphore:
+        """
+        Prepare the running event loop for concurrent API jobs.
+        
+        The clients are synchronous, so their calls run in worker threads; the
+        loop gets a thread pool as large as api_concurrency, and the returned
+        semaphore caps how many jobs are in flight. Both belong to the current
+        loop (asyncio.run creates a new one per call).
+        
+        Returns:
+            Semaphore limiting concurrent API jobs to api_concurrency
+        """
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.api_concurrency)
+        )
+        return asyncio.Semaphore(self.api_concurrency)
+    
+    async def _generate_single_image_async(
+        self,
+        prompt_data: Dict[str, str],
+        index: int,
+        total: int,
+        model: str,
+        width: int,
+        height: int,
+        reference_images: Optional[List[str]],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        Generate a single image without blocking the event loop.
+        The Runware client is synchronous, so its calls run in a worker thread.
+        
+        Args:
+            (same as _generate_single_image)
+            semaphore: Semaphore from _start_api_pool() bounding concurrent jobs
+            
+        Returns:
+            Dictionary with generated image information
+        """
+        async with semaphore:
+            return await asyncio.to_thread(
+                self._generate_single_image,
+                prompt_data,
+                index,
+                total,
+                model,
+                width,
+                height,
+                reference_images,
+                False  # _generate_images_async batch-uploads afterwards
+            )
+    
+    async def _generate_images_async(
+        self,
+        prompts: List[Dict[str, str]],
+        model: str,
+        width: int,
+        height: int,
+        reference_images: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate all images concurrently (helper for generate_images).
+        
+        Args:
+            prompts: List of prompt dictionaries with 'runware_prompt' and 'use_case'
+            model: Runware image model
+            width: Image width
+            height: Image height
+            reference_images: Optional list of reference image UUIDs
+            
+        Returns:
+            List of generated image dictionaries, one per prompt (in original order).
+            Failed images have local_path/image_uuid set to None and an "error" key.
+        """
+        semaphore = self._start_api_pool()
+        
+        # gather() keeps results in prompt order
+        outcomes = await asyncio.gather(
+            *(
+                self._generate_single_image_async(
+                    prompt_data,
+                    i + 1,
+                    len(prompts),
+                    model,
+                    width,
+                    height,
+                    reference_images,
+                    semaphore
+                )
+                for i, prompt_data in enumerate(prompts)
+            ),
+            return_exceptions=True
+        )
+        
+        # Failed images keep their slot (with no local_path/image_uuid), so
+        # result i always belongs to prompt i and scene-to-image mapping holds
+        results = [None] * len(prompts)
+        for i, (prompt_data, outcome) in enumerate(zip(prompts, outcomes)):
+            if isinstance(outcome, Exception):
+                print(f"   ❌ Error generating image {i + 1}: {outcome}")
+                results[i] = {
+                    "use_case": prompt_data.get("use_case", f"Image {i + 1}"),
+                    "prompt": prompt_data.get("runware_prompt", ""),
+                    "result": None,
+                    "local_path": None,
+                    "image_uuid": None,
+                    "index": i + 1,
+                    "error": str(outcome)
+                }
+            else:
+                results[i] = outcome
+        
+        # Upload every saved image to Runware in one request for video generation
+        uploads = [r for r in results if r.get("local_path")]
+        if uploads:
+            print(f"📤 Uploading {len(uploads)} image(s) to Runware for video generation...")
+            image_uuids = [None] * len(uploads)
+            try:
+                image_uuids = await asyncio.to_thread(
+                    self.runware.upload_images,
+                    [r["local_path"] for r in uploads]
+                )
+            except Exception as e:
+                print(f"   ⚠️  Batch upload failed, uploading images one by one: {e}")
+            
+            # One bad file or a transient error must not cost every image its
+            # UUID: retry whatever the batch did not upload individually
+            missing = [k for k, image_uuid in enumerate(image_uuids) if image_uuid is None]
+            outcomes = await asyncio.gather(
+                *(asyncio.to_thread(self.runware.upload_image, uploads[k]["local_path"]) for k in missing),
+                return_exceptions=True
+            )
+            for k, outcome in zip(missing, outcomes):
+                if isinstance(outcome, Exception):
+                    print(f"   ⚠️  Failed to upload image {uploads[k]['index']} for video generation: {outcome}")
+                else:
+                    image_uuids[k] = outcome
+            
+            for r, image_uuid in zip(uploads, image_uuids):
+                r["image_uuid"] = image_uuid
+                if image_uuid:
+                    print(f"   ✅ Image {r['index']} UUID: {image_uuid}")
+        
+        return results
+    
     def generate_images(
         self,
         prompts: List[Dict[str, str]],
@@ -222,7 +534,9 @@ class AssetGenerator:
             parallel: Whether to generate images in parallel (default: True)
             
         Returns:
-            List of dictionaries with generated image information (in original order)
+            List of dictionaries with generated image information, one per prompt
+            (in original order). In parallel mode, failed images keep their slot
+            with local_path/image_uuid set to None and an "error" key.
         """
         model = model or self.runware_image_model
         
@@ -239,40 +553,15 @@ class AssetGenerator:
                 print(f"🖼️  Using logo as reference for image-to-image generation")
         
         if parallel and len(prompts) > 1:
-            # Generate images in parallel using ThreadPoolExecutor
+            # Generate images concurrently on an event loop
             print(f"🚀 Generating {len(prompts)} images in parallel...")
-            results = []
-            with ThreadPoolExecutor(max_workers=min(len(prompts), 4)) as executor:
-                # Submit all tasks
-                futures = {
-                    executor.submit(
-                        self._generate_single_image,
-                        prompt_data,
-                        i + 1,
-                        len(prompts),
-                        model,
-                        width,
-                        height,
-                        reference_images
-                    ): i
-                    for i, prompt_data in enumerate(prompts)
-                }
-                
-                # Collect results as they complete
-                completed_results = {}
-                for future in as_completed(futures):
-                    original_index = futures[future]
-                    try:
-                        result = future.result()
-                        completed_results[original_index] = result
-                    except Exception as e:
-                        print(f"   ❌ Error generating image {original_index + 1}: {e}")
-                        completed_results[original_index] = None
-                
-                # Reorder results to match original prompt order
-                results = [completed_results[i] for i in range(len(prompts)) if completed_results.get(i) is not None]
-            
-            return results
+            return asyncio.run(self._generate_images_async(
+                prompts,
+                model,
+                width,
+                height,
+                reference_images
+            ))
         else:
             # Sequential generation (original behavior)
             results = []
@@ -304,7 +593,8 @@ class AssetGenerator:
         Generate video scenes with audio using Runware and Mirelo.
         Videos are generated sequentially, with the last frame of each video
         used as the first frame of the next video (if use_last_frame=True).
-        Audio generation can happen in parallel after videos are generated.
+        Audio generation for a scene starts as soon as its video is downloaded,
+        overlapping with the generation of the following videos.
         
         Args:
             scenes: List of scene dictionaries with visual descriptions and audio design
@@ -315,11 +605,47 @@ class AssetGenerator:
             generate_audio: Whether to generate audio with Mirelo (default: True)
             use_last_frame: Whether to use last frame of previous video as first frame of next (default: True)
             
+        Returns:
+            List of dictionaries with generated video scene information
+        """
+        return asyncio.run(self._generate_video_scenes_async(
+            scenes,
+            generated_images,
+            model,
+            width,
+            height,
+            generate_audio,
+            use_last_frame
+        ))
+    
+    async def _generate_video_scenes_async(
+        self,
+        scenes: List[Dict[str, Any]],
+        generated_images: Optional[List[Dict[str, Any]]],
+        model: Optional[str],
+        width: int,
+        height: int,
+        generate_audio: bool,
+        use_last_frame: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate video scenes as a two-stage pipeline (helper for generate_video_scenes).
+        
+        Stage 1 generates the videos one after another (each may start from the
+        previous video's last frame). Stage 2, Mirelo audio generation, is
+        scheduled as a task per scene right after its video is downloaded, so
+        audio for scene N runs while the video for scene N+1 is generated.
+        
+        Args:
+            (same as generate_video_scenes)
+            
         Returns:
             List of dictionaries with generated video scene information
         """
         model = model or self.runware_video_model
+        semaphore = self._start_api_pool()
         results = []
+        audio_tasks = []  # (result, task) for scenes whose audio is in flight
         previous_video_path = None
         previous_frame_uuid = None
         
@@ -351,16 +677,21 @@ class AssetGenerator:
             # Determine which image to use as first frame
             image_uuid = None
             
+            # Generated image matching this scene (looked up once; also the retry fallback)
+            # Use modulo to cycle through images if more scenes than images
+            image_index = None
+            fallback_uuid = None
+            if generated_images:
+                image_index = (i - 1) % len(generated_images)
+                fallback_uuid = generated_images[image_index].get("image_uuid")
+            
             # Priority 1: Use last frame of previous video (if use_last_frame=True)
             if use_last_frame and previous_frame_uuid:
                 image_uuid = previous_frame_uuid
                 print(f"   🖼️  Using last frame from previous video as first frame")
             # Priority 2: Use generated image matching this scene
-            if not image_uuid and generated_images and len(generated_images) > 0:
-                # Use modulo to cycle through images if more scenes than images
-                image_index = (i - 1) % len(generated_images)
-                matched_image = generated_images[image_index]
-                image_uuid = matched_image.get("image_uuid")
+            if not image_uuid and generated_images:
+                image_uuid = fallback_uuid
                 
                 if image_uuid:
                     print(f"   🖼️  Using generated image {image_index + 1} as first frame")
@@ -372,10 +703,12 @@ class AssetGenerator:
             max_retries = 2
             retry_count = 0
             video_result = None
+            frame_ready_delays = iter(self.FRAME_READY_BACKOFF)
             
             while retry_count <= max_retries:
                 try:
-                    video_result = self.runware.generate_video(
+                    video_result = await asyncio.to_thread(
+                        self.runware.generate_video,
                         prompt=video_prompt,
                         model=model,
                         duration=duration,
@@ -388,23 +721,27 @@ class AssetGenerator:
                     error_str = str(e)
                     # Check if it's a failedToTransferImage error (400)
                     if "failedToTransferImage" in error_str or ("400" in error_str and "failedToTransfer" in error_str):
+                        # A freshly uploaded last frame may still be processing:
+                        # poll with backoff before giving up on it
+                        if image_uuid and image_uuid == previous_frame_uuid:
+                            delay = next(frame_ready_delays, None)
+                            if delay is not None:
+                                print(f"   ⏳ Last frame not ready yet, retrying in {delay}s...")
+                                await asyncio.sleep(delay)
+                                continue
                         retry_count += 1
                         # If using previous_frame_uuid failed, try with generated image instead
-                        if image_uuid == previous_frame_uuid and generated_images and len(generated_images) > 0:
+                        if image_uuid == previous_frame_uuid and generated_images:
                             print(f"   ⚠️  Failed to use last frame (attempt {retry_count}/{max_retries}), trying generated image...")
-                            image_index = (i - 1) % len(generated_images)
-                            matched_image = generated_images[image_index]
-                            fallback_uuid = matched_image.get("image_uuid")
                             if fallback_uuid:
                                 image_uuid = fallback_uuid
                                 print(f"   🖼️  Using generated image {image_index + 1} as first frame (fallback)")
                                 continue  # Retry with fallback image
                         elif retry_count <= max_retries:
                             # Wait a bit longer and retry with same image
-                            import time
                             wait_time = 2 * retry_count  # Exponential backoff: 2s, 4s
                             print(f"   ⏳ Image may not be ready yet, waiting {wait_time}s before retry {retry_count}/{max_retries}...")
-                            time.sleep(wait_time)
+                            await asyncio.sleep(wait_time)
                             continue
                     # If it's not a transfer error or we've exhausted retries, raise
                     if retry_count > max_retries:
@@ -419,7 +756,9 @@ class AssetGenerator:
             task_uuid = video_result.get("taskUUID")
             if task_uuid:
                 print(f"   ⏳ Waiting for video generation to complete...")
-                video_result = self.runware.wait_for_completion(task_uuid, poll_interval=5, max_wait=600)
+                video_result = await asyncio.to_thread(
+                    self.runware.wait_for_completion, task_uuid, poll_interval=5, max_wait=600
+                )
             
             # Download video if URL provided
             video_url = (
@@ -432,132 +771,169 @@ class AssetGenerator:
             if video_url:
                 filename = f"scene_{scene_num}.mp4"
                 save_path = self.output_dir / filename
-                self.runware.download_file(video_url, str(save_path))
+                await asyncio.to_thread(
+                    self.runware.download_file, video_url, str(save_path), session=self.session
+                )
                 video_path = str(save_path)
                 print(f"   ✅ Video saved: {save_path}")
             else:
                 print(f"   ⚠️  No video URL in result: {video_result.keys()}")
             
+            # Store result (audio_files is filled in once this scene's audio is done)
+            result = {
+                "scene_number": scene_num,
+                "duration": duration,
+                "video_result": video_result,
+                "video_path": video_path,
+                "audio_design": audio_design,
+                "audio_files": {}
+            }
+            results.append(result)
+            
+            # Start this scene's audio now; it runs while the next video is generated
+            if generate_audio and video_path:
+                print(f"   🎵 Starting audio generation for scene {scene_num}...")
+                audio_tasks.append((result, asyncio.create_task(
+                    self._generate_scene_audio_from_video_async(
+                        video_path,
+                        audio_design,
+                        duration,
+                        semaphore
+                    )
+                )))
+            
             # Extract last frame for next video (if use_last_frame=True and not last scene)
             if use_last_frame and video_path and i < len(scenes) - 1:
                 print(f"   🎬 Extracting last frame for next video...")
-                last_frame_path = self._extract_last_frame(video_path)
+                last_frame_path = await self._extract_last_frame_async(video_path)
                 if last_frame_path:
                     try:
-                        previous_frame_uuid = self.runware.upload_image(last_frame_path)
+                        previous_frame_uuid = await asyncio.to_thread(
+                            self.runware.upload_image, last_frame_path
+                        )
                         print(f"   ✅ Last frame uploaded: {previous_frame_uuid}")
-                        # Longer delay to ensure image is fully processed by Runware before use
-                        # Runware needs time to process the uploaded image and make it accessible
-                        import time
-                        time.sleep(3)  # Increased from 1s to 3s for better reliability
+                        # No fixed wait here: if Runware is still processing the upload,
+                        # the next generate_video call polls with FRAME_READY_BACKOFF
+                    except Exception as e:
+                        print(f"   ⚠️  Failed to upload last frame: {e}")
+                        previous_frame_uuid = None
+                    finally:
                         # Clean up temporary frame file
                         try:
                             os.unlink(last_frame_path)
-                        except:
+                        except OSError:
                             pass
-                    except Exception as e:
-                        print(f"   ⚠️  Failed to upload last frame: {e}")
-                        previous_frame_uuid = None
                 else:
                     previous_frame_uuid = None
             
             previous_video_path = video_path
-            
-            # Store result (audio will be generated in parallel after all videos are done)
-            results.append({
-                "scene_number": scene_num,
-                "duration": duration,
-                "video_result": video_result,
-                "video_path": video_path,
-                "audio_design": audio_design,  # Store for later audio generation
-                "audio_files": {}  # Will be populated after audio generation
-            })
         
-        # Generate audio in parallel after all videos are generated
+        # Collect audio (most of it already overlapped with video generation)
         if generate_audio:
-            print(f"\n🎵 Generating audio for {len(results)} videos in parallel...")
-            with ThreadPoolExecutor(max_workers=min(len(results), 4)) as executor:
-                futures = {
-                    executor.submit(
-                        self._generate_scene_audio_from_video,
-                        result["video_path"],
-                        result["audio_design"],
-                        result["duration"]
-                    ): i
-                    for i, result in enumerate(results)
-                    if result.get("video_path")
-                }
-                
-                for future in as_completed(futures):
-                    index = futures[future]
-                    try:
-                        audio_files = future.result()
-                        results[index]["audio_files"] = audio_files
-                    except Exception as e:
-                        print(f"   ❌ Error generating audio for scene {results[index]['scene_number']}: {e}")
-                        results[index]["audio_files"] = {}
+            print(f"\n🎵 Waiting for audio of {len(audio_tasks)} videos...")
+            outcomes = await asyncio.gather(
+                *(task for _, task in audio_tasks),
+                return_exceptions=True
+            )
+            for (result, _), outcome in zip(audio_tasks, outcomes):
+                if isinstance(outcome, Exception):
+                    print(f"   ❌ Error generating audio for scene {result['scene_number']}: {outcome}")
+                    result["audio_files"] = {}
+                else:
+                    result["audio_files"] = outcome
             
             # Merge video and audio for each scene (like testing_mirelo.py)
+            # All FFmpeg merges run concurrently as subprocesses
             print(f"\n🎬 Merging video and audio for {len(results)} scenes...")
-            for result in results:
-                video_path = result.get("video_path")
-                audio_files = result.get("audio_files", {})
-                scene_num = result.get("scene_number", "?")
-                
-                # Get audio file path
-                audio_path = audio_files.get("audio")
-                
-                if video_path and audio_path and os.path.exists(video_path) and os.path.exists(audio_path):
-                    # Create output filename (like testing_mirelo.py)
-                    video_basename = os.path.splitext(os.path.basename(video_path))[0]
-                    output_filename = f"{video_basename}_with_audio.mp4"
-                    output_path = str(self.output_dir / output_filename)
-                    
-                    print(f"   🎬 Merging scene {scene_num}...")
-                    success = self.merge_video_audio(video_path, audio_path, output_path)
-                    
-                    if success:
-                        result["final_video_path"] = output_path
-                        print(f"   ✅ Scene {scene_num} merged: {output_filename}")
-                    else:
-                        print(f"   ⚠️  Failed to merge scene {scene_num}")
-                else:
-                    if not video_path:
-                        print(f"   ⚠️  No video path for scene {scene_num}")
-                    if not audio_path:
-                        print(f"   ⚠️  No audio path for scene {scene_num}")
+            await self._merge_scenes_async(results)
         
         return results
     
-    def _build_video_prompt(self, scene: Dict[str, Any]) -> str:
+    async def _generate_scene_audio_from_video_async(
+        self,
+        video_path: str,
+        audio_design: Dict[str, str],
+        duration: int,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, str]:
         """
-        Build comprehensive video prompt from scene description.
+        Generate audio for one scene without blocking the event loop.
+        The Mirelo client is synchronous, so its calls run in a worker thread.
         
         Args:
-            scene: Scene dictionary with all details
+            (same as _generate_scene_audio_from_video)
+            semaphore: Semaphore from _start_api_pool() bounding concurrent jobs
             
         Returns:
-            Complete video generation prompt
+            Dictionary with paths to generated audio files
+        """
+        async with semaphore:
+            return await asyncio.to_thread(
+                self._generate_scene_audio_from_video,
+                video_path,
+                audio_design,
+                duration
+            )
+    
+    async def _merge_scenes_async(self, results: List[Dict[str, Any]]) -> None:
         """
-        parts = []
+        Merge video and audio for every scene concurrently.
+        Each result gets "final_video_path" when its merge succeeds.
         
-        # Visual description
-        if scene.get("visual_description"):
-            parts.append(f"Visual: {scene['visual_description']}")
+        Args:
+            results: Scene results from generate_video_scenes
+        """
+        await asyncio.gather(*(self._merge_scene_async(result) for result in results))
+    
+    async def _merge_scene_async(self, result: Dict[str, Any]) -> None:
+        """
+        Merge the video and audio of a single scene result (helper for _merge_scenes_async).
         
-        # Camera movement
-        if scene.get("camera_movement"):
-            parts.append(f"Camera: {scene['camera_movement']}")
+        Args:
+            result: Scene result with "video_path" and "audio_files"
+        """
+        video_path = result.get("video_path")
+        audio_files = result.get("audio_files", {})
+        scene_num = result.get("scene_number", "?")
         
-        # Lighting & mood
-        if scene.get("lighting_mood"):
-            parts.append(f"Lighting: {scene['lighting_mood']}")
+        # Get audio file path
+        audio_path = audio_files.get("audio")
         
-        # Image integration
-        if scene.get("image_integration"):
-            parts.append(f"Image: {scene['image_integration']}")
+        if video_path and audio_path and os.path.exists(video_path) and os.path.exists(audio_path):
+            # Create output filename (like testing_mirelo.py)
+            video_basename = os.path.splitext(os.path.basename(video_path))[0]
+            output_filename = f"{video_basename}_with_audio.mp4"
+            output_path = str(self.output_dir / output_filename)
+            
+            print(f"   🎬 Merging scene {scene_num}...")
+            success = await self._merge_video_audio_async(video_path, audio_path, output_path)
+            
+            if success:
+                result["final_video_path"] = output_path
+                print(f"   ✅ Scene {scene_num} merged: {output_filename}")
+            else:
+                print(f"   ⚠️  Failed to merge scene {scene_num}")
+        else:
+            if not video_path:
+                print(f"   ⚠️  No video path for scene {scene_num}")
+            if not audio_path:
+                print(f"   ⚠️  No audio path for scene {scene_num}")
+    
+    def _build_video_prompt(self, scene: Dict[str, Any]) -> str:
+        """
+        Build comprehensive video prompt from scene description.
         
-        return ". ".join(parts)
+        Args:
+            scene: Scene dictionary with all details
+            
+        Returns:
+            Complete video generation prompt
+        """
+        return ". ".join(
+            f"{label}: {value}"
+            for key, label in self.VIDEO_PROMPT_FIELDS
+            if (value := scene.get(key))
+        )
     
     def _generate_scene_audio_from_video(
         self,
@@ -594,11 +970,9 @@ class AssetGenerator:
             print(f"  🎵 Generating audio from video with Mirelo...")
             print(f"     Prompt: {text_prompt[:100]}...")
             
-            # Step 1: Create customer asset (like testing_mirelo.py)
-            customer_asset_id, upload_url = self.mirelo.create_customer_asset()
-            
-            # Step 2: Upload video
-            self.mirelo.upload_video(upload_url, video_path)
+            # Steps 1-2: Create customer asset and upload video (like testing_mirelo.py),
+            # skipped when this exact video was uploaded before
+            customer_asset_id = self.mirelo.ensure_uploaded(video_path)
             
             # Step 3: Generate SFX from video (like testing_mirelo.py)
             audio_urls = self.mirelo.generate_sfx_from_video(
@@ -615,7 +989,7 @@ class AssetGenerator:
                 audio_url = audio_urls[0]  # Use first audio file
                 filename = f"audio_{customer_asset_id}_scene.mp3"
                 save_path = self.output_dir / filename
-                self.mirelo.download_file(audio_url, str(save_path))
+                self.mirelo.download_file(audio_url, str(save_path), session=self.session)
                 audio_files["audio"] = str(save_path)
                 print(f"  ✅ Audio saved: {save_path}")
             else:
@@ -623,7 +997,6 @@ class AssetGenerator:
         
         except Exception as e:
             print(f"  ⚠️  Failed to generate audio with Mirelo: {e}")
-            import traceback
             traceback.print_exc()
         
         return audio_files
@@ -636,6 +1009,26 @@ class AssetGenerator:
     ) -> bool:
         """
         Merge video and audio using FFmpeg (like testing_mirelo.py).
+        Blocking wrapper around _merge_video_audio_async().
+        
+        Args:
+            video_path: Path to video file
+            audio_path: Path to audio file
+            output_path: Path for output video with audio
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return asyncio.run(self._merge_video_audio_async(video_path, audio_path, output_path))
+    
+    async def _merge_video_audio_async(
+        self,
+        video_path: str,
+        audio_path: str,
+        output_path: str
+    ) -> bool:
+        """
+        Merge video and audio using FFmpeg without blocking the event loop.
         
         Args:
             video_path: Path to video file
@@ -645,40 +1038,41 @@ class AssetGenerator:
         Returns:
             bool: True if successful, False otherwise
         """
+        if not _ffmpeg_available():
+            _print_ffmpeg_install_hint()
+            return False
+        
+        # Write to a temporary name and rename on success, so an interrupted
+        # merge never leaves a truncated file under the final name.
+        # The extension stays last so FFmpeg still picks the right container.
+        root, ext = os.path.splitext(output_path)
+        temp_output_path = f"{root}.tmp{ext}"
+        
         try:
             # FFmpeg command to merge video and audio (like testing_mirelo.py)
-            cmd = [
-                "ffmpeg",
+            cmd = (
+                _ffmpeg_bin(),
                 "-i", video_path,      # Input video
                 "-i", audio_path,      # Input audio
-                "-c:v", "copy",        # Copy video codec (no re-encoding)
-                "-c:a", "aac",         # Convert audio to AAC
-                "-map", "0:v:0",       # Map video from first input
-                "-map", "1:a:0",       # Map audio from second input
-                "-shortest",           # End when shortest stream ends
-                "-y",                  # Overwrite output file
-                output_path
-            ]
+                *_MERGE_OUTPUT_ARGS,
+                temp_output_path
+            )
             
             # Run FFmpeg
-            subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            await _run_subprocess(cmd)
+            os.replace(temp_output_path, output_path)
             
             return True
             
         except subprocess.CalledProcessError as e:
             print(f"   ❌ FFmpeg error: {e.stderr}")
             return False
-        except FileNotFoundError:
-            print(f"   ❌ FFmpeg not found. Please install FFmpeg:")
-            print(f"      Windows: choco install ffmpeg")
-            print(f"      Mac: brew install ffmpeg")
-            print(f"      Linux: apt-get install ffmpeg")
-            return False
         except Exception as e:
             print(f"   ❌ Merge failed: {str(e)}")
             return False
+        finally:
+            if os.path.exists(temp_output_path):
+                try:
+                    os.unlink(temp_output_path)
+                except OSError:
+                    pass
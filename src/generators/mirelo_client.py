@@ -3,11 +3,344 @@ Mirelo API Client for Audio/Music Generation.
 Based on scripts/testing_audio/testing_mirelo.py
 """
 
+import asyncio
+import functools
+import hashlib
+import http.client
+import json
+import mmap
+import random
 import requests
+import shutil
 import time
 import os
+import uuid
+from types import MappingProxyType
+from urllib.parse import urlsplit
 from typing import Dict, List, Optional, Any
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import aiofiles
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+
+# Bytes read from the network per write when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# API paths relative to base_url, resolved once per client
+ENDPOINT_PATHS = {
+    "create_asset": "/create-customer-asset",
+    "v2sfx": "/video-to-sfx",
+    "sfx": "/audio/sound-effects",
+    "voice": "/audio/voice",
+    "tasks": "/tasks",
+}
+
+# Static headers for video uploads to pre-signed URLs (Content-Length is added per file)
+VIDEO_UPLOAD_HEADERS = MappingProxyType({"Content-Type": "video/mp4"})
+
+# (connect, read) timeouts in seconds per kind of call: connects fail fast
+# so retries kick in, reads allow for how long each endpoint really takes
+TIMEOUTS = {
+    "control": (5, 30),     # create-customer-asset
+    "upload": (10, 600),    # video PUT to the pre-signed URL
+    "generate": (10, 300),  # synchronous generation endpoints
+    "status": (5, 10),      # task status checks
+    "download": (10, 300),  # generated audio downloads
+}
+AIOHTTP_TIMEOUTS = {
+    kind: aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    for kind, (connect, read) in TIMEOUTS.items()
+}
+
+# Transient HTTP statuses (rate limits, gateway errors) worth retrying;
+# any other 4xx is a real error and fails immediately
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# POSTs start billed, non-idempotent generations: a read timeout or a gateway
+# error may mean the server is still working on it, so only a rate limit
+# (the request was rejected outright) or a failed connect is re-sent
+POST_RETRY_STATUSES = (429,)
+
+
+class _PostSafeRetry(Retry):
+    """
+    urllib3 Retry that re-sends POST only on connect failures and
+    POST_RETRY_STATUSES; other methods follow the full policy.
+    """
+    
+    def _is_method_retryable(self, method: str) -> bool:
+        # Gates read retries; connect retries never reach the server, so
+        # urllib3 applies them to every method regardless
+        if method.upper() == "POST":
+            return False
+        return super()._is_method_retryable(method)
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return bool(self.total) and status_code in POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Retry transient failures with backoff, honouring Retry-After on 429/503
+RETRY_POLICY = _PostSafeRetry(
+    total=5,
+    connect=3,
+    read=3,
+    status=5,
+    backoff_factor=0.8,
+    status_forcelist=RETRY_STATUSES,
+    respect_retry_after_header=True,
+    allowed_methods=frozenset(["GET", "PUT"])
+)
+
+
+class _TransientError(Exception):
+    """A failure worth retrying: a transient response status or a connection error."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Connection errors raised before the request reached the server, so even a
+# POST can be re-sent safely (ConnectionTimeoutError needs aiohttp 3.10+)
+CONNECT_ERRORS = (aiohttp.ClientConnectorError,) + (
+    (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, "ConnectionTimeoutError") else ()
+)
+
+
+def _raise_if_transient(
+    response: aiohttp.ClientResponse,
+    error_prefix: str,
+    statuses: tuple = RETRY_STATUSES
+) -> None:
+    """
+    Raise _TransientError for a retriable response status.
+    
+    Args:
+        response: aiohttp response
+        error_prefix: Message prefix for the raised exception
+        statuses: Statuses to retry (POST_RETRY_STATUSES for POSTs)
+    """
+    if response.status not in statuses:
+        return
+    
+    retry_after = response.headers.get("Retry-After", "")
+    raise _TransientError(
+        f"{error_prefix}: HTTP {response.status}",
+        float(retry_after) if retry_after.isdigit() else None
+    )
+
+
+def _retry_transient(max_attempts: int = 4, base: float = 1.0):
+    """
+    Retry a coroutine method on _TransientError.
+    
+    Waits for the server's Retry-After when given, otherwise backs off
+    exponentially from base seconds, with jitter. The last failure is re-raised.
+    
+    Args:
+        max_attempts: Total attempts including the first (default: 4)
+        base: First backoff delay in seconds (default: 1.0)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except _TransientError as e:
+                    if attempt == max_attempts:
+                        raise
+                    delay = e.retry_after if e.retry_after is not None else base * 2 ** (attempt - 1)
+                    await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+        return wrapper
+    return decorator
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """Encode a request body as UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(body: bytes) -> Any:
+    """Decode a JSON response body (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+# Free-text payload fields normalized for cache keys: the API receives the
+# original text, but "Upbeat  synth " and "upbeat synth" share a cache entry
+NORMALIZED_CACHE_FIELDS = frozenset(["text_prompt", "description", "text", "voice_style", "mood", "style"])
+
+
+def _normalize_text(text: str) -> str:
+    """Trim, collapse internal whitespace and lowercase text."""
+    return " ".join(text.lower().split())
+
+
+def _cache_key(endpoint: str, payload: Any) -> str:
+    """
+    SHA-256 of an endpoint and its normalized JSON payload.
+    
+    Free-text fields (NORMALIZED_CACHE_FIELDS) are normalized with
+    _normalize_text() and whole-number floats become ints (7.0 == 7), so
+    trivially different requests hit the same entry.
+    
+    Args:
+        endpoint: Request URL
+        payload: JSON-serializable request body
+        
+    Returns:
+        Hex digest identifying the request
+    """
+    if isinstance(payload, dict):
+        payload = {
+            key: _normalize_text(value) if key in NORMALIZED_CACHE_FIELDS and isinstance(value, str)
+            else int(value) if isinstance(value, float) and value.is_integer()
+            else value
+            for key, value in payload.items()
+        }
+    
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(endpoint.encode("utf-8") + b"|" + blob).hexdigest()
+
+
+def _load_cached(cache_dir: Optional[Path], key: str) -> Optional[Any]:
+    """
+    Read a cached API result.
+    
+    Args:
+        cache_dir: Cache directory (None when caching is disabled)
+        key: Key from _cache_key()
+        
+    Returns:
+        Cached result, or None on a miss
+    """
+    if cache_dir is None:
+        return None
+    
+    cache_path = cache_dir / f"{key}.json"
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(cache_dir: Optional[Path], key: str, result: Any) -> None:
+    """
+    Write an API result to the cache atomically (failures are ignored).
+    
+    Args:
+        cache_dir: Cache directory (None when caching is disabled)
+        key: Key from _cache_key()
+        result: JSON-serializable result
+    """
+    if cache_dir is None:
+        return
+    
+    cache_path = cache_dir / f"{key}.json"
+    # Unique temp name so concurrent writers never share a partial file
+    temp_path = cache_dir / f"{key}.{uuid.uuid4().hex}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(result), encoding="utf-8")
+        temp_path.replace(cache_path)
+    except OSError as e:
+        print(f"   ⚠️  Could not write Mirelo cache entry: {e}")
+
+
+def _file_sha256(path: str) -> str:
+    """
+    SHA-256 of a file without loading it into memory.
+    
+    Uses hashlib.file_digest (Python 3.11+), which hashes in C from a reused
+    buffer with OpenSSL's hardware-accelerated SHA-256 where available. Older
+    versions read into one reused 1 MiB buffer instead.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        sha = hashlib.sha256()
+        buffer = bytearray(1 << 20)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            sha.update(view[:size])
+        return sha.hexdigest()
+
+
+def _upload_cache_key(video_path: str, content_type: str) -> str:
+    """
+    Cache key for an uploaded file: its contents and content type.
+    
+    Args:
+        video_path: File to upload
+        content_type: Content type it is uploaded as
+        
+    Returns:
+        Key for _load_cached()/_store_cached()
+    """
+    return _cache_key("upload", {"sha256": _file_sha256(video_path), "content_type": content_type})
+
+
+def _cached_file_path(cache_dir: Optional[Path], url: str, save_path: str) -> Optional[Path]:
+    """
+    Cache location of a downloaded file, keyed on the SHA-256 of its URL.
+    
+    Args:
+        cache_dir: Cache directory (None when caching is disabled)
+        url: Download URL
+        save_path: Requested local path (its extension is kept)
+        
+    Returns:
+        Path inside the cache, or None when caching is disabled
+    """
+    if cache_dir is None:
+        return None
+    
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return cache_dir / "files" / f"{digest}{Path(save_path).suffix}"
+
+
+def _copy_atomic(src: Path, dst: Path) -> None:
+    """
+    Copy src to dst through a unique temp file and os.replace.
+    
+    The cache and the caller's file never share an inode, so later writes to
+    either one (e.g. re-downloading to the same save_path) cannot corrupt the
+    other, and readers never see a partially written file.
+    
+    Args:
+        src: Existing file
+        dst: Destination path (replaced if it exists)
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = dst.with_name(f"{dst.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        shutil.copyfile(src, temp_path)
+        os.replace(temp_path, dst)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
 class MireloClient:
@@ -16,20 +349,55 @@ class MireloClient:
     Uses the same API structure as testing_mirelo.py
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://api.mirelo.ai"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.mirelo.ai",
+        cache_dir: Optional[str] = None,
+        sendfile_uploads: bool = True
+    ):
         """
         Initialize Mirelo client.
         
         Args:
             api_key: Mirelo API key
             base_url: Base URL for Mirelo API (default: https://api.mirelo.ai)
+            cache_dir: Directory for caching generation results and downloads,
+                keyed on the request (e.g. ~/.cache/mirelo). Disabled when None.
+                Cached results hold Mirelo URLs, so entries last only as long as
+                those URLs stay valid.
+            sendfile_uploads: Upload to plain-HTTP pre-signed URLs with
+                socket.sendfile (zero-copy on Linux) (default: True)
         """
         self.api_key = api_key
         self.base_url = base_url
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._sendfile_uploads = sendfile_uploads
+        self._endpoints = {name: f"{base_url}{path}" for name, path in ENDPOINT_PATHS.items()}
         self.headers = {
             "Content-Type": "application/json",
             "x-api-key": api_key  # Mirelo uses x-api-key header (like testing_mirelo.py)
         }
+        
+        # One pooled session for all calls, so TCP/TLS connections are reused
+        # instead of re-established per request. Headers stay per call: the
+        # API key must not be sent to pre-signed upload or download URLs.
+        # requests negotiates Accept-Encoding (gzip/deflate, plus br when
+        # brotli is installed) on its own, so JSON responses arrive compressed.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=RETRY_POLICY)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "MireloClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def create_customer_asset(self, content_type: str = "video/mp4") -> tuple:
         """
@@ -41,24 +409,24 @@ class MireloClient:
         Returns:
             tuple: (customer_asset_id, upload_url)
         """
-        url = f"{self.base_url}/create-customer-asset"
+        url = self._endpoints["create_asset"]
         
         payload = {
             "contentType": content_type
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=self.headers,
-                json=payload,
-                timeout=60
+                data=_json_dumps(payload),
+                timeout=TIMEOUTS["control"]
             )
             
             if response.status_code != 200:
                 raise Exception(f"Failed to create customer asset: {response.status_code}, {response.text}")
             
-            data = response.json()
+            data = _json_loads(response.content)
             customer_asset_id = data.get("customer_asset_id")
             upload_url = data.get("upload_url")
             
@@ -83,20 +451,39 @@ class MireloClient:
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video not found: {video_path}")
         
-        with open(video_path, "rb") as f:
-            video_data = f.read()
+        size = os.path.getsize(video_path)
+        if size == 0:
+            raise Exception(f"Video is empty: {video_path}")
         
+        # Explicit Content-Length keeps the PUT non-chunked: pre-signed URLs
+        # reject Transfer-Encoding: chunked
         headers = {
-            "Content-Type": "video/mp4"
+            **VIDEO_UPLOAD_HEADERS,
+            "Content-Length": str(size)
         }
         
+        if self._sendfile_uploads and upload_url.startswith("http://"):
+            status_code, response_text = self._sendfile_put(upload_url, video_path, headers)
+            if status_code not in [200, 204]:
+                raise Exception(f"Upload failed: {status_code}, {response_text}")
+            return True
+        
         try:
-            response = requests.put(
-                upload_url,
-                data=video_data,
-                headers=headers,
-                timeout=300
-            )
+            # Memory-map the video and send it as a single memoryview: the
+            # socket reads straight from the page cache instead of Python
+            # copying the file out block by block into new bytes objects
+            with open(video_path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                
+                with memoryview(mapped) as body:
+                    response = self._session.put(
+                        upload_url,
+                        data=body,
+                        headers=headers,
+                        timeout=TIMEOUTS["upload"]
+                    )
             
             if response.status_code not in [200, 204]:
                 raise Exception(f"Upload failed: {response.status_code}, {response.text}")
@@ -105,6 +492,100 @@ class MireloClient:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Mirelo video upload failed: {str(e)}")
     
+    @staticmethod
+    def _sendfile_put(upload_url: str, video_path: str, headers: Dict[str, str]) -> tuple:
+        """
+        PUT a file to a plain-HTTP URL with socket.sendfile.
+        
+        On Linux this is sendfile(2): the kernel copies from the page cache to
+        the socket without passing the bytes through Python. Only for http://
+        URLs; TLS has to encrypt in user space, so HTTPS keeps the session path.
+        
+        Args:
+            upload_url: Plain-HTTP pre-signed URL
+            video_path: Path to local video file
+            headers: Request headers (including Content-Length)
+            
+        Returns:
+            tuple: (status_code, response_text)
+        """
+        parsed = urlsplit(upload_url)
+        path = f"{parsed.path or '/'}?{parsed.query}" if parsed.query else (parsed.path or "/")
+        connect_timeout, read_timeout = TIMEOUTS["upload"]
+        
+        connection = http.client.HTTPConnection(
+            parsed.hostname, parsed.port or 80, timeout=connect_timeout
+        )
+        try:
+            connection.putrequest("PUT", path)
+            for name, value in headers.items():
+                connection.putheader(name, value)
+            connection.endheaders()
+            
+            connection.sock.settimeout(read_timeout)
+            with open(video_path, "rb") as f:
+                connection.sock.sendfile(f)
+            
+            response = connection.getresponse()
+            return response.status, response.read().decode("utf-8", errors="replace")
+        except (OSError, http.client.HTTPException) as e:
+            raise Exception(f"Mirelo video upload failed: {str(e)}")
+        finally:
+            connection.close()
+    
+    def ensure_uploaded(self, video_path: str, content_type: str = "video/mp4") -> str:
+        """
+        Upload a video once and return its customer asset ID (steps 1 and 2).
+        
+        With a cache_dir, the asset ID is remembered per file contents
+        (SHA-256) and content type, so regenerating audio for an unchanged
+        video skips both create_customer_asset and the upload.
+        
+        Args:
+            video_path: Path to local video file
+            content_type: Content type (default: "video/mp4")
+            
+        Returns:
+            str: customer_asset_id usable with generate_sfx_from_video
+        """
+        cache_key = _upload_cache_key(video_path, content_type) if self._cache_dir else None
+        if cache_key:
+            cached = _load_cached(self._cache_dir, cache_key)
+            if cached is not None:
+                return cached
+        
+        customer_asset_id, upload_url = self.create_customer_asset(content_type)
+        self.upload_video(upload_url, video_path)
+        
+        if cache_key:
+            _store_cached(self._cache_dir, cache_key, customer_asset_id)
+        return customer_asset_id
+    
+    def produce_sfx(
+        self,
+        video_path: str,
+        text_prompt: str,
+        content_type: str = "video/mp4",
+        **kwargs
+    ) -> List[str]:
+        """
+        Run all three steps (create asset, upload, generate) for one video.
+        
+        With a cache_dir, the upload cache is checked first, so a cache hit
+        creates no customer asset and uploads nothing (see ensure_uploaded).
+        
+        Args:
+            video_path: Path to local video file
+            text_prompt: Text description for audio generation
+            content_type: Content type (default: "video/mp4")
+            **kwargs: Additional arguments for generate_sfx_from_video
+            
+        Returns:
+            list: URLs to generated audio files
+        """
+        customer_asset_id = self.ensure_uploaded(video_path, content_type)
+        return self.generate_sfx_from_video(customer_asset_id, text_prompt, **kwargs)
+    
     def generate_sfx_from_video(
         self,
         customer_asset_id: str,
@@ -128,7 +609,7 @@ class MireloClient:
         Returns:
             list: URLs to generated audio files
         """
-        url = f"{self.base_url}/video-to-sfx"
+        url = self._endpoints["v2sfx"]
         
         payload = {
             "customer_asset_id": customer_asset_id,
@@ -140,27 +621,63 @@ class MireloClient:
             "return_audio_only": False
         }
         
+        cache_key = _cache_key(url, payload)
+        cached = _load_cached(self._cache_dir, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=self.headers,
-                json=payload,
-                timeout=300
+                data=_json_dumps(payload),
+                timeout=TIMEOUTS["generate"]
             )
             
             if response.status_code != 201:
                 raise Exception(f"SFX generation failed: {response.status_code}, {response.text}")
             
-            data = response.json()
+            data = _json_loads(response.content)
             output_paths = data.get("output_paths", [])
             
             if not output_paths:
                 raise Exception(f"No audio files generated: {data}")
             
+            _store_cached(self._cache_dir, cache_key, output_paths)
             return output_paths
         except requests.exceptions.RequestException as e:
             raise Exception(f"Mirelo SFX generation failed: {str(e)}")
     
+    def generate_sfx_batch(
+        self,
+        customer_asset_id: str,
+        prompts: List[str],
+        **kwargs
+    ) -> List[List[str]]:
+        """
+        Generate sound effects for several prompts against one uploaded video.
+        
+        The video is uploaded once (create_customer_asset + upload_video) and
+        the prompts are sent concurrently over the pooled session.
+        
+        Args:
+            customer_asset_id: ID from create_customer_asset
+            prompts: Text descriptions, one generation per prompt
+            **kwargs: Additional arguments for generate_sfx_from_video
+            
+        Returns:
+            list: Audio URL lists, one per prompt (in prompt order)
+        """
+        if not prompts:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(prompts))) as executor:
+            futures = [
+                executor.submit(self.generate_sfx_from_video, customer_asset_id, prompt, **kwargs)
+                for prompt in prompts
+            ]
+            return [future.result() for future in futures]
+    
     def generate_music(
         self,
         description: str,
@@ -205,7 +722,7 @@ class MireloClient:
         Returns:
             Dictionary with sound effect generation result
         """
-        url = f"{self.base_url}/audio/sound-effects"
+        url = self._endpoints["sfx"]
         
         payload = {
             "description": description,
@@ -215,15 +732,22 @@ class MireloClient:
         if duration:
             payload["duration"] = duration
         
+        cache_key = _cache_key(url, payload)
+        cached = _load_cached(self._cache_dir, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=self.headers,
-                json=payload,
-                timeout=120
+                data=_json_dumps(payload),
+                timeout=TIMEOUTS["generate"]
             )
             response.raise_for_status()
-            return response.json()
+            result = _json_loads(response.content)
+            _store_cached(self._cache_dir, cache_key, result)
+            return result
         except requests.exceptions.RequestException as e:
             raise Exception(f"Mirelo sound effect generation failed: {str(e)}")
     
@@ -246,7 +770,7 @@ class MireloClient:
         Returns:
             Dictionary with voice generation result
         """
-        url = f"{self.base_url}/audio/voice"
+        url = self._endpoints["voice"]
         
         payload = {
             "text": text,
@@ -258,15 +782,22 @@ class MireloClient:
         if speed:
             payload["speed"] = speed
         
+        cache_key = _cache_key(url, payload)
+        cached = _load_cached(self._cache_dir, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=self.headers,
-                json=payload,
-                timeout=120
+                data=_json_dumps(payload),
+                timeout=TIMEOUTS["generate"]
             )
             response.raise_for_status()
-            return response.json()
+            result = _json_loads(response.content)
+            _store_cached(self._cache_dir, cache_key, result)
+            return result
         except requests.exceptions.RequestException as e:
             raise Exception(f"Mirelo voice generation failed: {str(e)}")
     
@@ -280,16 +811,16 @@ class MireloClient:
         Returns:
             Dictionary with task status
         """
-        url = f"{self.base_url}/tasks/{task_id}"
+        url = f"{self._endpoints['tasks']}/{task_id}"
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
                 headers=self.headers,
-                timeout=30
+                timeout=TIMEOUTS["status"]
             )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to check task status: {str(e)}")
     
@@ -297,20 +828,27 @@ class MireloClient:
         self,
         task_id: str,
         poll_interval: int = 3,
-        max_wait: int = 300
+        max_wait: int = 300,
+        initial_delay: float = 0.5,
+        backoff: float = 1.7
     ) -> Dict[str, Any]:
         """
         Wait for a task to complete.
         
         Args:
             task_id: Task ID from generation request
-            poll_interval: Seconds between status checks (default: 3)
+            poll_interval: Maximum seconds between status checks (default: 3)
             max_wait: Maximum seconds to wait (default: 300 = 5 minutes)
+            initial_delay: Seconds before the second status check (default: 0.5)
+            backoff: Factor the delay grows by after each check (default: 1.7)
             
         Returns:
             Dictionary with completed task result
         """
-        start_time = time.time()
+        # Poll quickly at first and back off towards poll_interval, so fast
+        # tasks return almost immediately and slow ones are polled rarely
+        deadline = time.monotonic() + max_wait
+        delay = initial_delay
         
         while True:
             status = self.check_task_status(task_id)
@@ -320,33 +858,821 @@ class MireloClient:
             elif status.get("status") == "failed":
                 raise Exception(f"Task failed: {status.get('error', 'Unknown error')}")
             
-            elapsed = time.time() - start_time
-            if elapsed > max_wait:
+            if time.monotonic() > deadline:
+                raise Exception(f"Task timeout after {max_wait} seconds")
+            
+            # Jitter keeps many concurrent pollers from hitting the API in lockstep
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * backoff, poll_interval)
+    
+    def wait_for_completion_many(
+        self,
+        task_ids: List[str],
+        poll_interval: int = 3,
+        max_wait: int = 300,
+        initial_delay: float = 0.5,
+        backoff: float = 1.7
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several tasks at once.
+        
+        Each round checks every pending task concurrently and then sleeps
+        once, so K tasks share one backoff schedule instead of K.
+        
+        Args:
+            task_ids: Task IDs from generation requests
+            (other arguments as in wait_for_completion)
+            
+        Returns:
+            Dictionary of task ID to final status; failed tasks are included
+            with status "failed" rather than aborting the others
+        """
+        results = {}
+        pending = list(dict.fromkeys(task_ids))
+        if not pending:
+            return results
+        
+        deadline = time.monotonic() + max_wait
+        delay = initial_delay
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+            while True:
+                statuses = executor.map(self.check_task_status, pending)
+                still_pending = []
+                for task_id, status in zip(pending, statuses):
+                    if status.get("status") in ("completed", "failed"):
+                        results[task_id] = status
+                    else:
+                        still_pending.append(task_id)
+                pending = still_pending
+                
+                if not pending:
+                    return results
+                
+                if time.monotonic() > deadline:
+                    raise Exception(f"Tasks timeout after {max_wait} seconds: {', '.join(pending)}")
+                
+                time.sleep(delay + random.uniform(0, delay * 0.1))
+                delay = min(delay * backoff, poll_interval)
+    
+    def wait_for_completion_longpoll(
+        self,
+        task_id: str,
+        max_wait: int = 300,
+        per_request_wait: int = 25
+    ) -> Dict[str, Any]:
+        """
+        Wait for a task to complete using long-poll requests.
+        
+        Each status request asks the server to hold the connection for up to
+        per_request_wait seconds, so a task costs one round-trip per wait
+        window instead of one per poll. Falls back to wait_for_completion()
+        when the API rejects the wait parameter (4xx/501) or answers a pending
+        task immediately (long-polling not supported).
+        
+        Args:
+            task_id: Task ID from generation request
+            max_wait: Maximum seconds to wait (default: 300 = 5 minutes)
+            per_request_wait: Seconds the server may hold each request (default: 25)
+            
+        Returns:
+            Dictionary with completed task result
+        """
+        url = f"{self._endpoints['tasks']}/{task_id}"
+        deadline = time.monotonic() + max_wait
+        
+        while True:
+            wait = max(1, min(per_request_wait, int(deadline - time.monotonic())))
+            request_start = time.monotonic()
+            
+            try:
+                response = self._session.get(
+                    url,
+                    headers=self.headers,
+                    params={"wait": wait},
+                    timeout=(TIMEOUTS["status"][0], wait + 10)
+                )
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Failed to check task status: {str(e)}")
+            
+            if response.status_code == 501 or 400 <= response.status_code < 500:
+                break
+            
+            try:
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Failed to check task status: {str(e)}")
+            
+            status = _json_loads(response.content)
+            
+            if status.get("status") == "completed":
+                return status
+            elif status.get("status") == "failed":
+                raise Exception(f"Task failed: {status.get('error', 'Unknown error')}")
+            
+            if time.monotonic() > deadline:
                 raise Exception(f"Task timeout after {max_wait} seconds")
             
-            time.sleep(poll_interval)
+            # A pending answer well inside the wait window means the server
+            # ignored the wait parameter; looping here would hammer the API
+            if time.monotonic() - request_start < wait / 2:
+                break
+        
+        remaining = max(1, int(deadline - time.monotonic()))
+        return self.wait_for_completion(task_id, max_wait=remaining)
     
-    def download_file(self, url: str, save_path: str) -> str:
+    def download_file(
+        self,
+        url: str,
+        save_path: str,
+        session: Optional[requests.Session] = None
+    ) -> str:
         """
         Download a file from URL.
         
         Args:
             url: URL to download from
             save_path: Local path to save file
+            session: Optional requests.Session to use instead of the client's own
             
         Returns:
             Path to saved file
         """
+        # A cached copy of this URL is copied into place instead of re-downloaded
+        cached_file = _cached_file_path(self._cache_dir, url, save_path)
+        if cached_file is not None and cached_file.exists():
+            _copy_atomic(cached_file, Path(save_path))
+            return save_path
+        
         try:
-            response = requests.get(url, timeout=120, stream=True)
+            http = session or self._session
+            response = http.get(url, timeout=TIMEOUTS["download"], stream=True)
             response.raise_for_status()
             
             Path(save_path).parent.mkdir(parents=True, exist_ok=True)
             
             with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                # 1 MiB chunks: memory stays flat for large videos, with far
+                # fewer write calls than 8 KiB chunks
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
             
+            if cached_file is not None:
+                try:
+                    _copy_atomic(Path(save_path), cached_file)
+                except OSError as e:
+                    print(f"   ⚠️  Could not cache download: {e}")
+            
+            return save_path
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Failed to download file: {str(e)}")
+    
+    def download_file_parallel(
+        self,
+        url: str,
+        save_path: str,
+        num_parts: int = 4,
+        min_part_bytes: int = 8 << 20,
+        session: Optional[requests.Session] = None
+    ) -> str:
+        """
+        Download a large file as concurrent HTTP Range requests.
+        
+        Each part streams into its own offset of a preallocated file, so one
+        slow TCP connection no longer bounds the transfer. Falls back to
+        download_file() when the server does not support ranges, the file is
+        smaller than num_parts * min_part_bytes, the file is cached, or the
+        platform has no os.pwrite (Windows).
+        
+        Args:
+            url: URL to download from
+            save_path: Local path to save file
+            num_parts: Number of concurrent range requests (default: 4)
+            min_part_bytes: Smallest part worth its own request (default: 8 MiB)
+            session: Optional requests.Session to use instead of the client's own
+            
+        Returns:
+            Path to saved file
+        """
+        http = session or self._session
+        cached_file = _cached_file_path(self._cache_dir, url, save_path)
+        
+        if not hasattr(os, "pwrite") or (cached_file is not None and cached_file.exists()):
+            return self.download_file(url, save_path, session=session)
+        
+        try:
+            total = self._ranged_size(url, http)
+            if total is None or total < num_parts * min_part_bytes:
+                return self.download_file(url, save_path, session=session)
+            
+            Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+            part_size = -(-total // num_parts)  # Ceiling division
+            
+            fd = os.open(save_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.ftruncate(fd, total)
+                with ThreadPoolExecutor(max_workers=num_parts) as pool:
+                    futures = [
+                        pool.submit(
+                            self._download_range,
+                            http,
+                            url,
+                            fd,
+                            start,
+                            min(start + part_size, total) - 1
+                        )
+                        for start in range(0, total, part_size)
+                    ]
+                    for future in futures:
+                        future.result()
+            except BaseException:
+                os.close(fd)
+                # A preallocated file has the full size, so never leave a partial one
+                os.unlink(save_path)
+                raise
+            os.close(fd)
+            
+            if cached_file is not None:
+                try:
+                    _copy_atomic(Path(save_path), cached_file)
+                except OSError as e:
+                    print(f"   ⚠️  Could not cache download: {e}")
+            
             return save_path
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to download file: {str(e)}")
+    
+    @staticmethod
+    def _ranged_size(url: str, http: requests.Session) -> Optional[int]:
+        """
+        Probe a URL with a one-byte Range request (pre-signed URLs are often
+        signed for GET only, so HEAD is not used).
+        
+        Args:
+            url: URL to probe
+            http: Session to send the request with
+            
+        Returns:
+            Total size in bytes, or None if the server does not support ranges
+        """
+        response = http.get(url, headers={"Range": "bytes=0-0"}, timeout=TIMEOUTS["status"], stream=True)
+        with response:
+            if response.status_code != 206:
+                return None
+            # Content-Range: bytes 0-0/<total>
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+            return int(total) if total.isdigit() else None
+    
+    @staticmethod
+    def _download_range(
+        http: requests.Session,
+        url: str,
+        fd: int,
+        start: int,
+        end: int
+    ) -> None:
+        """
+        Download bytes start..end (inclusive) of a URL into the same offsets of fd.
+        
+        Args:
+            http: Session to send the request with
+            url: URL to download from
+            fd: File descriptor of the preallocated output file
+            start: First byte of the range
+            end: Last byte of the range
+        """
+        response = http.get(
+            url,
+            headers={"Range": f"bytes={start}-{end}"},
+            timeout=TIMEOUTS["download"],
+            stream=True
+        )
+        with response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise Exception(f"Range request not honored: {response.status_code}")
+            
+            offset = start
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+        
+        if offset != end + 1:
+            raise Exception(f"Incomplete range {start}-{end}: got {offset - start} bytes")
+
+
+class AsyncMireloClient:
+    """
+    asyncio variant of MireloClient built on aiohttp.
+    
+    Calls do not block the event loop, so uploads, polls and downloads for
+    many clips can run concurrently under asyncio.gather(). Use it as an
+    async context manager so the connection pool is closed:
+    
+        async with AsyncMireloClient(api_key) as client:
+            asset_id, upload_url = await client.create_customer_asset()
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.mirelo.ai",
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Initialize async Mirelo client.
+        
+        Args:
+            api_key: Mirelo API key
+            base_url: Base URL for Mirelo API (default: https://api.mirelo.ai)
+            cache_dir: Directory for caching generation results and downloads,
+                keyed on the request (e.g. ~/.cache/mirelo). Disabled when None.
+                Cached results hold Mirelo URLs, so entries last only as long as
+                those URLs stay valid.
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._endpoints = {name: f"{base_url}{path}" for name, path in ENDPOINT_PATHS.items()}
+        self.headers = {
+            "Content-Type": "application/json",
+            "x-api-key": api_key
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use (needs a running loop)."""
+        if self._session is None or self._session.closed:
+            # Keep-alive connections are shared by all concurrent calls;
+            # aiohttp negotiates and decodes compressed responses by itself
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    keepalive_timeout=75
+                )
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> "AsyncMireloClient":
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    @_retry_transient()
+    async def create_customer_asset(self, content_type: str = "video/mp4") -> tuple:
+        """
+        Step 1: Create a customer asset and get upload URL.
+        
+        Args:
+            content_type: Content type (default: "video/mp4")
+            
+        Returns:
+            tuple: (customer_asset_id, upload_url)
+        """
+        url = self._endpoints["create_asset"]
+        
+        payload = {
+            "contentType": content_type
+        }
+        
+        try:
+            async with self._get_session().post(
+                url,
+                headers=self.headers,
+                data=_json_dumps(payload),
+                timeout=AIOHTTP_TIMEOUTS["control"]
+            ) as response:
+                _raise_if_transient(response, "Mirelo create customer asset failed", POST_RETRY_STATUSES)
+                if response.status != 200:
+                    raise Exception(f"Failed to create customer asset: {response.status}, {await response.text()}")
+                
+                data = _json_loads(await response.read())
+            
+            customer_asset_id = data.get("customer_asset_id")
+            upload_url = data.get("upload_url")
+            
+            if not customer_asset_id or not upload_url:
+                raise Exception(f"Unexpected response: {data}")
+            
+            return customer_asset_id, upload_url
+        except CONNECT_ERRORS as e:
+            raise _TransientError(f"Mirelo create customer asset failed: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Mirelo create customer asset failed: {str(e)}")
+    
+    async def upload_video(self, upload_url: str, video_path: str) -> bool:
+        """
+        Step 2: Upload video file to the pre-signed URL, streamed from disk.
+        
+        Args:
+            upload_url: Pre-signed URL from create_customer_asset
+            video_path: Path to local video file
+            
+        Returns:
+            bool: True if successful
+        """
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video not found: {video_path}")
+        
+        # Explicit Content-Length keeps the PUT non-chunked
+        headers = {
+            **VIDEO_UPLOAD_HEADERS,
+            "Content-Length": str(os.path.getsize(video_path))
+        }
+        
+        async def read_chunks():
+            async with aiofiles.open(video_path, "rb") as f:
+                while chunk := await f.read(DOWNLOAD_CHUNK_SIZE):
+                    yield chunk
+        
+        try:
+            async with self._get_session().put(
+                upload_url,
+                data=read_chunks(),
+                headers=headers,
+                timeout=AIOHTTP_TIMEOUTS["upload"]
+            ) as response:
+                if response.status not in [200, 204]:
+                    raise Exception(f"Upload failed: {response.status}, {await response.text()}")
+            
+            return True
+        except aiohttp.ClientError as e:
+            raise Exception(f"Mirelo video upload failed: {str(e)}")
+    
+    async def ensure_uploaded(self, video_path: str, content_type: str = "video/mp4") -> str:
+        """
+        Upload a video once and return its customer asset ID (steps 1 and 2).
+        
+        Args:
+            (same as MireloClient.ensure_uploaded)
+            
+        Returns:
+            str: customer_asset_id usable with generate_sfx_from_video
+        """
+        cache_key = None
+        if self._cache_dir:
+            # Hashing a large video is disk-bound, so keep it off the event loop
+            cache_key = await asyncio.to_thread(_upload_cache_key, video_path, content_type)
+            cached = _load_cached(self._cache_dir, cache_key)
+            if cached is not None:
+                return cached
+        
+        customer_asset_id, upload_url = await self.create_customer_asset(content_type)
+        await self.upload_video(upload_url, video_path)
+        
+        if cache_key:
+            _store_cached(self._cache_dir, cache_key, customer_asset_id)
+        return customer_asset_id
+    
+    async def produce_sfx(
+        self,
+        video_path: str,
+        text_prompt: str,
+        content_type: str = "video/mp4",
+        **kwargs
+    ) -> List[str]:
+        """
+        Run all three steps (create asset, upload, generate) for one video.
+        
+        Args:
+            (same as MireloClient.produce_sfx)
+            
+        Returns:
+            list: URLs to generated audio files
+        """
+        customer_asset_id = await self.ensure_uploaded(video_path, content_type)
+        return await self.generate_sfx_from_video(customer_asset_id, text_prompt, **kwargs)
+    
+    @_retry_transient()
+    async def generate_sfx_from_video(
+        self,
+        customer_asset_id: str,
+        text_prompt: str,
+        model_version: str = "1.5",
+        num_samples: int = 1,
+        duration: int = 10,
+        creativity_coef: int = 5
+    ) -> List[str]:
+        """
+        Step 3: Generate sound effects from uploaded video.
+        
+        Args:
+            (same as MireloClient.generate_sfx_from_video)
+        
+        Returns:
+            list: URLs to generated audio files
+        """
+        url = self._endpoints["v2sfx"]
+        
+        payload = {
+            "customer_asset_id": customer_asset_id,
+            "text_prompt": text_prompt,
+            "model_version": model_version,
+            "num_samples": num_samples,
+            "duration": duration,
+            "creativity_coef": creativity_coef,
+            "return_audio_only": False
+        }
+        
+        cache_key = _cache_key(url, payload)
+        cached = _load_cached(self._cache_dir, cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with self._get_session().post(
+                url,
+                headers=self.headers,
+                data=_json_dumps(payload),
+                timeout=AIOHTTP_TIMEOUTS["generate"]
+            ) as response:
+                _raise_if_transient(response, "Mirelo SFX generation failed", POST_RETRY_STATUSES)
+                if response.status != 201:
+                    raise Exception(f"SFX generation failed: {response.status}, {await response.text()}")
+                
+                data = _json_loads(await response.read())
+            
+            output_paths = data.get("output_paths", [])
+            
+            if not output_paths:
+                raise Exception(f"No audio files generated: {data}")
+            
+            _store_cached(self._cache_dir, cache_key, output_paths)
+            return output_paths
+        except CONNECT_ERRORS as e:
+            raise _TransientError(f"Mirelo SFX generation failed: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Mirelo SFX generation failed: {str(e)}")
+    
+    async def generate_sfx_batch(
+        self,
+        customer_asset_id: str,
+        prompts: List[str],
+        **kwargs
+    ) -> List[List[str]]:
+        """
+        Generate sound effects for several prompts against one uploaded video,
+        all requests in flight at once.
+        
+        Args:
+            (same as MireloClient.generate_sfx_batch)
+            
+        Returns:
+            list: Audio URL lists, one per prompt (in prompt order)
+        """
+        return list(await asyncio.gather(*(
+            self.generate_sfx_from_video(customer_asset_id, prompt, **kwargs)
+            for prompt in prompts
+        )))
+    
+    @_retry_transient()
+    async def _post_json(self, url: str, payload: Dict[str, Any], error_prefix: str) -> Dict[str, Any]:
+        """
+        POST a JSON payload and return the decoded JSON response (cached
+        when the client has a cache_dir).
+        
+        Args:
+            url: Endpoint URL
+            payload: Request body
+            error_prefix: Message prefix for raised exceptions
+            
+        Returns:
+            Decoded JSON response
+        """
+        cache_key = _cache_key(url, payload)
+        cached = _load_cached(self._cache_dir, cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with self._get_session().post(
+                url,
+                headers=self.headers,
+                data=_json_dumps(payload),
+                timeout=AIOHTTP_TIMEOUTS["generate"]
+            ) as response:
+                _raise_if_transient(response, error_prefix, POST_RETRY_STATUSES)
+                response.raise_for_status()
+                result = _json_loads(await response.read())
+            
+            _store_cached(self._cache_dir, cache_key, result)
+            return result
+        except CONNECT_ERRORS as e:
+            raise _TransientError(f"{error_prefix}: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"{error_prefix}: {str(e)}")
+    
+    async def generate_sound_effect(
+        self,
+        description: str,
+        duration: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate sound effect using Mirelo API.
+        
+        Args:
+            (same as MireloClient.generate_sound_effect)
+            
+        Returns:
+            Dictionary with sound effect generation result
+        """
+        payload = {
+            "description": description,
+            **kwargs
+        }
+        
+        if duration:
+            payload["duration"] = duration
+        
+        return await self._post_json(
+            self._endpoints["sfx"], payload, "Mirelo sound effect generation failed"
+        )
+    
+    async def generate_voice(
+        self,
+        text: str,
+        voice_style: Optional[str] = None,
+        speed: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate voice/narration using Mirelo API.
+        
+        Args:
+            (same as MireloClient.generate_voice)
+            
+        Returns:
+            Dictionary with voice generation result
+        """
+        payload = {
+            "text": text,
+            **kwargs
+        }
+        
+        if voice_style:
+            payload["voice_style"] = voice_style
+        if speed:
+            payload["speed"] = speed
+        
+        return await self._post_json(
+            self._endpoints["voice"], payload, "Mirelo voice generation failed"
+        )
+    
+    @_retry_transient()
+    async def check_task_status(self, task_id: str) -> Dict[str, Any]:
+        """
+        Check status of a generation task.
+        
+        Args:
+            task_id: Task ID from generation request
+            
+        Returns:
+            Dictionary with task status
+        """
+        try:
+            async with self._get_session().get(
+                f"{self._endpoints['tasks']}/{task_id}",
+                headers=self.headers,
+                timeout=AIOHTTP_TIMEOUTS["status"]
+            ) as response:
+                _raise_if_transient(response, "Failed to check task status")
+                response.raise_for_status()
+                return _json_loads(await response.read())
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise _TransientError(f"Failed to check task status: {str(e)}")
+        except aiohttp.ClientError as e:
+            raise Exception(f"Failed to check task status: {str(e)}")
+    
+    async def wait_for_completion(
+        self,
+        task_id: str,
+        poll_interval: int = 3,
+        max_wait: int = 300,
+        initial_delay: float = 0.5,
+        backoff: float = 1.7
+    ) -> Dict[str, Any]:
+        """
+        Wait for a task to complete without blocking the event loop.
+        
+        Args:
+            task_id: Task ID from generation request
+            poll_interval: Maximum seconds between status checks (default: 3)
+            max_wait: Maximum seconds to wait (default: 300 = 5 minutes)
+            initial_delay: Seconds before the second status check (default: 0.5)
+            backoff: Factor the delay grows by after each check (default: 1.7)
+            
+        Returns:
+            Dictionary with completed task result
+        """
+        # Poll quickly at first and back off towards poll_interval, so fast
+        # tasks return almost immediately and slow ones are polled rarely
+        deadline = time.monotonic() + max_wait
+        delay = initial_delay
+        
+        while True:
+            status = await self.check_task_status(task_id)
+            
+            if status.get("status") == "completed":
+                return status
+            elif status.get("status") == "failed":
+                raise Exception(f"Task failed: {status.get('error', 'Unknown error')}")
+            
+            if time.monotonic() > deadline:
+                raise Exception(f"Task timeout after {max_wait} seconds")
+            
+            # Jitter keeps many concurrent pollers from hitting the API in lockstep
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * backoff, poll_interval)
+    
+    async def wait_for_completion_many(
+        self,
+        task_ids: List[str],
+        poll_interval: int = 3,
+        max_wait: int = 300,
+        initial_delay: float = 0.5,
+        backoff: float = 1.7
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several tasks at once, checking all pending tasks
+        concurrently each round.
+        
+        Args:
+            (same as MireloClient.wait_for_completion_many)
+            
+        Returns:
+            Dictionary of task ID to final status (failed tasks included)
+        """
+        results = {}
+        pending = list(dict.fromkeys(task_ids))
+        deadline = time.monotonic() + max_wait
+        delay = initial_delay
+        
+        while pending:
+            statuses = await asyncio.gather(*(self.check_task_status(task_id) for task_id in pending))
+            still_pending = []
+            for task_id, status in zip(pending, statuses):
+                if status.get("status") in ("completed", "failed"):
+                    results[task_id] = status
+                else:
+                    still_pending.append(task_id)
+            pending = still_pending
+            
+            if not pending:
+                break
+            
+            if time.monotonic() > deadline:
+                raise Exception(f"Tasks timeout after {max_wait} seconds: {', '.join(pending)}")
+            
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * backoff, poll_interval)
+        
+        return results
+    
+    async def download_file(self, url: str, save_path: str) -> str:
+        """
+        Download a file from URL, streaming it to disk.
+        
+        Args:
+            url: URL to download from
+            save_path: Local path to save file
+            
+        Returns:
+            Path to saved file
+        """
+        cached_file = _cached_file_path(self._cache_dir, url, save_path)
+        if cached_file is not None and cached_file.exists():
+            _copy_atomic(cached_file, Path(save_path))
+            return save_path
+        
+        try:
+            async with self._get_session().get(
+                url,
+                timeout=AIOHTTP_TIMEOUTS["download"]
+            ) as response:
+                response.raise_for_status()
+                
+                Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+                
+                async with aiofiles.open(save_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+            
+            if cached_file is not None:
+                try:
+                    _copy_atomic(Path(save_path), cached_file)
+                except OSError as e:
+                    print(f"   ⚠️  Could not cache download: {e}")
+            
+            return save_path
+        except aiohttp.ClientError as e:
+            raise Exception(f"Failed to download file: {str(e)}")
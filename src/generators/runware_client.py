@@ -8,12 +8,642 @@ IMPORTANT: Runware API uses a specific structure:
 - Each request needs taskType and taskUUID
 """
 
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import os
+import random
 import requests
+import shutil
 import time
 import uuid
 import base64
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit
+
+import aiofiles
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+# Bytes read from the network per write when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Retry transient failures (rate limits, gateway errors) with backoff. POST is
+# left out of urllib3's default allowed methods on purpose: a retried
+# inference request could be billed twice.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504)
+)
+
+# (connect, read) timeouts in seconds per kind of call. A short connect
+# timeout fails fast on an unreachable endpoint; read timeouts leave room for
+# slow generations. Batched calls add BATCH_READ_TIMEOUT per extra task.
+TIMEOUTS = {
+    "image": (5, 120),      # imageInference
+    "video": (5, 300),      # videoInference (videos take longer)
+    "status": (5, 15),      # getResponse status checks
+    "upload": (5, 60),      # imageUpload
+    "download": (5, 120),   # generated files from the CDN
+}
+BATCH_READ_TIMEOUT = 15
+
+# Consecutive failed status checks tolerated while waiting for a task
+STATUS_CHECK_RETRIES = 5
+
+# Request bodies at least this large are gzip-compressed when the client is
+# created with compress_requests=True (in practice: image upload payloads)
+COMPRESS_MIN_BYTES = 64 * 1024
+
+# Completed task results remembered per client, so waiting on a task that
+# already finished needs no status request
+COMPLETED_CACHE_SIZE = 1024
+
+# Seconds the async client collects concurrent status checks into one request
+STATUS_BATCH_WINDOW = 0.05
+
+# Result URL fields Runware may use, in order of preference
+_URL_KEYS = ("imageURL", "imageUrl", "videoURL", "videoUrl", "url", "outputURL", "outputUrl")
+_URL_KEY_SET = frozenset(_URL_KEYS)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """Encode a request body as UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(body: bytes) -> Any:
+    """Decode a JSON response body (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _extract_url(task_data: Dict[str, Any]) -> Optional[str]:
+    """First non-empty result URL of a task entry, or None."""
+    return next((task_data[key] for key in _URL_KEYS if task_data.get(key)), None)
+
+
+def _image_task(
+    prompt: str,
+    model: str,
+    width: int,
+    height: int,
+    num_images: int,
+    reference_images: Optional[List[str]],
+    negative_prompt: Optional[str],
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Build an imageInference task (arguments as in RunwareClient.generate_image).
+    
+    Returns:
+        Task dictionary with a fresh taskUUID
+    """
+    # Generate unique task UUID. Kept in the canonical hyphenated form: the
+    # API documents taskUUID as a UUIDv4 string, and responses are matched
+    # back to tasks by comparing taskUUID strings
+    task_uuid = str(uuid.uuid4())
+    
+    # Build payload - similar to scripts/testing_image/dynamic_campaign.py
+    payload_data = {
+        "taskType": "imageInference",
+        "taskUUID": task_uuid,
+        "model": model,
+        "positivePrompt": prompt,  # Runware uses positivePrompt, not prompt
+        "width": width,
+        "height": height,
+        "numberResults": num_images,  # Runware uses numberResults, not num_images
+        "outputType": "URL",  # Return image as URL
+        **kwargs
+    }
+    
+    # Add referenceImages if provided (for image-to-image, like in scripts)
+    if reference_images:
+        payload_data["referenceImages"] = reference_images
+    
+    # Add negativePrompt if provided
+    if negative_prompt:
+        payload_data["negativePrompt"] = negative_prompt
+    
+    return payload_data
+
+
+def _video_task(
+    prompt: str,
+    model: str,
+    duration: int,
+    width: int,
+    height: int,
+    image_uuid: Optional[str],
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Build a videoInference task (arguments as in RunwareClient.generate_video).
+    
+    Returns:
+        Task dictionary with a fresh taskUUID
+    """
+    # Generate unique task UUID
+    task_uuid = str(uuid.uuid4())
+    
+    # Build payload - MUST be an array (similar to testing_runware_.py)
+    payload_data = {
+        "taskType": "videoInference",
+        "taskUUID": task_uuid,
+        "model": model,
+        "positivePrompt": prompt,  # Runware uses positivePrompt
+        "duration": duration,
+        "width": width,
+        "height": height,
+        "outputType": "URL",
+        "outputFormat": "MP4",
+        "deliveryMethod": "async",  # REQUIRED for video
+        "numberResults": 1,
+        **kwargs
+    }
+    
+    # Add frameImages if image_uuid provided (exactly like testing_runware_.py)
+    if image_uuid:
+        payload_data["frameImages"] = [
+            {
+                "inputImage": image_uuid,
+                "frame": "first"
+            }
+        ]
+    
+    return payload_data
+
+
+def _is_url(image_path: str) -> bool:
+    """Whether an upload source is a public http(s) URL rather than a local file."""
+    return urlsplit(image_path).scheme in ("http", "https")
+
+
+def _upload_task(image_path: str) -> Dict[str, Any]:
+    """
+    Build an imageUpload task.
+    
+    A public URL is passed through as-is for Runware to fetch, so the image
+    is neither read nor base64-encoded locally. Local files are encoded as
+    base64.
+    
+    Args:
+        image_path: Path to local image file, or public image URL
+        
+    Returns:
+        Task dictionary with a fresh taskUUID
+    """
+    if _is_url(image_path):
+        return {
+            "taskType": "imageUpload",
+            "taskUUID": str(uuid.uuid4()),
+            "image": image_path
+        }
+    
+    with open(image_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            image_b64 = ""  # Empty files cannot be memory-mapped
+        else:
+            # Encode straight from a memory map: base64 reads the page cache in
+            # one C-level call, without first copying the file into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                image_b64 = base64.b64encode(mapped).decode("ascii")
+    
+    return {
+        "taskType": "imageUpload",
+        "taskUUID": str(uuid.uuid4()),
+        "image": image_b64
+    }
+
+
+def _file_digest(path: str) -> str:
+    """
+    BLAKE2b (128-bit) digest of a file without loading it into memory.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        
+        digest = hashlib.blake2b(digest_size=16)
+        buffer = bytearray(1 << 20)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+        return digest.hexdigest()
+
+
+def _upload_digest(image_path: str) -> str:
+    """
+    Upload cache key: the file's content digest, or a digest of the URL.
+    
+    Args:
+        image_path: Path to local image file, or public image URL
+        
+    Returns:
+        Hex digest
+    """
+    if _is_url(image_path):
+        return hashlib.blake2b(f"url:{image_path}".encode("utf-8"), digest_size=16).hexdigest()
+    
+    if not Path(image_path).exists():
+        raise FileNotFoundError(f"Image not found: {image_path}")
+    return _file_digest(image_path)
+
+
+def _load_upload_uuid(cache_dir: Optional[Path], digest: str) -> Optional[str]:
+    """
+    Read the imageUUID cached on disk for an image's contents.
+    
+    Args:
+        cache_dir: Cache directory (None when the disk cache is disabled)
+        digest: Digest from _upload_digest()
+        
+    Returns:
+        Cached image UUID, or None on a miss
+    """
+    if cache_dir is None:
+        return None
+    
+    try:
+        return json.loads((cache_dir / "uploads" / f"{digest}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _store_upload_uuid(cache_dir: Optional[Path], digest: str, image_uuid: str) -> None:
+    """
+    Write an image's imageUUID to the disk cache atomically (failures are ignored).
+    
+    One small file per digest, replaced atomically, so concurrent processes
+    never see a half-written entry and need no lock.
+    
+    Args:
+        cache_dir: Cache directory (None when the disk cache is disabled)
+        digest: Digest from _upload_digest()
+        image_uuid: UUID Runware returned for the upload
+    """
+    if cache_dir is None:
+        return
+    
+    upload_dir = cache_dir / "uploads"
+    cache_path = upload_dir / f"{digest}.json"
+    temp_path = upload_dir / f"{digest}.{uuid.uuid4().hex}.tmp"
+    try:
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(image_uuid), encoding="utf-8")
+        temp_path.replace(cache_path)
+    except OSError as e:
+        logger.warning("Could not write Runware upload cache entry: %s", e)
+
+
+def _batch_timeout(kind: str, task_count: int) -> Tuple[float, float]:
+    """(connect, read) timeout for a request carrying task_count tasks of one kind."""
+    connect, read = TIMEOUTS[kind]
+    return connect, read + BATCH_READ_TIMEOUT * (task_count - 1)
+
+
+def _request_body(
+    payload: List[Dict[str, Any]],
+    headers: Dict[str, str],
+    compress: bool
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Encode a task array, gzip-compressing large bodies when enabled.
+    
+    Level 1 is enough here: base64 text only has 6 bits of information per
+    byte, so gzip wins back about a quarter of an upload payload, and
+    higher levels cost CPU without shrinking image data much further.
+    
+    Args:
+        payload: Task array
+        headers: Request headers
+        compress: Whether large bodies may be compressed
+        
+    Returns:
+        tuple: (request body, request headers)
+    """
+    body = _json_dumps(payload)
+    if not compress or len(body) < COMPRESS_MIN_BYTES:
+        return body, headers
+    
+    return gzip.compress(body, compresslevel=1), {**headers, "Content-Encoding": "gzip"}
+
+
+def _error_detail(response: requests.Response) -> Any:
+    """Decoded JSON error body of a failed response, or its text."""
+    body = response.content
+    try:
+        return _json_loads(body)
+    except ValueError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _data_list(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Task entries of a decoded response (Runware uses "data" or "results")."""
+    return result.get("data") or result.get("results") or []
+
+
+def _tasks_by_uuid(data_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index the task entries of a response by taskUUID.
+    
+    Built once per response, so matching N tasks against a batched
+    response costs O(N) instead of one scan of the list per task.
+    
+    Args:
+        data_list: Entries from _data_list()
+        
+    Returns:
+        Dictionary of taskUUID to entry (entries without one are skipped)
+    """
+    return {
+        item["taskUUID"]: item
+        for item in data_list
+        if isinstance(item, dict) and "taskUUID" in item
+    }
+
+
+def _image_result(result: Dict[str, Any], task_uuid: str) -> Dict[str, Any]:
+    """
+    Interpret an imageInference response.
+    
+    Args:
+        result: Decoded API response
+        task_uuid: taskUUID that was sent
+        
+    Returns:
+        Dictionary with taskUUID and status ("completed" with url, or "processing")
+    """
+    # Extract data from response (can be in "data" or "results" key)
+    data_list = _data_list(result)
+    if data_list and len(data_list) > 0:
+        task_data = data_list[0]
+        
+        # Check if image is already ready (like testing_runware_.py checks for videos)
+        # Images might be returned immediately or need async polling
+        image_url = _extract_url(task_data)
+        
+        if image_url:
+            # Image is ready immediately - return it
+            return {
+                "taskUUID": task_data.get("taskUUID", task_uuid),
+                "taskType": task_data.get("taskType", "imageInference"),
+                "url": image_url,
+                "imageURL": image_url,
+                "status": "completed",
+                "response": result
+            }
+        
+        # Image not ready yet - return taskUUID for polling
+        return {
+            "taskUUID": task_data.get("taskUUID", task_uuid),
+            "taskType": task_data.get("taskType", "imageInference"),
+            "status": "processing",
+            "response": result
+        }
+    
+    return {"taskUUID": task_uuid, "status": "processing", "response": result}
+
+
+def _video_result(result: Dict[str, Any], task_uuid: str) -> Dict[str, Any]:
+    """
+    Interpret a videoInference response.
+    
+    Args:
+        result: Decoded API response
+        task_uuid: taskUUID that was sent
+        
+    Returns:
+        Dictionary with taskUUID for polling
+    """
+    # Extract data from response
+    data_list = _data_list(result)
+    if data_list and len(data_list) > 0:
+        task_data = data_list[0]
+        return {
+            "taskUUID": task_data.get("taskUUID", task_uuid),
+            "taskType": task_data.get("taskType", "videoInference"),
+            "response": result
+        }
+    
+    return {"taskUUID": task_uuid, "response": result}
+
+
+def _task_status_result(result: Dict[str, Any], task_uuid: str) -> Dict[str, Any]:
+    """
+    Interpret a getResponse (status check) response.
+    
+    Args:
+        result: Decoded API response
+        task_uuid: Task UUID that was checked
+        
+    Returns:
+        Status entry of the task (or the error info)
+    """
+    # Check for errors array FIRST (Runware returns errors separately)
+    if "errors" in result and result["errors"]:
+        # Return error info but don't raise yet (let wait_for_completion handle it)
+        return {
+            "status": "error",
+            "errors": result["errors"],
+            **result
+        }
+    
+    # Extract data from response
+    data_list = _data_list(result)
+    if data_list and len(data_list) > 0:
+        # Find task by UUID if multiple items; first item if UUID not found
+        return _tasks_by_uuid(data_list).get(task_uuid, data_list[0])
+    
+    return result
+
+
+def _task_status_results(result: Dict[str, Any], task_uuids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Split a getResponse response for several tasks into per-task entries.
+    
+    Args:
+        result: Decoded API response
+        task_uuids: Task UUIDs that were checked
+        
+    Returns:
+        Dictionary of task UUID to its error info, its status entry, or just
+        {"taskUUID": ...} when the response did not mention it yet
+    """
+    items = _tasks_by_uuid(_data_list(result))
+    statuses = {
+        task_uuid: items.get(task_uuid, {"taskUUID": task_uuid})
+        for task_uuid in task_uuids
+    }
+    
+    # Errors win over data, as in _task_status_result; an error without a
+    # taskUUID concerns the whole request and so every task in it
+    for error in result.get("errors") or []:
+        task_uuid = error.get("taskUUID")
+        if task_uuid in statuses:
+            statuses[task_uuid] = {"status": "error", "errors": [error]}
+        elif task_uuid is None:
+            for task_uuid in task_uuids:
+                statuses[task_uuid] = {"status": "error", "errors": [{**error, "taskUUID": task_uuid}]}
+    
+    return statuses
+
+
+def _remember_completed(
+    completed: "OrderedDict[str, Dict[str, Any]]",
+    result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Record a completed task result, evicting the oldest beyond COMPLETED_CACHE_SIZE.
+    
+    Args:
+        completed: Per-client completion cache
+        result: Completed task result (with taskUUID)
+        
+    Returns:
+        The result, for use in return statements
+    """
+    completed[result["taskUUID"]] = result
+    completed.move_to_end(result["taskUUID"])
+    while len(completed) > COMPLETED_CACHE_SIZE:
+        completed.popitem(last=False)
+    return result
+
+
+def _uploaded_image_uuid(result: Dict[str, Any]) -> str:
+    """
+    Extract the imageUUID from an imageUpload response.
+    
+    Args:
+        result: Decoded API response
+        
+    Returns:
+        Image UUID
+    """
+    data_list = _data_list(result)
+    if not data_list or "imageUUID" not in data_list[0]:
+        raise Exception(f"Unexpected upload response: {result}")
+    
+    return data_list[0]["imageUUID"]
+
+
+def _completion_state(status_result: Any, task_uuid: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Interpret one status check while waiting for a task.
+    
+    Args:
+        status_result: Result of check_task_status
+        task_uuid: Task UUID being waited for
+        
+    Returns:
+        tuple: (task_status, completed result or None while still running)
+        
+    Raises:
+        Exception: If the task failed
+    """
+    # Runware returns data in "data" or "results" array, or directly
+    # Also check for errors array
+    if isinstance(status_result, dict):
+        # Check for errors first
+        if "errors" in status_result and status_result["errors"]:
+            for error in status_result["errors"]:
+                if error.get("taskUUID") == task_uuid:
+                    error_msg = error.get("error") or error.get("message") or "Unknown error"
+                    raise Exception(f"Task failed: {error_msg}")
+        
+        # Check data array
+        data_list = _data_list(status_result)
+        if data_list:
+            # Find our task in the data list
+            status = _tasks_by_uuid(data_list).get(task_uuid, data_list[0])
+        else:
+            status = status_result
+    else:
+        status = status_result
+    
+    # Check various status fields that Runware might use (like testing_runware_.py)
+    task_status = (
+        status.get("status") or 
+        status.get("taskStatus") or 
+        status.get("state") or
+        status.get("taskState")
+    )
+    
+    # Check if completed by looking for URLs (completed tasks have URLs)
+    has_url = not _URL_KEY_SET.isdisjoint(status.keys())
+    
+    # If status is "processing" or "pending", keep polling (like testing_runware_.py)
+    if task_status in ["processing", "pending"]:
+        return task_status, None
+    
+    if task_status in ["completed", "success", "done"] or has_url:
+        # Extract URLs from response
+        result = {
+            "status": "completed",
+            "taskUUID": task_uuid,
+            **status
+        }
+        
+        # Try to extract image/video URLs
+        url = _extract_url(status)
+        if url:
+            result["url"] = url
+        
+        return task_status, result
+    elif task_status in ["failed", "error"]:
+        error_msg = status.get("error") or status.get("errorMessage") or status.get("message") or "Unknown error"
+        raise Exception(f"Task failed: {error_msg}")
+    
+    return task_status, None
+
+
+def _poll_delay(poll_interval: float, max_interval: float, same_state_polls: int) -> float:
+    """
+    Seconds to wait before the next status check.
+    
+    The interval grows 1.5x for every poll that saw no state change (capped
+    at max_interval), so long video jobs are polled rarely while fresh
+    transitions are followed closely. Jitter spreads out concurrent pollers.
+    
+    Args:
+        poll_interval: Base interval in seconds
+        max_interval: Largest interval in seconds
+        same_state_polls: Consecutive polls without a state change
+        
+    Returns:
+        Delay in seconds
+    """
+    return min(max_interval, poll_interval * 1.5 ** same_state_polls) + random.uniform(0, 0.5)
+
+
+def _status_retry_delay(failures: int) -> float:
+    """Backoff (with jitter) after the given number of consecutive failed status checks."""
+    return min(60, 2 ** failures) + random.uniform(0, 0.5)
 
 
 class RunwareClient:
@@ -21,13 +651,23 @@ class RunwareClient:
     Client for Runware.ai API to generate images and videos.
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://api.runware.ai/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.runware.ai/v1",
+        cache_dir: Optional[str] = None,
+        compress_requests: bool = False
+    ):
         """
         Initialize Runware client.
         
         Args:
             api_key: Runware API key
             base_url: Base URL for Runware API (default: https://api.runware.ai/v1)
+            cache_dir: Directory for remembering uploaded image UUIDs across
+                runs, e.g. "~/.cache/adflow/runware" (default: None, in-memory only)
+            compress_requests: Gzip request bodies of COMPRESS_MIN_BYTES or more;
+                turned off again automatically if the API answers 415 (default: False)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')  # Remove trailing slash
@@ -35,6 +675,97 @@ class RunwareClient:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        
+        # Uploaded image UUIDs by file content digest: a product photo reused
+        # across many prompts is only uploaded once
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._upload_cache: Dict[str, str] = {}
+        self._completed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.compress_requests = compress_requests
+        
+        # One pooled session for all calls, so the TLS connection to the API is
+        # reused instead of re-established per request (upload, generate and
+        # every status poll). Headers stay per call: the bearer token must not
+        # be sent to the CDN URLs that results are downloaded from.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=RETRY_POLICY)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "RunwareClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _post(
+        self,
+        payload: List[Dict[str, Any]],
+        timeout: Tuple[float, float],
+        error_prefix: str
+    ) -> Dict[str, Any]:
+        """
+        POST a task array to the API.
+        
+        Args:
+            payload: Task array
+            timeout: (connect, read) timeout in seconds, usually from TIMEOUTS
+            error_prefix: Start of the exception message if the request fails
+            
+        Returns:
+            Decoded JSON response
+            
+        Raises:
+            Exception: If the request fails or the response is not JSON
+        """
+        try:
+            body, headers = _request_body(payload, self.headers, self.compress_requests)
+            response = self._session.post(self.base_url, headers=headers, data=body, timeout=timeout)
+            
+            # The API does not take compressed bodies: stop compressing, resend
+            if response.status_code == 415 and "Content-Encoding" in headers:
+                logger.warning("Runware API rejected a gzip request body, sending uncompressed")
+                self.compress_requests = False
+                response = self._session.post(
+                    self.base_url,
+                    headers=self.headers,
+                    data=_json_dumps(payload),
+                    timeout=timeout
+                )
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"{error_prefix}: {str(e)}")
+        
+        if not response.ok:
+            detail = _error_detail(response)
+            logger.error("%s: HTTP %s %s", error_prefix, response.status_code, detail)
+            # Payloads can carry base64 images, so they are only logged on request
+            logger.debug("Request payload: %s", payload)
+            # The error body carries the API's error code (e.g.
+            # failedToTransferImage), which callers match on
+            raise Exception(f"{error_prefix}: HTTP {response.status_code} {detail}")
+        
+        try:
+            return _json_loads(response.content)
+        except ValueError as e:
+            raise Exception(f"{error_prefix}: {str(e)}")
+    
+    def _cached_upload(self, digest: str) -> Optional[str]:
+        """Image UUID already uploaded for this content digest, or None."""
+        image_uuid = self._upload_cache.get(digest)
+        if image_uuid is None:
+            image_uuid = _load_upload_uuid(self._cache_dir, digest)
+            if image_uuid is not None:
+                self._upload_cache[digest] = image_uuid
+        return image_uuid
+    
+    def _remember_upload(self, digest: str, image_uuid: str) -> None:
+        """Cache the image UUID of a successful upload."""
+        self._upload_cache[digest] = image_uuid
+        _store_upload_uuid(self._cache_dir, digest, image_uuid)
     
     def generate_image(
         self,
@@ -64,103 +795,71 @@ class RunwareClient:
         Returns:
             Dictionary with image generation result including taskUUID
         """
-        # Runware API uses base_url directly, not sub-endpoints
-        url = self.base_url
-        
-        # Generate unique task UUID
-        task_uuid = str(uuid.uuid4())
+        payload = [_image_task(
+            prompt, model, width, height, num_images, reference_images, negative_prompt, **kwargs
+        )]
+        task_uuid = payload[0]["taskUUID"]
         
-        # Build payload - similar to scripts/testing_image/dynamic_campaign.py
-        payload_data = {
-            "taskType": "imageInference",
-            "taskUUID": task_uuid,
-            "model": model,
-            "positivePrompt": prompt,  # Runware uses positivePrompt, not prompt
-            "width": width,
-            "height": height,
-            "numberResults": num_images,  # Runware uses numberResults, not num_images
-            "outputType": "URL",  # Return image as URL
-            **kwargs
-        }
+        result = self._post(payload, timeout=TIMEOUTS["image"], error_prefix="Runware image generation failed")
         
-        # Add referenceImages if provided (for image-to-image, like in scripts)
-        if reference_images:
-            payload_data["referenceImages"] = reference_images
+        image_result = _image_result(result, task_uuid)
+        if image_result["status"] == "completed":
+            _remember_completed(self._completed, image_result)
+        return image_result
+    
+    def generate_images_batch(
+        self,
+        prompts: List[str],
+        model: str = "bfl:2@1",
+        width: int = 1024,
+        height: int = 1024,
+        num_images: int = 1,
+        reference_images: Optional[List[str]] = None,
+        negative_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate several images with a single request.
         
-        # Add negativePrompt if provided
-        if negative_prompt:
-            payload_data["negativePrompt"] = negative_prompt
+        All imageInference tasks go into one payload array, so N images pay
+        for one HTTP round-trip instead of N. Poll the returned taskUUIDs
+        together with wait_for_completion_many().
         
-        payload = [payload_data]
+        Args:
+            prompts: Image generation prompts
+            (other arguments as in generate_image, applied to every prompt)
+            
+        Returns:
+            Results in the same order as prompts, each as returned by generate_image
+        """
+        if not prompts:
+            return []
         
-        try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=120
+        # Payload MUST be an array - one imageInference task per prompt
+        payload = [
+            _image_task(
+                prompt, model, width, height, num_images, reference_images, negative_prompt, **kwargs
             )
-            
-            # Zeige detaillierte Fehlerinformationen
-            if not response.ok:
-                error_detail = "Unknown error"
-                try:
-                    error_detail = response.json()
-                except:
-                    error_detail = response.text
-                
-                print(f"❌ Runware API Error Details:")
-                print(f"   Status: {response.status_code}")
-                print(f"   Response: {error_detail}")
-                print(f"   Request Payload: {payload}")
-                
-            response.raise_for_status()
-            result = response.json()
-            
-            # Extract data from response (can be in "data" or "results" key)
-            data_list = result.get("data") or result.get("results") or []
-            if data_list and len(data_list) > 0:
-                task_data = data_list[0]
-                
-                # Check if image is already ready (like testing_runware_.py checks for videos)
-                # Images might be returned immediately or need async polling
-                image_url = (
-                    task_data.get("imageURL") or 
-                    task_data.get("imageUrl") or 
-                    task_data.get("url") or
-                    task_data.get("outputURL")
-                )
-                
-                if image_url:
-                    # Image is ready immediately - return it
-                    return {
-                        "taskUUID": task_data.get("taskUUID", task_uuid),
-                        "taskType": task_data.get("taskType", "imageInference"),
-                        "url": image_url,
-                        "imageURL": image_url,
-                        "status": "completed",
-                        "response": result
-                    }
-                
-                # Image not ready yet - return taskUUID for polling
-                return {
-                    "taskUUID": task_data.get("taskUUID", task_uuid),
-                    "taskType": task_data.get("taskType", "imageInference"),
-                    "status": "processing",
-                    "response": result
-                }
-            
-            return {"taskUUID": task_uuid, "status": "processing", "response": result}
-            
-        except requests.exceptions.RequestException as e:
-            # Zeige mehr Details über den Fehler
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_detail = e.response.json()
-                    print(f"❌ Runware API Error: {error_detail}")
-                except:
-                    print(f"❌ Runware API Error: {e.response.text}")
-            raise Exception(f"Runware image generation failed: {str(e)}")
+            for prompt in prompts
+        ]
+        
+        result = self._post(
+            payload,
+            timeout=_batch_timeout("image", len(payload)),
+            error_prefix="Runware image generation failed"
+        )
+        
+        # Match results to prompts by taskUUID (response order is not guaranteed)
+        items = _tasks_by_uuid(_data_list(result))
+        results = []
+        for task in payload:
+            item = items.get(task["taskUUID"])
+            task_result = _image_result({"data": [item]} if item else {}, task["taskUUID"])
+            task_result["response"] = result
+            if task_result["status"] == "completed":
+                _remember_completed(self._completed, task_result)
+            results.append(task_result)
+        return results
     
     def generate_video(
         self,
@@ -187,84 +886,16 @@ class RunwareClient:
         Returns:
             Dictionary with video generation result including taskUUID
         """
-        # Runware API uses base_url directly, not sub-endpoints
-        url = self.base_url
-        
-        # Generate unique task UUID
-        task_uuid = str(uuid.uuid4())
-        
-        # Build payload - MUST be an array (similar to testing_runware_.py)
-        payload_data = {
-            "taskType": "videoInference",
-            "taskUUID": task_uuid,
-            "model": model,
-            "positivePrompt": prompt,  # Runware uses positivePrompt
-            "duration": duration,
-            "width": width,
-            "height": height,
-            "outputType": "URL",
-            "outputFormat": "MP4",
-            "deliveryMethod": "async",  # REQUIRED for video
-            "numberResults": 1,
-            **kwargs
-        }
+        payload = [_video_task(prompt, model, duration, width, height, image_uuid, **kwargs)]
+        task_uuid = payload[0]["taskUUID"]
         
-        # Add frameImages if image_uuid provided (exactly like testing_runware_.py)
-        if image_uuid:
-            payload_data["frameImages"] = [
-                {
-                    "inputImage": image_uuid,
-                    "frame": "first"
-                }
-            ]
+        result = self._post(
+            payload,
+            timeout=TIMEOUTS["video"],
+            error_prefix="Runware video generation failed"
+        )
         
-        payload = [payload_data]
-        
-        try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=300  # Videos take longer
-            )
-            
-            # Zeige detaillierte Fehlerinformationen
-            if not response.ok:
-                error_detail = "Unknown error"
-                try:
-                    error_detail = response.json()
-                except:
-                    error_detail = response.text
-                
-                print(f"❌ Runware API Error Details:")
-                print(f"   Status: {response.status_code}")
-                print(f"   Response: {error_detail}")
-                print(f"   Request Payload: {payload}")
-                
-            response.raise_for_status()
-            result = response.json()
-            
-            # Extract data from response
-            data_list = result.get("data") or result.get("results") or []
-            if data_list and len(data_list) > 0:
-                task_data = data_list[0]
-                return {
-                    "taskUUID": task_data.get("taskUUID", task_uuid),
-                    "taskType": task_data.get("taskType", "videoInference"),
-                    "response": result
-                }
-            
-            return {"taskUUID": task_uuid, "response": result}
-            
-        except requests.exceptions.RequestException as e:
-            # Zeige mehr Details über den Fehler
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_detail = e.response.json()
-                    print(f"❌ Runware API Error: {error_detail}")
-                except:
-                    print(f"❌ Runware API Error: {e.response.text}")
-            raise Exception(f"Runware video generation failed: {str(e)}")
+        return _video_result(result, task_uuid)
     
     def check_task_status(self, task_uuid: str) -> Dict[str, Any]:
         """
@@ -276,9 +907,10 @@ class RunwareClient:
         Returns:
             Dictionary with task status
         """
-        # Runware uses POST for status checks too, with taskUUID in payload
-        url = self.base_url
+        if task_uuid in self._completed:
+            return self._completed[task_uuid]
         
+        # Runware uses POST for status checks too, with taskUUID in payload
         payload = [
             {
                 "taskType": "getResponse",  # Runware uses getResponse for status checks
@@ -286,154 +918,182 @@ class RunwareClient:
             }
         ]
         
-        try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+        result = self._post(payload, timeout=TIMEOUTS["status"], error_prefix="Failed to check task status")
+        
+        return _task_status_result(result, task_uuid)
+    
+    def check_tasks_status(self, task_uuids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Check the status of several tasks with a single request.
+        
+        Args:
+            task_uuids: Task UUIDs from generation requests
+            
+        Returns:
+            Dictionary of task UUID to task status (see _task_status_results)
+        """
+        # One getResponse task per UUID, all in one payload array
+        payload = [
+            {"taskType": "getResponse", "taskUUID": task_uuid}
+            for task_uuid in task_uuids
+        ]
+        
+        result = self._post(
+            payload,
+            timeout=_batch_timeout("status", len(payload)),
+            error_prefix="Failed to check task status"
+        )
+        
+        return _task_status_results(result, task_uuids)
+    
+    def wait_for_completion_many(
+        self,
+        task_uuids: List[str],
+        poll_interval: int = 5,
+        max_wait: int = 600,
+        max_interval: int = 30
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several tasks at once.
+        
+        Each round checks every pending task in one getResponse request, so
+        polling N tasks costs one request per round instead of N.
+        
+        Args:
+            task_uuids: Task UUIDs from generation requests
+            (other arguments as in wait_for_completion)
             
-            if not response.ok:
-                error_detail = "Unknown error"
+        Returns:
+            Dictionary of task UUID to completed result; failed tasks are
+            included with status "failed" rather than aborting the others
+        """
+        results = {
+            task_uuid: self._completed[task_uuid]
+            for task_uuid in task_uuids if task_uuid in self._completed
+        }
+        pending = [task_uuid for task_uuid in dict.fromkeys(task_uuids) if task_uuid not in results]
+        start_time = time.monotonic()
+        last_statuses: Dict[str, Optional[str]] = {}
+        same_state_polls = 0
+        failures = 0
+        
+        while pending:
+            try:
+                statuses = self.check_tasks_status(pending)
+            except Exception as e:
+                failures += 1
+                if failures > STATUS_CHECK_RETRIES or time.monotonic() - start_time > max_wait:
+                    raise
+                logger.warning(
+                    "Status check failed (%d/%d), retrying: %s", failures, STATUS_CHECK_RETRIES, e
+                )
+                time.sleep(_status_retry_delay(failures))
+                continue
+            failures = 0
+            
+            current_statuses = {}
+            for task_uuid in pending:
                 try:
-                    error_detail = response.json()
-                except:
-                    error_detail = response.text
-                print(f"⚠️  Status check error: {error_detail}")
+                    task_status, result = _completion_state(statuses[task_uuid], task_uuid)
+                except Exception as e:
+                    results[task_uuid] = {"status": "failed", "taskUUID": task_uuid, "error": str(e)}
+                    continue
+                if result is not None:
+                    results[task_uuid] = _remember_completed(self._completed, result)
+                else:
+                    current_statuses[task_uuid] = task_status
+            pending = list(current_statuses)
             
-            response.raise_for_status()
-            result = response.json()
-            
-            # Check for errors array FIRST (Runware returns errors separately)
-            if "errors" in result and result["errors"]:
-                # Return error info but don't raise yet (let wait_for_completion handle it)
-                return {
-                    "status": "error",
-                    "errors": result["errors"],
-                    **result
-                }
-            
-            # Extract data from response
-            data_list = result.get("data") or result.get("results") or []
-            if data_list and len(data_list) > 0:
-                # Find task by UUID if multiple items
-                for item in data_list:
-                    if item.get("taskUUID") == task_uuid:
-                        return item
-                # Return first item if UUID not found
-                return data_list[0]
-            
-            return result
+            if not pending:
+                break
             
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to check task status: {str(e)}")
+            elapsed = time.monotonic() - start_time
+            if elapsed > max_wait:
+                raise Exception(f"Tasks timeout after {max_wait} seconds: {', '.join(pending)}")
+            
+            # Back off while no task changes state, start over when any does
+            if current_statuses == last_statuses:
+                same_state_polls += 1
+            else:
+                last_statuses = current_statuses
+                same_state_polls = 0
+            
+            logger.debug("Poll pending=%d elapsed=%ds/%ds", len(pending), int(elapsed), max_wait)
+            time.sleep(_poll_delay(poll_interval, max_interval, same_state_polls))
+        
+        return results
     
     def wait_for_completion(
         self,
         task_uuid: str,
         poll_interval: int = 5,
-        max_wait: int = 600
+        max_wait: int = 600,
+        max_interval: int = 30
     ) -> Dict[str, Any]:
         """
         Wait for a task to complete.
         
         Args:
             task_uuid: Task UUID from generation request
-            poll_interval: Seconds between status checks (default: 5)
+            poll_interval: Initial seconds between status checks (default: 5)
             max_wait: Maximum seconds to wait (default: 600 = 10 minutes)
+            max_interval: Longest wait between checks while the state is unchanged (default: 30)
             
         Returns:
             Dictionary with completed task result including URLs
         """
-        start_time = time.time()
+        if task_uuid in self._completed:
+            return self._completed[task_uuid]
+        
+        start_time = time.monotonic()
+        last_status = None
+        same_state_polls = 0
+        failures = 0
         
         while True:
-            status_result = self.check_task_status(task_uuid)
-            
-            # Runware returns data in "data" or "results" array, or directly
-            # Also check for errors array
-            if isinstance(status_result, dict):
-                # Check for errors first
-                if "errors" in status_result and status_result["errors"]:
-                    for error in status_result["errors"]:
-                        if error.get("taskUUID") == task_uuid:
-                            error_msg = error.get("error") or error.get("message") or "Unknown error"
-                            raise Exception(f"Task failed: {error_msg}")
-                
-                # Check data array
-                data_list = status_result.get("data") or status_result.get("results") or []
-                if data_list:
-                    # Find our task in the data list
-                    for item in data_list:
-                        if item.get("taskUUID") == task_uuid:
-                            status = item
-                            break
-                    else:
-                        status = data_list[0] if data_list else status_result
-                else:
-                    status = status_result
-            else:
-                status = status_result
-            
-            # Check various status fields that Runware might use (like testing_runware_.py)
-            task_status = (
-                status.get("status") or 
-                status.get("taskStatus") or 
-                status.get("state") or
-                status.get("taskState")
-            )
-            
-            # Check if completed by looking for URLs (completed tasks have URLs)
-            has_url = any(key in status for key in ["url", "imageURL", "videoURL", "outputURL", "imageUrl", "videoUrl"])
-            
-            # If status is "processing" or "pending", continue polling (like testing_runware_.py)
-            if task_status in ["processing", "pending"]:
-                # Still processing, continue polling
-                elapsed = time.time() - start_time
-                if elapsed > max_wait:
-                    raise Exception(f"Task timeout after {max_wait} seconds")
-                print(f"   ⏳ Status: {task_status}... ({int(elapsed)}s / {max_wait}s)")
-                time.sleep(poll_interval)
+            try:
+                status_result = self.check_task_status(task_uuid)
+            except Exception as e:
+                # A failed status request says nothing about the task itself,
+                # so back off and ask again instead of abandoning the wait
+                failures += 1
+                if failures > STATUS_CHECK_RETRIES or time.monotonic() - start_time > max_wait:
+                    raise
+                logger.warning(
+                    "Status check failed (%d/%d), retrying: %s", failures, STATUS_CHECK_RETRIES, e
+                )
+                time.sleep(_status_retry_delay(failures))
                 continue
+            failures = 0
             
-            if task_status in ["completed", "success", "done"] or has_url:
-                # Extract URLs from response
-                result = {
-                    "status": "completed",
-                    "taskUUID": task_uuid,
-                    **status
-                }
-                
-                # Try to extract image/video URLs
-                if "imageURL" in status or "imageUrl" in status:
-                    result["url"] = status.get("imageURL") or status.get("imageUrl")
-                elif "videoURL" in status or "videoUrl" in status:
-                    result["url"] = status.get("videoURL") or status.get("videoUrl")
-                elif "url" in status:
-                    result["url"] = status["url"]
-                elif "outputURL" in status or "outputUrl" in status:
-                    result["url"] = status.get("outputURL") or status.get("outputUrl")
-                
-                return result
-            elif task_status in ["failed", "error"]:
-                error_msg = status.get("error") or status.get("errorMessage") or status.get("message") or "Unknown error"
-                raise Exception(f"Task failed: {error_msg}")
+            task_status, result = _completion_state(status_result, task_uuid)
+            if result is not None:
+                return _remember_completed(self._completed, result)
             
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed > max_wait:
                 raise Exception(f"Task timeout after {max_wait} seconds")
             
-            # Show progress
-            print(f"   ⏳ Waiting... ({int(elapsed)}s / {max_wait}s)")
-            time.sleep(poll_interval)
+            # Back off while the state stays the same, start over when it changes
+            if task_status == last_status:
+                same_state_polls += 1
+            else:
+                last_status = task_status
+                same_state_polls = 0
+            
+            logger.debug("Poll status=%s elapsed=%ds/%ds", task_status, int(elapsed), max_wait)
+            time.sleep(_poll_delay(poll_interval, max_interval, same_state_polls))
     
     def upload_image(self, image_path: str) -> str:
         """
         Upload an image to Runware and return its UUID.
         
+        Images whose contents were uploaded before are not sent again; the
+        cached UUID is returned instead. For an image that is already hosted,
+        pass its URL: Runware fetches it, so nothing is read or encoded here.
+        
         Args:
-            image_path: Path to local image file
+            image_path: Path to local image file, or public image URL
             
         Returns:
             Image UUID from Runware
@@ -441,64 +1101,483 @@ class RunwareClient:
         Raises:
             Exception: If upload fails
         """
-        if not Path(image_path).exists():
-            raise FileNotFoundError(f"Image not found: {image_path}")
+        digest = _upload_digest(image_path)
+        cached = self._cached_upload(digest)
+        if cached:
+            return cached
         
-        # Read and encode image as base64
-        with open(image_path, "rb") as f:
-            image_b64 = base64.b64encode(f.read()).decode("utf-8")
+        # Payload MUST be an array
+        payload = [_upload_task(image_path)]
         
-        # Generate unique task UUID
-        task_uuid = str(uuid.uuid4())
+        result = self._post(payload, timeout=TIMEOUTS["upload"], error_prefix="Failed to upload image")
         
-        # Payload MUST be an array
+        image_uuid = _uploaded_image_uuid(result)
+        
+        # Verify the image UUID is valid (check if we can access it)
+        # Sometimes Runware needs a moment to process the uploaded image
+        time.sleep(0.5)  # Small delay to ensure image is registered
+        
+        self._remember_upload(digest, image_uuid)
+        return image_uuid
+    
+    def upload_images(self, image_paths: List[str]) -> List[Optional[str]]:
+        """
+        Upload several images to Runware in a single request.
+        
+        All imageUpload tasks go into one payload array, so the batch pays for
+        one HTTP round-trip instead of one per image. Images uploaded before
+        (or repeated within the batch) are only sent once.
+        
+        Args:
+            image_paths: Paths to local image files, or public image URLs
+            
+        Returns:
+            Image UUIDs in the same order as image_paths (None for images
+            Runware did not return a UUID for)
+            
+        Raises:
+            Exception: If the upload request fails
+        """
+        if not image_paths:
+            return []
+        
+        digests = [_upload_digest(image_path) for image_path in image_paths]
+        
+        # Payload MUST be an array - one imageUpload task per image not yet uploaded
+        payload = []
+        task_digests = {}
+        for image_path, digest in zip(image_paths, digests):
+            if digest in task_digests.values() or self._cached_upload(digest):
+                continue
+            
+            task = _upload_task(image_path)
+            task_digests[task["taskUUID"]] = digest
+            payload.append(task)
+        
+        if not payload:
+            return [self._upload_cache[digest] for digest in digests]
+        
+        result = self._post(
+            payload,
+            timeout=_batch_timeout("upload", len(payload)),
+            error_prefix="Failed to upload images"
+        )
+        
+        # Match results to images by taskUUID (response order is not guaranteed)
+        for item in _data_list(result):
+            digest = task_digests.get(item.get("taskUUID"))
+            if digest and item.get("imageUUID"):
+                self._remember_upload(digest, item["imageUUID"])
+        
+        # Sometimes Runware needs a moment to process the uploaded images
+        time.sleep(0.5)  # Small delay to ensure images are registered
+        
+        return [self._upload_cache.get(digest) for digest in digests]
+    
+    def download_file(
+        self,
+        url: str,
+        save_path: str,
+        session: Optional[requests.Session] = None
+    ) -> str:
+        """
+        Download a file from URL.
+        
+        Args:
+            url: URL to download from
+            save_path: Local path to save file
+            session: Optional requests.Session to use instead of the client's own
+            
+        Returns:
+            Path to saved file
+        """
+        try:
+            http = session or self._session
+            response = http.get(url, timeout=TIMEOUTS["download"], stream=True)
+            response.raise_for_status()
+            
+            Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            # Copy the raw stream in C with a 1 MiB buffer instead of a Python
+            # loop over iter_content; decode_content keeps gzip handling intact
+            response.raw.decode_content = True
+            with open(save_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+            
+            return save_path
+        except (requests.exceptions.RequestException, Urllib3Error) as e:
+            raise Exception(f"Failed to download file: {str(e)}")
+
+
+class AsyncRunwareClient:
+    """
+    asyncio variant of RunwareClient built on aiohttp.
+    
+    Inference requests and their status polls do not block the event loop,
+    so many images/videos can be generated concurrently on one loop. Use it
+    as an async context manager so the connection pool is closed:
+    
+        async with AsyncRunwareClient(api_key) as client:
+            results = await client.generate_images_batch(prompts)
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.runware.ai/v1",
+        max_concurrency: int = 5,
+        cache_dir: Optional[str] = None,
+        compress_requests: bool = False
+    ):
+        """
+        Initialize async Runware client.
+        
+        Args:
+            api_key: Runware API key
+            base_url: Base URL for Runware API (default: https://api.runware.ai/v1)
+            max_concurrency: Generations in flight at once in generate_images_batch (default: 5)
+            cache_dir: Directory for remembering uploaded image UUIDs across
+                runs (default: None, in-memory only)
+            compress_requests: Gzip large request bodies (as in RunwareClient)
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')  # Remove trailing slash
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        self.max_concurrency = max_concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Status checks waiting for the next shared getResponse request
+        self._status_waiters: Dict[str, List[asyncio.Future]] = {}
+        self._status_flush: Optional[asyncio.Task] = None
+        
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._upload_cache: Dict[str, str] = {}
+        self._completed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.compress_requests = compress_requests
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use (needs a running loop)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> "AsyncRunwareClient":
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    async def _post(
+        self,
+        payload: List[Dict[str, Any]],
+        timeout: Tuple[float, float],
+        error_prefix: str
+    ) -> Dict[str, Any]:
+        """
+        POST a task array to the API (as in RunwareClient._post).
+        
+        Args:
+            payload: Task array
+            timeout: (connect, read) timeout in seconds, usually from TIMEOUTS
+            error_prefix: Start of the exception message if the request fails
+            
+        Returns:
+            Decoded JSON response
+            
+        Raises:
+            Exception: If the request fails or the response is not JSON
+        """
+        compress = self.compress_requests
+        try:
+            while True:
+                body, headers = _request_body(payload, self.headers, compress)
+                async with self._get_session().post(
+                    self.base_url,
+                    headers=headers,
+                    data=body,
+                    timeout=aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+                ) as response:
+                    raw = await response.read()
+                    status = response.status
+                
+                # The API does not take compressed bodies: stop compressing, resend
+                if status != 415 or "Content-Encoding" not in headers:
+                    break
+                logger.warning("Runware API rejected a gzip request body, sending uncompressed")
+                self.compress_requests = compress = False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"{error_prefix}: {str(e)}")
+        
+        try:
+            body = _json_loads(raw)
+        except ValueError:
+            body = raw.decode("utf-8", errors="replace")
+        
+        if status >= 400:
+            logger.error("%s: HTTP %s %s", error_prefix, status, body)
+            logger.debug("Request payload: %s", payload)
+            raise Exception(f"{error_prefix}: HTTP {status} {body}")
+        if not isinstance(body, dict):
+            raise Exception(f"{error_prefix}: unexpected response {body!r}")
+        
+        return body
+    
+    async def generate_image(
+        self,
+        prompt: str,
+        model: str = "bfl:2@1",
+        width: int = 1024,
+        height: int = 1024,
+        num_images: int = 1,
+        reference_images: Optional[List[str]] = None,
+        negative_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate image using Runware API.
+        
+        Args:
+            (same as RunwareClient.generate_image)
+            
+        Returns:
+            Dictionary with image generation result including taskUUID
+        """
+        payload = [_image_task(
+            prompt, model, width, height, num_images, reference_images, negative_prompt, **kwargs
+        )]
+        
+        result = await self._post(payload, timeout=TIMEOUTS["image"], error_prefix="Runware image generation failed")
+        
+        image_result = _image_result(result, payload[0]["taskUUID"])
+        if image_result["status"] == "completed":
+            _remember_completed(self._completed, image_result)
+        return image_result
+    
+    async def generate_video(
+        self,
+        prompt: str,
+        model: str = "klingai:6@1",
+        duration: int = 5,
+        width: int = 1920,
+        height: int = 1080,
+        image_uuid: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate video using Runware API.
+        
+        Args:
+            (same as RunwareClient.generate_video)
+            
+        Returns:
+            Dictionary with video generation result including taskUUID
+        """
+        payload = [_video_task(prompt, model, duration, width, height, image_uuid, **kwargs)]
+        
+        result = await self._post(
+            payload,
+            timeout=TIMEOUTS["video"],
+            error_prefix="Runware video generation failed"
+        )
+        
+        return _video_result(result, payload[0]["taskUUID"])
+    
+    async def check_task_status(self, task_uuid: str) -> Dict[str, Any]:
+        """
+        Check status of a generation task.
+        
+        Checks issued by concurrent waits within STATUS_BATCH_WINDOW seconds
+        share one getResponse request, so N tasks polled side by side cost
+        one request (and one pooled connection) instead of N.
+        
+        Args:
+            task_uuid: Task UUID from generation request
+            
+        Returns:
+            Dictionary with task status
+        """
+        if task_uuid in self._completed:
+            return self._completed[task_uuid]
+        
+        future = asyncio.get_running_loop().create_future()
+        self._status_waiters.setdefault(task_uuid, []).append(future)
+        if self._status_flush is None:
+            self._status_flush = asyncio.create_task(self._flush_status_checks())
+        
+        return await future
+    
+    async def _flush_status_checks(self) -> None:
+        """Send the collected status checks as one request and resolve their waiters."""
+        await asyncio.sleep(STATUS_BATCH_WINDOW)
+        
+        # Checks arriving from now on go into the next request
+        waiters, self._status_waiters = self._status_waiters, {}
+        self._status_flush = None
+        
+        # One getResponse task per UUID, all in one payload array
+        task_uuids = list(waiters)
         payload = [
-            {
-                "taskType": "imageUpload",
-                "taskUUID": task_uuid,
-                "image": image_b64
-            }
+            {"taskType": "getResponse", "taskUUID": task_uuid}
+            for task_uuid in task_uuids
         ]
         
+        error = None
         try:
-            response = requests.post(
-                self.base_url,
-                headers=self.headers,
-                json=payload,
-                timeout=60
+            result = await self._post(
+                payload,
+                timeout=_batch_timeout("status", len(payload)),
+                error_prefix="Failed to check task status"
             )
+        except Exception as e:  # Every waiter must be resolved, whatever failed
+            error = e
+        
+        statuses = _task_status_results(result, task_uuids) if error is None else {}
+        for task_uuid, futures in waiters.items():
+            for future in futures:
+                if future.done():
+                    continue  # The waiting coroutine was cancelled
+                if error is None:
+                    future.set_result(statuses[task_uuid])
+                else:
+                    future.set_exception(Exception(str(error)))
+    
+    async def wait_for_completion(
+        self,
+        task_uuid: str,
+        poll_interval: int = 5,
+        max_wait: int = 600,
+        max_interval: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Wait for a task to complete without blocking the event loop.
+        
+        Args:
+            (same as RunwareClient.wait_for_completion)
             
-            if not response.ok:
-                error_detail = "Unknown error"
-                try:
-                    error_detail = response.json()
-                except:
-                    error_detail = response.text
-                print(f"❌ Runware Image Upload Error: {error_detail}")
+        Returns:
+            Dictionary with completed task result including URLs
+        """
+        if task_uuid in self._completed:
+            return self._completed[task_uuid]
+        
+        start_time = time.monotonic()
+        last_status = None
+        same_state_polls = 0
+        failures = 0
+        
+        while True:
+            try:
+                status_result = await self.check_task_status(task_uuid)
+            except Exception as e:
+                # A failed status request says nothing about the task itself,
+                # so back off and ask again instead of abandoning the wait
+                failures += 1
+                if failures > STATUS_CHECK_RETRIES or time.monotonic() - start_time > max_wait:
+                    raise
+                logger.warning(
+                    "Status check failed (%d/%d), retrying: %s", failures, STATUS_CHECK_RETRIES, e
+                )
+                await asyncio.sleep(_status_retry_delay(failures))
+                continue
+            failures = 0
             
-            response.raise_for_status()
-            result = response.json()
+            task_status, result = _completion_state(status_result, task_uuid)
+            if result is not None:
+                return _remember_completed(self._completed, result)
             
-            # Extract imageUUID from response
-            data_list = result.get("data") or result.get("results") or []
-            if not data_list or "imageUUID" not in data_list[0]:
-                raise Exception(f"Unexpected upload response: {result}")
+            elapsed = time.monotonic() - start_time
+            if elapsed > max_wait:
+                raise Exception(f"Task timeout after {max_wait} seconds")
             
-            image_uuid = data_list[0]["imageUUID"]
+            # Back off while the state stays the same, start over when it changes
+            if task_status == last_status:
+                same_state_polls += 1
+            else:
+                last_status = task_status
+                same_state_polls = 0
             
-            # Verify the image UUID is valid (check if we can access it)
-            # Sometimes Runware needs a moment to process the uploaded image
-            import time
-            time.sleep(0.5)  # Small delay to ensure image is registered
+            logger.debug("Poll status=%s elapsed=%ds/%ds", task_status, int(elapsed), max_wait)
+            await asyncio.sleep(_poll_delay(poll_interval, max_interval, same_state_polls))
+    
+    async def generate_images_batch(
+        self,
+        prompts: List[str],
+        **kwargs
+    ) -> List[Any]:
+        """
+        Generate one image per prompt concurrently, at most max_concurrency at a time.
+        
+        Each generation is polled to completion if the image is not ready
+        immediately.
+        
+        Args:
+            prompts: Image generation prompts
+            **kwargs: Additional arguments for generate_image
             
-            return image_uuid
+        Returns:
+            Completed results in prompt order; a failed prompt yields its exception
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def generate(prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self.generate_image(prompt, **kwargs)
+                if result.get("status") != "completed":
+                    result = await self.wait_for_completion(
+                        result["taskUUID"], poll_interval=3, max_wait=300
+                    )
+                return result
+        
+        return list(await asyncio.gather(
+            *(generate(prompt) for prompt in prompts),
+            return_exceptions=True
+        ))
+    
+    async def upload_image(self, image_path: str) -> str:
+        """
+        Upload an image to Runware and return its UUID (cached by file contents).
+        
+        Args:
+            image_path: Path to local image file, or public image URL
             
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to upload image: {str(e)}")
+        Returns:
+            Image UUID from Runware
+        """
+        # Hashing, reading and base64-encoding a large image is blocking work
+        digest = await asyncio.to_thread(_upload_digest, image_path)
+        cached = self._upload_cache.get(digest) or _load_upload_uuid(self._cache_dir, digest)
+        if cached:
+            self._upload_cache[digest] = cached
+            return cached
+        
+        payload = [await asyncio.to_thread(_upload_task, image_path)]
+        
+        result = await self._post(payload, timeout=TIMEOUTS["upload"], error_prefix="Failed to upload image")
+        
+        image_uuid = _uploaded_image_uuid(result)
+        
+        # Sometimes Runware needs a moment to process the uploaded image
+        await asyncio.sleep(0.5)
+        
+        self._upload_cache[digest] = image_uuid
+        _store_upload_uuid(self._cache_dir, digest, image_uuid)
+        return image_uuid
     
-    def download_file(self, url: str, save_path: str) -> str:
+    async def download_file(self, url: str, save_path: str) -> str:
         """
-        Download a file from URL.
+        Download a file from URL, streaming it to disk.
         
         Args:
             url: URL to download from
@@ -508,15 +1587,21 @@ class RunwareClient:
             Path to saved file
         """
         try:
-            response = requests.get(url, timeout=120, stream=True)
-            response.raise_for_status()
-            
-            Path(save_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            async with self._get_session().get(
+                url,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=TIMEOUTS["download"][0],
+                    sock_read=TIMEOUTS["download"][1]
+                )
+            ) as response:
+                response.raise_for_status()
+                
+                Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+                
+                async with aiofiles.open(save_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
             
             return save_path
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             raise Exception(f"Failed to download file: {str(e)}")
@@ -1,18 +1,24 @@
 # Runware Prompt Engineering Module
+#
+# Submodules are imported on first attribute access (PEP 562), so importing
+# e.g. src.prompts.prompt_generator does not load OpenAI, PIL and requests
+# through image_prompts unless those functions are actually used.
 
-from .image_prompts import (
-    generate_runware_image_prompts,
-    analyze_product_image,
-    analyze_logo
-)
-from .video_prompts import generate_runware_video_scenes
-from .quality_assurance import (
-    validate_image_prompts,
-    validate_video_scenes,
-    generate_quality_report,
-    check_image_prompt_quality,
-    check_video_scene_quality
-)
+import importlib
+from typing import Any, List
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "generate_runware_image_prompts": "image_prompts",
+    "analyze_product_image": "image_prompts",
+    "analyze_logo": "image_prompts",
+    "generate_runware_video_scenes": "video_prompts",
+    "validate_image_prompts": "quality_assurance",
+    "validate_video_scenes": "quality_assurance",
+    "generate_quality_report": "quality_assurance",
+    "check_image_prompt_quality": "quality_assurance",
+    "check_video_scene_quality": "quality_assurance",
+}
 
 __all__ = [
     "generate_runware_image_prompts",
@@ -24,4 +30,19 @@ __all__ = [
     "generate_quality_report",
     "check_image_prompt_quality",
     "check_video_scene_quality",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public function from its submodule on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
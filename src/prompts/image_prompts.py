@@ -3,17 +3,60 @@ Generate Runware.ai optimized image prompts using OpenAI.
 """
 
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple, Union
 from openai import OpenAI
-from PIL import Image
+from PIL import Image, ImageOps
 import base64
+import hashlib
 import io
+import json
+import mmap
 import requests
+import threading
+import uuid
 from urllib.parse import urlparse
 
 from .system_prompts import IMAGE_GENERATION_SYSTEM_PROMPT
 
 
+# Vision model used for product and logo analyses
+ANALYSIS_MODEL = "gpt-4o"
+
+# Images are downscaled to this long edge before analysis: the model works on
+# a reduced copy anyway, so larger uploads only cost bandwidth and latency
+ANALYSIS_MAX_SIDE = 1024
+ANALYSIS_JPEG_QUALITY = 85
+ANALYSIS_DETAIL = "high"
+
+PRODUCT_ANALYSIS_PROMPT = """Analyze this product image in detail. Describe:
+1. Colors: What are the primary and secondary colors?
+2. Materials: What materials are visible (metal, plastic, fabric, glass, etc.)?
+3. Style: What is the design style (minimalist, modern, classic, etc.)?
+4. Size: What is the approximate size/scale?
+5. Key Features: What are the distinctive features or design elements?
+6. Existing Branding: Are there any logos or branding visible?
+7. Unique Selling Points: What makes this product visually attractive or unique?
+
+Provide a comprehensive analysis that will help generate professional product photography prompts."""
+
+LOGO_ANALYSIS_PROMPT = """Analyze this logo image. Describe:
+1. Colors: What are the logo colors?
+2. Style: What is the design style (minimalist, bold, elegant, etc.)?
+3. Shape: What is the shape/format (circular, rectangular, wordmark, etc.)?
+4. Design Elements: Any distinctive design elements or symbols?
+5. Placement Strategy: How could this logo be naturally integrated into product photography (packaging, signage, display, etc.)?
+
+Provide a concise analysis for logo integration in product images."""
+
+# Analyses kept in memory per process (oldest evicted first)
+ANALYSIS_CACHE_SIZE = 128
+_analysis_cache: "OrderedDict[str, str]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()  # Product and logo analyses run in parallel
+
+
 def _is_url(path_or_url: str) -> bool:
     """Check if the input is a URL."""
     try:
@@ -23,42 +66,212 @@ def _is_url(path_or_url: str) -> bool:
         return False
 
 
-def _load_image_data(path_or_url: str) -> Tuple[str, str]:
+def _file_sha256(path: str) -> str:
     """
-    Load image data from either a local file path or URL.
+    SHA-256 of a file, hashed in chunks without loading it into memory.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        sha = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+        return sha.hexdigest()
+
+
+def _load_image_source(path_or_url: str) -> Tuple[Union[bytes, str], str]:
+    """
+    Resolve an image to something _encode_image_data can read, plus its digest.
+    
+    URLs are downloaded; local files are only hashed here and read again
+    if the analysis is not cached, so a cache hit never loads the image.
     
     Args:
         path_or_url: Local file path or URL to image
         
     Returns:
-        Tuple of (base64_encoded_data, mime_type)
+        Tuple of (image bytes for URLs or the local path, SHA-256 hex digest)
     """
     if _is_url(path_or_url):
         # Load from URL
         response = requests.get(path_or_url, timeout=30)
         response.raise_for_status()
-        image_data = base64.b64encode(response.content).decode('utf-8')
+        return response.content, hashlib.sha256(response.content).hexdigest()
+    
+    return path_or_url, _file_sha256(path_or_url)
+
+
+def _encode_image_data(image: Union[bytes, str]) -> Tuple[str, str]:
+    """
+    Base64-encode an image for a data URL, downscaling large images.
+    
+    Images larger than ANALYSIS_MAX_SIDE on the long edge are resized and
+    re-encoded as JPEG (PNG when they have transparency, so logos keep
+    their alpha). Smaller images are sent unchanged.
+    
+    Args:
+        image: Image file contents, or path to a local image file
         
-        # Determine format from URL or content
-        img = Image.open(io.BytesIO(response.content))
-        image_format = img.format.lower() if img.format else 'png'
-        mime_type = f"image/{image_format}"
+    Returns:
+        Tuple of (base64_encoded_data, mime_type)
+    """
+    # Determine image format (Image.open only parses the header here; pixels
+    # are decoded only if the image has to be resized)
+    img = Image.open(io.BytesIO(image) if isinstance(image, bytes) else image)
+    image_format = img.format.lower() if img.format else 'png'
+    mime_type = f"image/{image_format}"
+    
+    if max(img.size) > ANALYSIS_MAX_SIDE:
+        # Re-encoding drops the EXIF orientation tag, so rotate the pixels
+        # upright first (phone photos are often stored sideways)
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((ANALYSIS_MAX_SIDE, ANALYSIS_MAX_SIDE), Image.LANCZOS)
+        buffer = io.BytesIO()
+        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+            img.save(buffer, "PNG", optimize=True)
+            mime_type = "image/png"
+        else:
+            img.convert("RGB").save(buffer, "JPEG", quality=ANALYSIS_JPEG_QUALITY, optimize=True)
+            mime_type = "image/jpeg"
+        raw = buffer.getvalue()
+    elif isinstance(image, bytes):
+        raw = image
     else:
-        # Load from local file
-        with open(path_or_url, "rb") as image_file:
-            image_data = base64.b64encode(image_file.read()).decode('utf-8')
-        
-        # Determine image format
-        img = Image.open(path_or_url)
-        image_format = img.format.lower() if img.format else 'png'
-        mime_type = f"image/{image_format}"
+        # Encode the unchanged local file straight from a memory map,
+        # without first copying it into a bytes object
+        with open(image, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return base64.b64encode(mapped).decode('ascii'), mime_type
+    
+    image_data = base64.b64encode(raw).decode('utf-8')
     
     return image_data, mime_type
 
 
+def _analysis_cache_key(image_digest: str, prompt: str, max_tokens: int) -> str:
+    """
+    Cache key for a Vision analysis: the image contents and the exact request.
+    
+    The prompt text and model are part of the key, so editing a prompt
+    invalidates old analyses without a version number to bump.
+    
+    Args:
+        image_digest: SHA-256 hex digest of the image file
+        prompt: Analysis prompt
+        max_tokens: Response token limit
+        
+    Returns:
+        Hex digest
+    """
+    request = json.dumps({
+        "model": ANALYSIS_MODEL,
+        "prompt": prompt,
+        "max_tokens": max_tokens,
+        "max_side": ANALYSIS_MAX_SIDE,
+        "detail": ANALYSIS_DETAIL
+    })
+    key = hashlib.sha256(request.encode("utf-8"))
+    key.update(bytes.fromhex(image_digest))
+    return key.hexdigest()
+
+
+def _analyze_image(
+    client: OpenAI,
+    path_or_url: str,
+    prompt: str,
+    max_tokens: int,
+    cache_dir: Optional[str] = None
+) -> str:
+    """
+    Run a Vision analysis of an image, reusing earlier results for the same image.
+    
+    Results are cached in memory and, with a cache_dir, on disk, keyed by
+    the SHA-256 of the image bytes and the request, so repeat runs for the
+    same product skip the Vision call (and its image tokens) entirely.
+    
+    Args:
+        client: OpenAI client instance
+        path_or_url: Path to image file or URL
+        prompt: Analysis prompt
+        max_tokens: Response token limit
+        cache_dir: Optional directory for persisting analyses across runs
+        
+    Returns:
+        Analysis text
+    """
+    image, image_digest = _load_image_source(path_or_url)
+    key = _analysis_cache_key(image_digest, prompt, max_tokens)
+    
+    with _analysis_cache_lock:
+        if key in _analysis_cache:
+            _analysis_cache.move_to_end(key)
+            return _analysis_cache[key]
+    
+    cache_path = Path(cache_dir).expanduser() / f"{key}.json" if cache_dir else None
+    analysis = None
+    if cache_path is not None:
+        try:
+            analysis = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            analysis = None
+    
+    if analysis is None:
+        image_data, mime_type = _encode_image_data(image)
+        
+        response = client.chat.completions.create(
+            model=ANALYSIS_MODEL,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": prompt
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:{mime_type};base64,{image_data}",
+                                "detail": ANALYSIS_DETAIL
+                            }
+                        }
+                    ]
+                }
+            ],
+            max_tokens=max_tokens
+        )
+        analysis = response.choices[0].message.content
+        
+        if cache_path is not None and analysis:
+            # Unique temp name so concurrent writers of the same key never
+            # share (or os.replace) a partially written file
+            temp_path = cache_path.with_name(f"{cache_path.stem}.{uuid.uuid4().hex}.tmp")
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path.write_text(json.dumps(analysis), encoding="utf-8")
+                temp_path.replace(cache_path)
+            except OSError as e:
+                print(f"⚠️  Could not write analysis cache entry: {e}")
+    
+    if analysis:
+        with _analysis_cache_lock:
+            _analysis_cache[key] = analysis
+            while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
+    
+    return analysis
+
+
 def analyze_product_image(
     client: OpenAI,
-    product_image_path: str
+    product_image_path: str,
+    cache_dir: Optional[str] = None
 ) -> str:
     """
     Analyze product image using OpenAI Vision API.
@@ -66,50 +279,18 @@ def analyze_product_image(
     Args:
         client: OpenAI client instance
         product_image_path: Path to product image file or URL
+        cache_dir: Optional directory for caching analyses across runs
         
     Returns:
         String description of product image characteristics
     """
-    # Load image data (from file or URL)
-    image_data, mime_type = _load_image_data(product_image_path)
-    
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": """Analyze this product image in detail. Describe:
-1. Colors: What are the primary and secondary colors?
-2. Materials: What materials are visible (metal, plastic, fabric, glass, etc.)?
-3. Style: What is the design style (minimalist, modern, classic, etc.)?
-4. Size: What is the approximate size/scale?
-5. Key Features: What are the distinctive features or design elements?
-6. Existing Branding: Are there any logos or branding visible?
-7. Unique Selling Points: What makes this product visually attractive or unique?
-
-Provide a comprehensive analysis that will help generate professional product photography prompts."""
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:{mime_type};base64,{image_data}"
-                        }
-                    }
-                ]
-            }
-        ],
-        max_tokens=500
-    )
-    
-    return response.choices[0].message.content
+    return _analyze_image(client, product_image_path, PRODUCT_ANALYSIS_PROMPT, 500, cache_dir)
 
 
 def analyze_logo(
     client: OpenAI,
-    logo_path: Optional[str]
+    logo_path: Optional[str],
+    cache_dir: Optional[str] = None
 ) -> Optional[str]:
     """
     Analyze logo image using OpenAI Vision API if provided.
@@ -117,6 +298,7 @@ def analyze_logo(
     Args:
         client: OpenAI client instance
         logo_path: Path to logo image file or URL (optional)
+        cache_dir: Optional directory for caching analyses across runs
         
     Returns:
         String description of logo characteristics or None
@@ -124,39 +306,7 @@ def analyze_logo(
     if not logo_path:
         return None
     
-    # Load image data (from file or URL)
-    image_data, mime_type = _load_image_data(logo_path)
-    
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": """Analyze this logo image. Describe:
-1. Colors: What are the logo colors?
-2. Style: What is the design style (minimalist, bold, elegant, etc.)?
-3. Shape: What is the shape/format (circular, rectangular, wordmark, etc.)?
-4. Design Elements: Any distinctive design elements or symbols?
-5. Placement Strategy: How could this logo be naturally integrated into product photography (packaging, signage, display, etc.)?
-
-Provide a concise analysis for logo integration in product images."""
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:{mime_type};base64,{image_data}"
-                        }
-                    }
-                ]
-            }
-        ],
-        max_tokens=300
-    )
-    
-    return response.choices[0].message.content
+    return _analyze_image(client, logo_path, LOGO_ANALYSIS_PROMPT, 300, cache_dir)
 
 
 def build_image_generation_user_prompt(
@@ -319,7 +469,8 @@ def generate_runware_image_prompts(
     product_data: Dict[str, Any],
     scene_description: str,
     product_image_path: str,
-    logo_path: Optional[str] = None
+    logo_path: Optional[str] = None,
+    cache_dir: Optional[str] = None
 ) -> List[Dict[str, str]]:
     """
     Generate Runware.ai optimized image prompts using OpenAI.
@@ -330,15 +481,23 @@ def generate_runware_image_prompts(
         scene_description: User-provided visual style description
         product_image_path: Path to product image file or URL
         logo_path: Optional path to logo image file or URL
+        cache_dir: Optional directory for caching image analyses across runs
         
     Returns:
         List of dictionaries with use_case, runware_prompt, and logo_integration
     """
-    # Step 1: Analyze product image
-    product_image_analysis = analyze_product_image(client, product_image_path)
-    
-    # Step 2: Analyze logo if provided
-    logo_analysis = analyze_logo(client, logo_path) if logo_path else None
+    # Step 1 + 2: Analyze product image and logo (if provided). Both are
+    # independent multi-second Vision calls, so they run side by side; the
+    # OpenAI client is safe to share between threads
+    if logo_path:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            product_future = executor.submit(analyze_product_image, client, product_image_path, cache_dir)
+            logo_future = executor.submit(analyze_logo, client, logo_path, cache_dir)
+            product_image_analysis = product_future.result()
+            logo_analysis = logo_future.result()
+    else:
+        product_image_analysis = analyze_product_image(client, product_image_path, cache_dir)
+        logo_analysis = None
     
     # Step 3: Build user prompt
     user_prompt = build_image_generation_user_prompt(
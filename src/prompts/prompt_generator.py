@@ -16,14 +16,17 @@ class RunwarePromptGenerator:
     Main class for generating Runware.ai optimized prompts.
     """
     
-    def __init__(self, openai_api_key: str):
+    def __init__(self, openai_api_key: str, cache_dir: Optional[str] = None):
         """
         Initialize the prompt generator.
         
         Args:
             openai_api_key: OpenAI API key
+            cache_dir: Optional directory for caching product/logo image
+                analyses across runs (default: None, in-memory only)
         """
         self.client = OpenAI(api_key=openai_api_key)
+        self.cache_dir = cache_dir
     
     def generate_image_prompts(
         self,
@@ -51,7 +54,8 @@ class RunwarePromptGenerator:
             product_data=product_data,
             scene_description=scene_description,
             product_image_path=product_image_path,
-            logo_path=logo_path
+            logo_path=logo_path,
+            cache_dir=self.cache_dir
         )
         
         result = {